@@ -10,12 +10,19 @@ __version__ = '0.3.0'
 from autobox.toolbox import Toolbox
 from autobox.toolset import Toolset
 from autobox.script import ScriptTool, ExecutionScript, ValidationScript
-from autobox.type import ToolAttributes
+from autobox.type import ToolAttributes, ToolMetadata
+from autobox.compare import diff
+from autobox.combine import merge
+from autobox.compress import repack
+from autobox.directory import pack
+from autobox.diagnostic import collect
+from autobox.type import Diagnostic
 
 
 __all__ = [
     'Toolbox', 'Toolset',  'ScriptTool', 'ExecutionScript',
-    'ValidationScript', 'ToolAttributes',
+    'ValidationScript', 'ToolAttributes', 'ToolMetadata', 'diff', 'merge',
+    'pack', 'repack', 'collect', 'Diagnostic',
 ]
 
 
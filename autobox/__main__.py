@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+"""
+Module Entry Point
+"""
+
+
+from autobox.cli import main
+
+
+if __name__ == '__main__':  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+Archive Utilities
+"""
+
+
+from os import replace
+from pathlib import Path
+from tempfile import mkstemp
+from typing import Iterable
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
+
+
+_LOCAL_HEADER_SIZE: int = 30
+_DATA_DESCRIPTOR_FLAG: int = 0x08
+
+
+def read_raw(zin: ZipFile, info: ZipInfo) -> bytes:
+    """
+    Read the compressed bytes of a member without inflating them.
+    """
+    zin.fp.seek(info.header_offset)
+    header = zin.fp.read(_LOCAL_HEADER_SIZE)
+    name_length = int.from_bytes(header[26:28], byteorder='little')
+    extra_length = int.from_bytes(header[28:30], byteorder='little')
+    zin.fp.seek(info.header_offset + _LOCAL_HEADER_SIZE +
+                name_length + extra_length)
+    return zin.fp.read(info.compress_size)
+# End read_raw function
+
+
+def _make_info(info: ZipInfo) -> ZipInfo:
+    """
+    Make a copy of the member information suitable for a new archive
+    """
+    target = ZipInfo(filename=info.filename, date_time=info.date_time)
+    target.compress_type = info.compress_type
+    target.create_system = info.create_system
+    target.create_version = info.create_version
+    target.extract_version = info.extract_version
+    target.external_attr = info.external_attr
+    target.flag_bits = info.flag_bits & ~_DATA_DESCRIPTOR_FLAG
+    return target
+# End _make_info function
+
+
+def write_raw(zout: ZipFile, info: ZipInfo, data: bytes,
+              compress_type: int | None = None) -> None:
+    """
+    Write already compressed bytes as a member, the member information
+    supplies the name, CRC, and uncompressed size.
+    """
+    target = _make_info(info)
+    if compress_type is not None:
+        target.compress_type = compress_type
+    target.CRC = info.CRC
+    target.compress_size = len(data)
+    target.file_size = info.file_size
+    zip64 = max(target.file_size, target.compress_size) > 0x7FFFFFFF
+    fp = zout.fp
+    fp.seek(zout.start_dir)
+    target.header_offset = fp.tell()
+    fp.write(target.FileHeader(zip64))
+    fp.write(data)
+    zout.start_dir = fp.tell()
+    zout.filelist.append(target)
+    zout.NameToInfo[target.filename] = target
+    # noinspection PyProtectedMember
+    zout._didModify = True
+# End write_raw function
+
+
+def copy_member(zin: ZipFile, zout: ZipFile, info: ZipInfo) -> None:
+    """
+    Copy a member from one archive to another as-is, the compressed bytes
+    are copied so the member is neither inflated nor compressed again.
+    """
+    write_raw(zout, info, read_raw(zin, info))
+# End copy_member function
+
+
+def make_sibling_path(path: Path) -> Path:
+    """
+    Make a temporary file alongside the path, used to swap in a new archive
+    atomically once it has been written.
+    """
+    handle, name = mkstemp(
+        prefix=f'.{path.stem}.', suffix=path.suffix, dir=path.parent)
+    with open(handle, mode='wb'):
+        pass
+    return Path(name)
+# End make_sibling_path function
+
+
+def patch_archive(path: Path, members: dict[str, bytes],
+                  prefixes: Iterable[str] = ()) -> Path:
+    """
+    Patch Archive, members with names starting with any of the prefixes are
+    dropped, members are written (added or replaced), and all other members
+    are copied raw.  The patched archive replaces the original atomically.
+    """
+    prefixes = tuple(prefixes)
+    temporary = make_sibling_path(path)
+    try:
+        with ZipFile(path) as zin, ZipFile(
+                temporary, mode='w', compression=ZIP_DEFLATED) as zout:
+            for info in zin.infolist():
+                name = info.filename
+                if name in members or (prefixes and name.startswith(prefixes)):
+                    continue
+                copy_member(zin, zout, info)
+            for name, data in members.items():
+                zout.writestr(name, data)
+        replace(temporary, path)
+    finally:
+        temporary.unlink(missing_ok=True)
+    return path
+# End patch_archive function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
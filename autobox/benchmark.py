@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark Suite
+"""
+
+
+from contextlib import contextmanager
+from pathlib import Path
+from shutil import rmtree
+from statistics import fmean
+from time import perf_counter
+from typing import Any, Callable, ContextManager, Generator, Iterable, NoReturn
+
+from autobox.enum import GeometryType
+from autobox.filter import (
+    FeatureClassTypeFilter, LongRangeFilter, StringValueFilter)
+from autobox.parameter import (
+    FeatureClassParameter, FileParameter, LongParameter, StringParameter)
+from autobox.reader import ToolboxReader
+from autobox.script import ScriptTool
+from autobox.toolbox import Toolbox
+from autobox.toolset import Toolset
+from autobox.type import BenchmarkResult, STRINGS
+from autobox.util import make_temp_folder, validate_parameter_names
+from autobox.writer import encode_json
+
+
+WORKLOAD = Callable[[], Any]
+FACTORY = Callable[[], ContextManager[WORKLOAD]]
+
+
+BENCHMARKS: dict[str, FACTORY] = {}
+
+
+def register(name: str) -> Callable[
+        [Callable[[], Generator[WORKLOAD, None, None]]], FACTORY]:
+    """
+    Register a benchmark, the decorated function is a generator which
+    performs setup, yields the workload to time, and then cleans up.
+    """
+    def decorator(func: Callable[[], Generator[WORKLOAD, None, None]]) \
+            -> FACTORY:
+        factory = contextmanager(func)
+        BENCHMARKS[name] = factory
+        return factory
+    return decorator
+# End register function
+
+
+def _make_tool(name: str, count: int) -> ScriptTool:
+    """
+    Make a Script Tool with a mix of parameter types
+    """
+    tool = ScriptTool(name=name, description='Benchmark Tool')
+    for i in range(count):
+        if i % 3 == 0:
+            param = FeatureClassParameter(
+                label=f'Features {i}', category='Input')
+            param.filter = FeatureClassTypeFilter(
+                [GeometryType.POINT, GeometryType.POLYGON])
+        elif i % 3 == 1:
+            param = LongParameter(
+                label=f'Count {i}', default_value=i, is_required=False)
+            param.filter = LongRangeFilter(0, 1000)
+        else:
+            param = StringParameter(
+                label=f'Text {i}', description='Some <b>text</b>',
+                is_multi=True, default_value=('a b', 'c', 'd e'))
+        tool.add_parameter(param)
+    return tool
+# End _make_tool function
+
+
+def _make_toolbox(tool_count: int, parameter_count: int) -> Toolbox:
+    """
+    Make a Toolbox with tools in the root and in a toolset
+    """
+    tbx = Toolbox(name='benchmark', label='Benchmark Toolbox')
+    toolset = Toolset(name='Benchmark Tools')
+    tbx.add_toolset(toolset)
+    for i in range(tool_count):
+        tool = _make_tool(name=f'Tool{i}', count=parameter_count)
+        if i % 2:
+            toolset.add_script_tool(tool)
+        else:
+            tbx.add_script_tool(tool)
+    return tbx
+# End _make_toolbox function
+
+
+@register('parameter_serialize')
+def _parameter_serialize() -> Generator[WORKLOAD, None, None]:
+    """
+    Serialize the parameters of a tool with 300 parameters
+    """
+    tool = _make_tool(name='Parameters', count=300)
+
+    def workload() -> None:
+        # noinspection PyProtectedMember
+        for parameter in tool._parameters:
+            parameter._cache = None
+        # noinspection PyProtectedMember
+        tool._build_parameters(target=Path.cwd())
+    yield workload
+# End _parameter_serialize function
+
+
+@register('tool_clone')
+def _tool_clone() -> Generator[WORKLOAD, None, None]:
+    """
+    Clone a tool of 30 parameters 200 times and build the content of each
+    """
+    template = _make_tool(name='Template', count=30)
+
+    def workload() -> None:
+        target = Path.cwd()
+        for i in range(200):
+            tool = template.clone(name=f'Tool{i}')
+            # noinspection PyProtectedMember
+            tool._get_cached_content(target)
+    yield workload
+# End _tool_clone function
+
+
+@register('multi_value_default')
+def _multi_value_default() -> Generator[WORKLOAD, None, None]:
+    """
+    Validate and serialize a multi value default of 50,000 paths
+    """
+    paths = [Path.home().joinpath(f'folder {i % 10}', f'file_{i:05d}.txt')
+             for i in range(50_000)]
+
+    def workload() -> None:
+        param = FileParameter(label='Files', is_multi=True)
+        param.default_value = paths
+        param.serialize({}, target=None)
+    yield workload
+# End _multi_value_default function
+
+
+@register('string_value_filter')
+def _string_value_filter() -> Generator[WORKLOAD, None, None]:
+    """
+    Build, serialize and encode a string value filter with 100,000 values
+    """
+    values = [f'VALUE-{i:06d}' for i in range(100_000)]
+
+    def workload() -> None:
+        param = StringParameter(label='Codes')
+        param.filter = StringValueFilter(values)
+        content, resource = param.serialize({}, target=None)
+        encode_json(content)
+        encode_json(resource)
+    yield workload
+# End _string_value_filter function
+
+
+@register('name_validation')
+def _name_validation() -> Generator[WORKLOAD, None, None]:
+    """
+    Validate 1,000,000 parameter names and find their collisions
+    """
+    names = [f' {i % 7}Field: Name /{i % 500_000:06d}  (x)*' for i in
+             range(1_000_000)]
+    yield lambda: validate_parameter_names(names)
+# End _name_validation function
+
+
+@register('toolbox_save')
+def _toolbox_save() -> Generator[WORKLOAD, None, None]:
+    """
+    Save a toolbox with 50 tools of 30 parameters each, the cached content
+    is cleared so each repeat builds the toolbox again
+    """
+    folder = make_temp_folder()
+    tbx = _make_toolbox(tool_count=50, parameter_count=30)
+    # noinspection PyProtectedMember
+    tools = tbx._gather_tools()
+
+    def workload() -> None:
+        for tool in tools:
+            tool._cache = None
+            # noinspection PyProtectedMember
+            for parameter in tool._parameters:
+                parameter._cache = None
+        tbx.save(folder, overwrite=True)
+    try:
+        yield workload
+    finally:
+        rmtree(folder)
+# End _toolbox_save function
+
+
+@register('toolbox_read')
+def _toolbox_read() -> Generator[WORKLOAD, None, None]:
+    """
+    Read the content of every tool from a saved toolbox
+    """
+    folder = make_temp_folder()
+    tbx = _make_toolbox(tool_count=50, parameter_count=30)
+    path = tbx.save(folder)
+
+    def workload() -> None:
+        with ToolboxReader(path) as reader:
+            for tool in reader.tools:
+                reader.read_tool(tool.name)
+    try:
+        yield workload
+    finally:
+        rmtree(folder)
+# End _toolbox_read function
+
+
+def run_benchmark(name: str, repeat: int = 5) -> BenchmarkResult | NoReturn:
+    """
+    Run a registered benchmark, setup and clean up are not timed.
+    """
+    if not (factory := BENCHMARKS.get(name)):
+        raise KeyError(f'Benchmark not found: {name}')
+    if repeat < 1:
+        raise ValueError(f'Invalid repeat value: {repeat}')
+    timings = []
+    with factory() as workload:
+        for _ in range(repeat):
+            start = perf_counter()
+            workload()
+            timings.append(perf_counter() - start)
+    return BenchmarkResult(
+        name=name, repeat=repeat, best=min(timings), mean=fmean(timings))
+# End run_benchmark function
+
+
+def run_benchmarks(names: STRINGS | None = None,
+                   repeat: int = 5) -> Iterable[BenchmarkResult]:
+    """
+    Run benchmarks, all registered benchmarks when no names are specified.
+    """
+    for name in (names or sorted(BENCHMARKS)):
+        yield run_benchmark(name, repeat=repeat)
+# End run_benchmarks function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+"""
+Catalog, a searchable index over a folder tree of toolboxes
+"""
+
+
+import sqlite3
+
+from pathlib import Path
+from typing import Any, Iterable, Self
+from zipfile import BadZipFile
+
+from autobox.constant import (
+    DOLLAR_RC, ParameterContentKeys, ScriptToolContentKeys,
+    ScriptToolContentResourceKeys)
+from autobox.filter import AbstractFilter, domain_keyword, filter_keyword
+from autobox.reader import ToolboxReader
+from autobox.type import CatalogEntry, RefreshResult, STRING
+from autobox.util import find_toolboxes, process_map
+
+
+__all__ = ['Catalog']
+
+
+KEYWORD = str | type | None
+RECORD = tuple[str, int, int, STRING, STRING, STRING, list[tuple]]
+
+
+_VERSION: int = 1
+_DROP: str = '''
+DROP TABLE IF EXISTS parameters;
+DROP TABLE IF EXISTS tools;
+DROP TABLE IF EXISTS toolboxes;
+'''
+_SCHEMA: str = '''
+CREATE TABLE IF NOT EXISTS toolboxes (
+    path TEXT PRIMARY KEY,
+    mtime INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    label TEXT,
+    alias TEXT,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS tools (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL REFERENCES toolboxes (path) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    label TEXT,
+    toolset TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS parameters (
+    tool INTEGER NOT NULL REFERENCES tools (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    label TEXT,
+    data_type TEXT,
+    is_multi INTEGER NOT NULL,
+    filter_type TEXT,
+    parameter_type TEXT,
+    direction TEXT
+);
+CREATE INDEX IF NOT EXISTS tools_path ON tools (path);
+CREATE INDEX IF NOT EXISTS parameters_tool ON parameters (tool);
+CREATE INDEX IF NOT EXISTS parameters_data_type ON parameters (data_type);
+CREATE INDEX IF NOT EXISTS parameters_filter_type ON parameters (filter_type);
+'''
+
+
+def _text(value: Any, mapping: dict[str, str]) -> STRING:
+    """
+    Text, resolves a resource reference ($rc:) using the resource mapping
+    """
+    if not isinstance(value, str):
+        return value
+    if value.startswith(DOLLAR_RC):
+        return mapping.get(value.removeprefix(DOLLAR_RC), value)
+    return value
+# End _text function
+
+
+def _extract_parameters(content: dict[str, Any],
+                        resource: dict[str, Any]) -> list[tuple]:
+    """
+    Extract parameter metadata from the content and resource of a tool
+    """
+    mapping = resource.get(ScriptToolContentResourceKeys.map, {})
+    parameters = []
+    params = content.get(ScriptToolContentKeys.parameters) or {}
+    for name, value in params.items():
+        data_type = value.get(ParameterContentKeys.data_type) or {}
+        inner = data_type.get(ParameterContentKeys.data_type)
+        is_multi = isinstance(inner, dict)
+        if is_multi:
+            data_type = inner
+        domain = value.get(ParameterContentKeys.domain) or {}
+        parameters.append((
+            name, _text(value.get(ParameterContentKeys.display_name), mapping),
+            data_type.get(ParameterContentKeys.type), is_multi,
+            domain_keyword(domain),
+            value.get(ParameterContentKeys.parameter_type),
+            value.get(ParameterContentKeys.direction)))
+    return parameters
+# End _extract_parameters function
+
+
+def _extract(path: str, mtime: int, size: int) -> RECORD:
+    """
+    Extract tool and parameter metadata from a toolbox, runs in a worker
+    process so only plain (picklable) values are returned.  A toolbox which
+    cannot be read is recorded with the error and no tools.
+    """
+    tools = []
+    try:
+        with ToolboxReader(Path(path)) as reader:
+            label, alias = reader.label, reader.alias
+            for tool in reader.tools:
+                content, resource = reader.read_tool(tool.name)
+                mapping = resource.get(ScriptToolContentResourceKeys.map, {})
+                tools.append((
+                    tool.name,
+                    _text(content.get(ScriptToolContentKeys.display_name),
+                          mapping),
+                    tool.toolset, _extract_parameters(content, resource)))
+    except (BadZipFile, KeyError, OSError, TypeError, ValueError) as err:
+        return path, mtime, size, None, None, str(err), []
+    return path, mtime, size, label, alias, None, tools
+# End _extract function
+
+
+def _scan(folders: Iterable[Path]) -> dict[str, tuple[int, int]]:
+    """
+    Scan folders for toolboxes, returns modification time and size by path
+    """
+    found = {}
+    for path in find_toolboxes(folders):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        found[str(path)] = stat.st_mtime_ns, stat.st_size
+    return found
+# End _scan function
+
+
+def _keyword(value: KEYWORD) -> STRING:
+    """
+    Keyword, parameter and filter classes are accepted in place of the
+    keyword stored in the toolbox (e.g. FeatureLayerParameter or
+    GPFeatureLayer), filter classes resolve to their domain keyword.
+    """
+    if not isinstance(value, type):
+        return value
+    if issubclass(value, AbstractFilter):
+        return filter_keyword(value)
+    return getattr(value, 'keyword', value.__name__)
+# End _keyword function
+
+
+class Catalog:
+    """
+    Catalog, a SQLite index of the tools and parameters of the toolboxes in
+    one or more folder trees.  Toolboxes are keyed on path, modification
+    time, and size so that a refresh only reads new or changed toolboxes.
+    """
+    def __init__(self, path: Path | str) -> None:
+        """
+        Initialize the Catalog class
+
+        :param path: Path to the SQLite index, created when missing,
+            use ':memory:' for an index that is not persisted.
+        """
+        super().__init__()
+        self._path: str = str(path)
+        self._connection: sqlite3.Connection = sqlite3.connect(self._path)
+        self._connection.execute('PRAGMA foreign_keys = ON')
+        version, = self._connection.execute('PRAGMA user_version').fetchone()
+        if version != _VERSION:
+            self._connection.executescript(_DROP)
+            self._connection.execute(f'PRAGMA user_version = {_VERSION}')
+        self._connection.executescript(_SCHEMA)
+    # End init built-in
+
+    def __repr__(self) -> str:
+        """
+        Class Representation
+        """
+        return f'{self.__class__.__name__}(path={self._path!r})'
+    # End repr built-in
+
+    def __enter__(self) -> Self:
+        """
+        Enter Context
+        """
+        return self
+    # End enter built-in
+
+    def __exit__(self, *_) -> None:
+        """
+        Exit Context
+        """
+        self.close()
+    # End exit built-in
+
+    def _store(self, records: Iterable[RECORD]) -> None:
+        """
+        Store records, replacing any existing entries for the toolboxes
+        """
+        cursor = self._connection.cursor()
+        for path, mtime, size, label, alias, error, tools in records:
+            cursor.execute('DELETE FROM toolboxes WHERE path = ?', (path,))
+            cursor.execute(
+                'INSERT INTO toolboxes VALUES (?, ?, ?, ?, ?, ?)',
+                (path, mtime, size, label, alias, error))
+            for name, tool_label, toolset, parameters in tools:
+                cursor.execute(
+                    'INSERT INTO tools (path, name, label, toolset) '
+                    'VALUES (?, ?, ?, ?)', (path, name, tool_label, toolset))
+                id_ = cursor.lastrowid
+                cursor.executemany(
+                    'INSERT INTO parameters VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    [(id_, i, *p) for i, p in enumerate(parameters)])
+    # End _store method
+
+    @property
+    def paths(self) -> list[str]:
+        """
+        Paths of the cataloged toolboxes
+        """
+        cursor = self._connection.execute(
+            'SELECT path FROM toolboxes ORDER BY path')
+        return [path for path, in cursor]
+    # End paths property
+
+    @property
+    def errors(self) -> dict[str, str]:
+        """
+        Errors by path, for toolboxes which could not be read
+        """
+        cursor = self._connection.execute(
+            'SELECT path, error FROM toolboxes WHERE error IS NOT NULL '
+            'ORDER BY path')
+        return dict(cursor)
+    # End errors property
+
+    def close(self) -> None:
+        """
+        Close the connection to the index
+        """
+        self._connection.close()
+    # End close method
+
+    def refresh(self, folders: Path | Iterable[Path],
+                jobs: int = 1) -> RefreshResult:
+        """
+        Refresh the catalog from the toolboxes found in the folders, only
+        new and changed toolboxes are read, toolboxes which no longer exist
+        in the folders are removed.
+
+        :param folders: Folder (or folders) to walk for toolboxes.
+        :param jobs: Number of worker processes used to read toolboxes.
+        """
+        if isinstance(folders, (str, Path)):
+            folders = [folders]
+        folders = [Path(f).resolve() for f in folders]
+        found = _scan(folders)
+        known = {path: (mtime, size) for path, mtime, size in
+                 self._connection.execute(
+                     'SELECT path, mtime, size FROM toolboxes')}
+        stale = [(p, *stat) for p, stat in found.items()
+                 if known.get(p) != stat]
+        removed = [p for p in known if p not in found and
+                   any(Path(p).is_relative_to(f) for f in folders)]
+        records = process_map(_extract, *zip(*stale), jobs=jobs)
+        with self._connection:
+            self._connection.executemany(
+                'DELETE FROM toolboxes WHERE path = ?', [(p,) for p in removed])
+            self._store(records)
+        updated = sum(1 for p, *_ in stale if p in known)
+        return RefreshResult(
+            added=len(stale) - updated, updated=updated, removed=len(removed),
+            unchanged=len(found) - len(stale),
+            failed=sum(1 for r in records if r[5] is not None))
+    # End refresh method
+
+    def query(self, data_type: KEYWORD = None, filter_type: KEYWORD = None,
+              tool: STRING = None, parameter: STRING = None,
+              is_multi: bool | None = None) -> list[CatalogEntry]:
+        """
+        Query the parameters in the catalog, all criteria are optional and
+        combined, names are matched regardless of case.
+
+        :param data_type: Parameter class or data type keyword,
+            e.g. FeatureLayerParameter or 'GPFeatureLayer'.
+        :param filter_type: Filter class or domain keyword,
+            e.g. FieldTypeFilter or 'GPFieldDomain', coded value domains
+            with typed items are keyed on the item type, e.g. 'GPLong'.
+        :param tool: Tool name.
+        :param parameter: Parameter name.
+        :param is_multi: Only multi value (True) or single value (False)
+            parameters.
+        """
+        conditions = []
+        values = []
+        for column, value in (('p.data_type', _keyword(data_type)),
+                              ('p.filter_type', _keyword(filter_type)),
+                              ('t.name', tool), ('p.name', parameter)):
+            if value is None:
+                continue
+            conditions.append(f'{column} = ? COLLATE NOCASE')
+            values.append(value)
+        if is_multi is not None:
+            conditions.append('p.is_multi = ?')
+            values.append(int(is_multi))
+        where = f'WHERE {" AND ".join(conditions)}' if conditions else ''
+        cursor = self._connection.execute(
+            f'SELECT t.path, t.name, t.toolset, p.name, p.label, p.data_type, '
+            f'p.is_multi, p.filter_type FROM parameters AS p '
+            f'JOIN tools AS t ON t.id = p.tool {where} '
+            f'ORDER BY t.path, t.name, p.position', values)
+        return [CatalogEntry(path, tool, toolset, name, label, data_type,
+                             bool(is_multi), filter_type)
+                for path, tool, toolset, name, label, data_type, is_multi,
+                filter_type in cursor]
+    # End query method
+
+    def find_tools(self, data_type: KEYWORD = None,
+                   filter_type: KEYWORD = None) -> list[tuple[str, str]]:
+        """
+        Find Tools which take a parameter of the data type and / or filter
+        type, returns the toolbox path and tool name.
+        """
+        entries = self.query(data_type=data_type, filter_type=filter_type)
+        return list(dict.fromkeys((e.path, e.tool) for e in entries))
+    # End find_tools method
+# End Catalog class
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
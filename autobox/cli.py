@@ -0,0 +1,735 @@
+# -*- coding: utf-8 -*-
+"""
+Command Line Interface
+"""
+
+
+import sys
+
+from argparse import ArgumentParser, Namespace
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import partial
+from importlib import import_module
+from importlib.util import (
+    find_spec, module_from_spec, spec_from_file_location)
+from json import dumps
+from pathlib import Path
+from time import perf_counter
+from types import ModuleType
+from typing import Any, Callable, Generator, Iterable, NoReturn, Sequence
+
+from autobox import filter as filters, parameter as parameters
+from autobox.benchmark import BENCHMARKS, run_benchmarks
+from autobox.catalog import Catalog
+from autobox.combine import merge
+from autobox.directory import pack
+from autobox.compress import CompressionPolicy, repack
+from autobox.compare import diff
+from autobox.constant import (
+    ARCHIVE, COLON, DIRECTORY, PY, ScriptToolContentKeys)
+from autobox.lint import lint
+from autobox.migrate import migrate
+from autobox.reader import ToolboxReader
+from autobox.toolbox import Toolbox
+from autobox.type import CHANGES, ChangeSet, ValidationResult
+from autobox.util import find_toolboxes, process_map
+from autobox.watch import Watcher
+from autobox.writer import MemoryWriter, ZipWriter
+
+
+TIMINGS = dict[str, float]
+
+
+LOAD: str = 'load'
+SERIALIZE: str = 'serialize'
+PACKAGE: str = 'package'
+READ: str = 'read'
+
+
+@contextmanager
+def _timed(timings: TIMINGS, phase: str) -> Generator[None, None, None]:
+    """
+    Accumulate the elapsed time of a phase
+    """
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = timings.get(phase, 0.) + perf_counter() - start
+# End _timed function
+
+
+def _split_spec(spec: str) -> tuple[str, str]:
+    """
+    Split Spec into module name (or file path) and attribute
+    """
+    if not spec.casefold().endswith(PY):
+        head, _, tail = spec.rpartition(COLON)
+        if len(head) > 1 and tail.isidentifier():
+            return head, tail
+    return spec, ''
+# End _split_spec function
+
+
+def _spec_file(spec: str) -> tuple[Path, str] | NoReturn:
+    """
+    Spec File, the python file behind a spec and the attribute
+    """
+    name, attribute = _split_spec(spec)
+    if (path := Path(name)).is_file():
+        return path, attribute
+    if not (found := find_spec(name)) or not found.origin:
+        raise ImportError(f'Module not found: {name}')
+    return Path(found.origin), attribute
+# End _spec_file function
+
+
+def _load_module(name: str) -> ModuleType:
+    """
+    Load Module from a file path or a dotted module name
+    """
+    path = Path(name)
+    if path.suffix.casefold() != PY and not path.is_file():
+        return import_module(name)
+    if not path.is_file():
+        raise FileNotFoundError(f'File not found: {path}')
+    spec = spec_from_file_location(path.stem, path)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+# End _load_module function
+
+
+def load_toolboxes(spec: str) -> list[Toolbox] | NoReturn:
+    """
+    Load Toolboxes from a spec, a module name or path to a python file with
+    an optional attribute, e.g. package.module:attribute or file.py:attribute.
+    The attribute can be a toolbox, an iterable of toolboxes, or a callable
+    returning either.  When no attribute is specified all module level
+    toolboxes are used.
+    """
+    name, attribute = _split_spec(spec)
+    module = _load_module(name)
+    if not attribute:
+        values = [v for v in vars(module).values() if isinstance(v, Toolbox)]
+    else:
+        value = getattr(module, attribute)
+        if callable(value) and not isinstance(value, Toolbox):
+            value = value()
+        if isinstance(value, Toolbox):
+            value = value,
+        values = [v for v in value if isinstance(v, Toolbox)]
+    if not values:
+        raise ValueError(f'No toolbox found in: {spec}')
+    return values
+# End load_toolboxes function
+
+
+def _save(toolbox: Toolbox, folder: Path, overwrite: bool,
+          timings: TIMINGS, layout: str = ARCHIVE) -> Path:
+    """
+    Save Toolbox, timing the serialize and package phases separately
+    """
+    if layout == DIRECTORY:
+        with _timed(timings, SERIALIZE):
+            return toolbox.save(folder, overwrite=overwrite, layout=layout)
+    # noinspection PyProtectedMember
+    path = toolbox._get_toolbox_path(folder=folder, overwrite=overwrite)
+    with _timed(timings, SERIALIZE):
+        memory = MemoryWriter()
+        # noinspection PyProtectedMember
+        toolbox._serialize(memory, target=folder)
+    with _timed(timings, PACKAGE):
+        with ZipWriter(path) as writer:
+            memory.write_to(writer)
+    return path
+# End _save function
+
+
+def _build(spec: str, folder: Path, overwrite: bool, layout: str = ARCHIVE) \
+        -> tuple[list[str], TIMINGS]:
+    """
+    Build the toolboxes for a spec
+    """
+    timings = {}
+    with _timed(timings, LOAD):
+        toolboxes = load_toolboxes(spec)
+    paths = [str(_save(tbx, folder=folder, overwrite=overwrite,
+                       timings=timings, layout=layout)) for tbx in toolboxes]
+    return paths, timings
+# End _build function
+
+
+def _validate(spec: str, folder: Path) \
+        -> tuple[list[tuple[str, ValidationResult]], TIMINGS]:
+    """
+    Validate the toolboxes for a spec, nothing is written
+    """
+    timings = {}
+    with _timed(timings, LOAD):
+        toolboxes = load_toolboxes(spec)
+    with _timed(timings, SERIALIZE):
+        results = [(tbx.name, tbx.validate(folder)) for tbx in toolboxes]
+    return results, timings
+# End _validate function
+
+
+def summarize(path: Path, parameters: bool = False) -> dict[str, Any]:
+    """
+    Summarize a toolbox, the content of each tool is only read when
+    parameters are requested.
+    """
+    with ToolboxReader(path) as reader:
+        toolsets = defaultdict(list)
+        for tool in reader.tools:
+            toolsets[tool.toolset].append(tool.name)
+        summary = {
+            'path': str(reader.path),
+            'label': reader.label,
+            'alias': reader.alias,
+            'tools': len(reader.tools),
+            'toolsets': dict(toolsets),
+        }
+        if parameters:
+            key = ScriptToolContentKeys.parameters
+            summary['parameters'] = {
+                tool.name: list(reader.read_tool(tool.name)[0].get(key) or {})
+                for tool in reader.tools}
+    return summary
+# End summarize function
+
+
+def _inspect(path: str, parameters: bool) -> tuple[dict[str, Any], TIMINGS]:
+    """
+    Inspect a toolbox
+    """
+    timings = {}
+    with _timed(timings, READ):
+        summary = summarize(Path(path), parameters=parameters)
+    return summary, timings
+# End _inspect function
+
+
+def _as_data(value: Any) -> Any:
+    """
+    Convert named tuples (recursively) into json friendly data
+    """
+    if hasattr(value, '_asdict'):
+        return {k: _as_data(v) for k, v in value._asdict().items()}
+    if isinstance(value, dict):
+        return {k: _as_data(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_as_data(v) for v in value]
+    return value
+# End _as_data function
+
+
+def _format_changes(changes: CHANGES, indent: str) -> list[str]:
+    """
+    Format Changes
+    """
+    return [f'{indent}{key}: {old!r} -> {new!r}'
+            for key, (old, new) in changes.items()]
+# End _format_changes function
+
+
+def format_changeset(changeset: ChangeSet) -> list[str]:
+    """
+    Format a change set as lines of text, tools are sorted by name and
+    prefixed with + (added), - (removed), or ~ (modified).
+    """
+    lines = _format_changes(changeset.changes, indent='')
+    tools = [(name, '+', None) for name in changeset.added_tools]
+    tools.extend((name, '-', None) for name in changeset.removed_tools)
+    tools.extend((t.name, '~', t) for t in changeset.modified_tools)
+    for name, symbol, change in sorted(tools, key=lambda x: x[0].casefold()):
+        lines.append(f'{symbol} {name}')
+        if change is None:
+            continue
+        lines.extend(_format_changes(change.changes, indent=' ' * 4))
+        lines.extend(f'    + {p}' for p in change.added_parameters)
+        lines.extend(f'    - {p}' for p in change.removed_parameters)
+        for parameter in change.modified_parameters:
+            lines.append(f'    ~ {parameter.name}')
+            lines.extend(_format_changes(parameter.changes, indent=' ' * 8))
+    return lines
+# End format_changeset function
+
+
+def _map(func: Callable, arguments: Iterable[tuple], jobs: int) -> list:
+    """
+    Map the function over the arguments, in parallel when jobs > 1
+    """
+    return process_map(func, *zip(*arguments), jobs=jobs)
+# End _map function
+
+
+def _merge_timings(timings: Iterable[TIMINGS]) -> TIMINGS:
+    """
+    Merge Timings
+    """
+    merged = {}
+    for timing in timings:
+        for phase, elapsed in timing.items():
+            merged[phase] = merged.get(phase, 0.) + elapsed
+    return merged
+# End _merge_timings function
+
+
+def _print_timings(timings: TIMINGS) -> None:
+    """
+    Print Timings to standard error
+    """
+    for phase, elapsed in timings.items():
+        print(f'{phase:<12}{elapsed:>12.6f}s', file=sys.stderr)
+    print(f'{"total":<12}{sum(timings.values()):>12.6f}s', file=sys.stderr)
+# End _print_timings function
+
+
+def _run_build(args: Namespace) -> int:
+    """
+    Run the build command
+    """
+    folder = Path(args.output)
+    if args.dry_run:
+        return _run_dry_run(args, folder=folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    results = _map(_build, ((spec, folder, args.overwrite, args.layout)
+                            for spec in args.specs), jobs=args.jobs)
+    for paths, _ in results:
+        for path in paths:
+            print(path)
+    if args.profile:
+        _print_timings(_merge_timings(t for _, t in results))
+    return 0
+# End _run_build function
+
+
+def _run_dry_run(args: Namespace, folder: Path) -> int:
+    """
+    Run the build command as a dry run, every problem found is reported
+    along with the predicted size of each tool.  Exit code is 1 when
+    problems are found.
+    """
+    results = _map(_validate, ((spec, folder) for spec in args.specs),
+                   jobs=args.jobs)
+    is_valid = True
+    for validations, _ in results:
+        for name, result in validations:
+            is_valid &= result.is_valid
+            for diagnostic in result.diagnostics:
+                location = (f'{COLON}{diagnostic.location}'
+                            if diagnostic.location else '')
+                print(f'{name}{location}: {diagnostic.rule}: '
+                      f'{diagnostic.message}')
+            for tool, size in result.sizes.items():
+                print(f'{name}{COLON}{tool}: {size} bytes')
+    if args.profile:
+        _print_timings(_merge_timings(t for _, t in results))
+    return int(not is_valid)
+# End _run_dry_run function
+
+
+def _run_inspect(args: Namespace) -> int:
+    """
+    Run the inspect command
+    """
+    results = _map(_inspect, ((path, args.parameters)
+                              for path in args.paths), jobs=args.jobs)
+    summaries = [summary for summary, _ in results]
+    if args.json:
+        print(dumps(summaries, indent=2))
+    else:
+        for summary in summaries:
+            print(summary['path'])
+            print(f'  label: {summary["label"]}')
+            print(f'  alias: {summary["alias"]}')
+            print(f'  tools: {summary["tools"]}')
+            for toolset, tools in summary['toolsets'].items():
+                print(f'  {toolset or "<root>"}: {", ".join(tools)}')
+    if args.profile:
+        _print_timings(_merge_timings(t for _, t in results))
+    return 0
+# End _run_inspect function
+
+
+def _run_diff(args: Namespace) -> int:
+    """
+    Run the diff command, exit code is 1 when the toolboxes differ.
+    """
+    timings = {}
+    with _timed(timings, READ):
+        changeset = diff(Path(args.a), Path(args.b))
+    if args.json:
+        print(dumps(_as_data(changeset), indent=2))
+    else:
+        for line in format_changeset(changeset):
+            print(line)
+    if args.profile:
+        _print_timings(timings)
+    return int(not changeset.is_empty)
+# End _run_diff function
+
+
+def _class_keyword(module: ModuleType, name: str | None) -> str | type | None:
+    """
+    Class Keyword, class names (e.g. FeatureLayerParameter or
+    StringValueFilter) are replaced by the class and resolved to a keyword
+    by the catalog, other names are returned as-is.
+    """
+    if not name:
+        return name
+    if isinstance(cls := getattr(module, name, None), type):
+        return cls
+    return name
+# End _class_keyword function
+
+
+def _run_catalog(args: Namespace) -> int:
+    """
+    Run the catalog command, refresh from folders then query
+    """
+    timings = {}
+    with Catalog(args.index) as catalog:
+        if args.folders:
+            with _timed(timings, READ):
+                result = catalog.refresh(
+                    [Path(f) for f in args.folders], jobs=args.jobs)
+            print(', '.join(f'{k} {v}' for k, v in result._asdict().items()),
+                  file=sys.stderr)
+        entries = catalog.query(
+            data_type=_class_keyword(parameters, args.data_type),
+            filter_type=_class_keyword(filters, args.filter_type),
+            tool=args.tool, parameter=args.parameter)
+    if args.json:
+        print(dumps([e._asdict() for e in entries], indent=2))
+    else:
+        for entry in entries:
+            print(f'{entry.path}{COLON}{entry.tool}{COLON}{entry.parameter}'
+                  f'  {entry.data_type}  {entry.filter_type or ""}'.rstrip())
+    if args.profile:
+        _print_timings(timings)
+    return 0
+# End _run_catalog function
+
+
+def _run_lint(args: Namespace) -> int:
+    """
+    Run the lint command, exit code is 1 when issues are found.
+    """
+    timings = {}
+    with _timed(timings, READ):
+        issues = lint([Path(p) for p in args.paths], jobs=args.jobs)
+    if args.json:
+        print(dumps([i._asdict() for i in issues], indent=2))
+    else:
+        for issue in issues:
+            location = f'{COLON}{issue.location}' if issue.location else ''
+            print(f'{issue.path}{location}: {issue.rule}: {issue.message}')
+    if args.profile:
+        _print_timings(timings)
+    return int(bool(issues))
+# End _run_lint function
+
+
+def _run_migrate(args: Namespace) -> int:
+    """
+    Run the migrate command, fields are given as KEY=VALUE pairs
+    """
+    fields = {}
+    if args.app_ver:
+        fields[ScriptToolContentKeys.application_version] = args.app_ver
+    if args.product:
+        fields[ScriptToolContentKeys.product] = args.product
+    for pair in args.set or []:
+        key, separator, value = pair.partition('=')
+        if not separator:
+            raise ValueError(f'Expected KEY=VALUE, got: {pair}')
+        fields[key] = value
+    if not fields:
+        raise ValueError('No fields provided to migrate')
+    timings = {}
+    with _timed(timings, PACKAGE):
+        paths = migrate([Path(p) for p in args.paths], fields, jobs=args.jobs)
+    for path in paths:
+        print(path)
+    if args.profile:
+        _print_timings(timings)
+    return 0
+# End _run_migrate function
+
+
+def _run_repack(args: Namespace) -> int:
+    """
+    Run the repack command
+    """
+    paths = find_toolboxes(Path(p) for p in args.paths)
+    count = len(paths)
+    timings = {}
+    with _timed(timings, PACKAGE):
+        results = process_map(
+            repack, paths, [args.policy] * count, [args.level] * count,
+            [not args.keep_orphans] * count, jobs=args.jobs)
+    for result in results:
+        print(f'{result.path}  {result.before} -> {result.after} bytes, '
+              f'{len(result.dropped)} dropped')
+    if args.profile:
+        _print_timings(timings)
+    return 0
+# End _run_repack function
+
+
+def _run_pack(args: Namespace) -> int:
+    """
+    Run the pack command
+    """
+    path = Path(args.output) if args.output else None
+    print(pack(Path(args.folder), path=path, overwrite=args.overwrite))
+    return 0
+# End _run_pack function
+
+
+def _run_merge(args: Namespace) -> int:
+    """
+    Run the merge command
+    """
+    timings = {}
+    with _timed(timings, PACKAGE):
+        path = merge(
+            [Path(p) for p in args.paths], out=Path(args.output),
+            label=args.label, alias=args.alias, overwrite=args.overwrite)
+    print(path)
+    if args.profile:
+        _print_timings(timings)
+    return 0
+# End _run_merge function
+
+
+def _run_watch(args: Namespace) -> int:
+    """
+    Run the watch command, the spec is loaded from its file so that changes
+    to the module are picked up on every full rebuild.
+    """
+    path, attribute = _spec_file(args.spec)
+    spec = f'{path}{COLON}{attribute}' if attribute else str(path)
+    folder = Path(args.output)
+    folder.mkdir(parents=True, exist_ok=True)
+    watcher = Watcher(
+        load=partial(load_toolboxes, spec), folder=folder, sources=[path],
+        interval=args.interval, debounce=args.debounce)
+    for toolbox in watcher.build():
+        print(toolbox)
+
+    def on_change(paths: list[Path]) -> None:
+        for changed in paths:
+            print(f'rebuilt {changed}')
+
+    def on_error(err: Exception) -> None:
+        print(f'autobox: error: {err}', file=sys.stderr)
+
+    try:
+        watcher.run(on_change=on_change, on_error=on_error)
+    except KeyboardInterrupt:
+        pass
+    return 0
+# End _run_watch function
+
+
+def _run_bench(args: Namespace) -> int:
+    """
+    Run the bench command
+    """
+    if args.list:
+        for name in sorted(BENCHMARKS):
+            print(name)
+        return 0
+    for result in run_benchmarks(args.names, repeat=args.repeat):
+        print(f'{result.name:<32}best {result.best:>12.6f}s  '
+              f'mean {result.mean:>12.6f}s  (n={result.repeat})')
+    return 0
+# End _run_bench function
+
+
+def _make_parser() -> ArgumentParser:
+    """
+    Make Argument Parser
+    """
+    parser = ArgumentParser(
+        prog='autobox',
+        description='Build, inspect, and benchmark ArcGIS Pro toolboxes.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    common = ArgumentParser(add_help=False)
+    common.add_argument(
+        '--profile', action='store_true',
+        help='Write per-phase timings to standard error.')
+    jobs = ArgumentParser(add_help=False)
+    jobs.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help='Number of worker processes, default is 1.')
+
+    build = commands.add_parser(
+        'build', parents=[common, jobs],
+        help='Build toolboxes from python modules or files.')
+    build.add_argument(
+        'specs', nargs='+', metavar='SPEC',
+        help='Module name or python file, optionally with an attribute, '
+             'e.g. package.module:attribute or file.py:attribute.')
+    build.add_argument(
+        '-o', '--output', default='.',
+        help='Output folder, default is the current folder.')
+    build.add_argument(
+        '--overwrite', action='store_true',
+        help='Overwrite existing toolboxes.')
+    build.add_argument(
+        '--layout', choices=[ARCHIVE, DIRECTORY], default=ARCHIVE,
+        help='Write toolbox files (archive) or unzipped folders (directory) '
+             'which are updated in place, default is archive.')
+    build.add_argument(
+        '--dry-run', action='store_true',
+        help='Build the toolbox content in memory without writing anything, '
+             'report all problems and the predicted size of each tool.')
+    build.set_defaults(func=_run_build)
+
+    inspect = commands.add_parser(
+        'inspect', parents=[common, jobs], help='Summarize toolboxes.')
+    inspect.add_argument('paths', nargs='+', metavar='PATH')
+    inspect.add_argument(
+        '--parameters', action='store_true',
+        help='Include the parameter names of each tool.')
+    inspect.add_argument(
+        '--json', action='store_true', help='Write the summary as json.')
+    inspect.set_defaults(func=_run_inspect)
+
+    differ = commands.add_parser(
+        'diff', parents=[common], help='Compare two toolboxes.')
+    differ.add_argument('a', metavar='A')
+    differ.add_argument('b', metavar='B')
+    differ.add_argument(
+        '--json', action='store_true', help='Write the changes as json.')
+    differ.set_defaults(func=_run_diff)
+
+    catalog = commands.add_parser(
+        'catalog', parents=[common, jobs],
+        help='Index toolboxes in folders and query their parameters.')
+    catalog.add_argument('index', metavar='INDEX', help='SQLite index file.')
+    catalog.add_argument(
+        'folders', nargs='*', metavar='FOLDER',
+        help='Folders to (re)index, only changed toolboxes are read.')
+    catalog.add_argument(
+        '--data-type',
+        help='Parameter class or keyword, e.g. FeatureLayerParameter.')
+    catalog.add_argument(
+        '--filter-type', help='Filter class or keyword, e.g. FieldTypeFilter.')
+    catalog.add_argument('--tool', help='Tool name.')
+    catalog.add_argument('--parameter', help='Parameter name.')
+    catalog.add_argument(
+        '--json', action='store_true', help='Write the matches as json.')
+    catalog.set_defaults(func=_run_catalog)
+
+    linter = commands.add_parser(
+        'lint', parents=[common, jobs],
+        help='Check toolboxes against the rules enforced when building.')
+    linter.add_argument(
+        'paths', nargs='+', metavar='PATH', help='Toolboxes or folders.')
+    linter.add_argument(
+        '--json', action='store_true', help='Write the issues as json.')
+    linter.set_defaults(func=_run_lint)
+
+    migrator = commands.add_parser(
+        'migrate', parents=[common, jobs],
+        help='Rewrite tool content fields of existing toolboxes.')
+    migrator.add_argument(
+        'paths', nargs='+', metavar='PATH', help='Toolboxes or folders.')
+    migrator.add_argument('--app-ver', help='Application version, e.g. 13.5.')
+    migrator.add_argument('--product', help='Product code, e.g. 100.')
+    migrator.add_argument(
+        '--set', action='append', metavar='KEY=VALUE',
+        help='Any other tool content field, may be repeated.')
+    migrator.set_defaults(func=_run_migrate)
+
+    repacker = commands.add_parser(
+        'repack', parents=[common, jobs],
+        help='Recompress toolboxes and drop orphaned members.')
+    repacker.add_argument(
+        'paths', nargs='+', metavar='PATH', help='Toolboxes or folders.')
+    repacker.add_argument(
+        '--policy', choices=list(CompressionPolicy),
+        default=CompressionPolicy.SMALLEST,
+        help='Compression policy, default is smallest.')
+    repacker.add_argument(
+        '--level', type=int, default=9,
+        help='Deflate compression level, default is 9.')
+    repacker.add_argument(
+        '--keep-orphans', action='store_true',
+        help='Keep members not referenced from the toolbox content.')
+    repacker.set_defaults(func=_run_repack)
+
+    packer = commands.add_parser(
+        'pack', help='Pack a toolbox saved as a directory into a toolbox.')
+    packer.add_argument('folder', metavar='FOLDER')
+    packer.add_argument(
+        '-o', '--output',
+        help='Toolbox path, default is alongside the folder.')
+    packer.add_argument(
+        '--overwrite', action='store_true',
+        help='Overwrite the toolbox if it exists.')
+    packer.set_defaults(func=_run_pack)
+
+    merger = commands.add_parser(
+        'merge', parents=[common], help='Merge toolboxes into one toolbox.')
+    merger.add_argument('output', metavar='OUT')
+    merger.add_argument('paths', nargs='+', metavar='PATH')
+    merger.add_argument(
+        '--label', help='Label, default is the label of the first toolbox.')
+    merger.add_argument(
+        '--alias', help='Alias, default is the alias of the first toolbox.')
+    merger.add_argument(
+        '--overwrite', action='store_true',
+        help='Overwrite the merged toolbox if it exists.')
+    merger.set_defaults(func=_run_merge)
+
+    watch = commands.add_parser(
+        'watch', help='Rebuild a toolbox incrementally as its files change.')
+    watch.add_argument('spec', metavar='SPEC')
+    watch.add_argument(
+        '-o', '--output', default='.',
+        help='Output folder, default is the current folder.')
+    watch.add_argument(
+        '--interval', type=float, default=0.5,
+        help='Seconds between polls, default is 0.5.')
+    watch.add_argument(
+        '--debounce', type=float, default=0.25,
+        help='Seconds without changes before rebuilding, default is 0.25.')
+    watch.set_defaults(func=_run_watch)
+
+    bench = commands.add_parser('bench', help='Run the benchmark suite.')
+    bench.add_argument('names', nargs='*', metavar='NAME')
+    bench.add_argument(
+        '-n', '--repeat', type=int, default=5,
+        help='Number of timed repetitions, default is 5.')
+    bench.add_argument(
+        '--list', action='store_true', help='List the benchmark names.')
+    bench.set_defaults(func=_run_bench)
+    return parser
+# End _make_parser function
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Command Line Entry Point
+    """
+    parser = _make_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args)
+    except (FileExistsError, FileNotFoundError, ImportError,
+            KeyError, TypeError, ValueError) as err:
+        print(f'autobox: error: {err}', file=sys.stderr)
+        return 2
+# End main function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
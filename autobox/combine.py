@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Combine existing toolboxes into a single toolbox
+"""
+
+
+from os import replace
+from pathlib import Path
+from typing import Iterable, NoReturn
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from autobox.archive import copy_member, make_sibling_path
+from autobox.constant import (
+    DOLLAR_RC, DOT, NAME, SEMI_COLON, SPACE, TOOL, TOOLBOX_CONTENT,
+    TOOLBOX_CONTENT_RC, TOOLSET, ToolboxContentKeys)
+from autobox.reader import ToolboxReader
+from autobox.toolbox import Toolbox
+from autobox.type import STRING, TOOLS_MAP, ToolEntry
+from autobox.writer import encode_json
+
+
+__all__ = ['merge']
+
+
+def _check_tool_repeats(readers: list[ToolboxReader]) -> None | NoReturn:
+    """
+    Check for Tool name (and folder) repetitions across the toolboxes, tool
+    names must be unique regardless of case.
+    """
+    seen: dict[str, ToolEntry] = {}
+    names = set()
+    for reader in readers:
+        for tool in reader.tools:
+            for key in tool.name.casefold(), tool.folder.casefold():
+                if (other := seen.get(key)) and other is not tool:
+                    names.update((other.name, tool.name))
+                seen[key] = tool
+    if not names:
+        return
+    names = f'{SEMI_COLON}{SPACE}'.join(sorted(names))
+    raise ValueError(f'Tool name repetition detected: {names}')
+# End _check_tool_repeats function
+
+
+def _combine_toolsets(readers: list[ToolboxReader]) \
+        -> tuple[TOOLS_MAP, dict[str, str]]:
+    """
+    Combine the toolsets, toolsets with the same qualified name (regardless
+    of case) are combined.  Tools are sorted by name within each toolset.
+    """
+    toolsets: dict[str, tuple[str, list[tuple[str, str]]]] = {}
+    for reader in readers:
+        for tool in reader.tools:
+            qualified_name = tool.name
+            if tool.folder != tool.name:
+                qualified_name = f'{tool.name}:{tool.folder}{DOT}{TOOL}'
+            key = tool.toolset.casefold()
+            _, tools = toolsets.setdefault(key, (tool.toolset, []))
+            tools.append((tool.name, qualified_name))
+    mapping = {}
+    toolset_names = {}
+    if root := toolsets.pop('', None):
+        mapping[ToolboxContentKeys.root] = {
+            ToolboxContentKeys.tools: [q for _, q in sorted(root[1])]}
+    for counter, (name, tools) in enumerate(toolsets.values(), start=1):
+        indexed_name = f'{TOOLSET}{counter}{DOT}{NAME}'
+        mapping[f'{DOLLAR_RC}{indexed_name}'] = {
+            ToolboxContentKeys.tools: [q for _, q in sorted(tools)]}
+        toolset_names[indexed_name] = name
+    if not mapping:
+        mapping = {ToolboxContentKeys.root: {ToolboxContentKeys.tools: ['']}}
+    return mapping, toolset_names
+# End _combine_toolsets function
+
+
+def merge(paths: Iterable[Path], out: Path, label: STRING = None,
+          alias: STRING = None, description: STRING = None,
+          overwrite: bool = False) -> Path:
+    """
+    Merge existing toolboxes into a single toolbox.  Only the toolbox content
+    and resource are built, the members of every tool are copied raw from
+    the source archives without being inflated.  Toolsets with the same name
+    are combined, tool names must be unique across the toolboxes.
+
+    :param paths: Paths to the toolboxes to merge, in order.
+    :param out: Path of the merged toolbox, the name is taken from the stem.
+    :param label: Optional label, defaults to the label of the first toolbox.
+    :param alias: Optional alias, defaults to the alias of the first toolbox.
+    :param description: Optional description, defaults to the description
+        of the first toolbox.
+    :param overwrite: Overwrite the merged toolbox if it exists.
+    """
+    out = Path(out)
+    if out.is_file() and not overwrite:
+        raise FileExistsError(f'File already exists: {out}')
+    readers = [ToolboxReader(path) for path in paths]
+    if not readers:
+        raise ValueError('No toolboxes provided to merge')
+    try:
+        first, *_ = readers
+        tbx = Toolbox(name=out.stem, label=label or first.label,
+                      alias=alias or first.alias,
+                      description=description or first.description)
+        _check_tool_repeats(readers)
+        toolsets, toolset_names = _combine_toolsets(readers)
+        # noinspection PyProtectedMember
+        content = tbx._make_content(toolsets)
+        # noinspection PyProtectedMember
+        resource = tbx._build_resource(toolset_names)
+        temporary = make_sibling_path(out)
+        try:
+            with ZipFile(temporary, mode='w', compression=ZIP_DEFLATED) as zout:
+                for reader in readers:
+                    prefixes = tuple(f'{t.folder}{DOT}{TOOL}/'
+                                     for t in reader.tools)
+                    # noinspection PyProtectedMember
+                    zin = reader._open()
+                    for info in zin.infolist():
+                        if prefixes and info.filename.startswith(prefixes):
+                            copy_member(zin, zout, info)
+                for name, data in zip((TOOLBOX_CONTENT, TOOLBOX_CONTENT_RC),
+                                      (content, resource)):
+                    zout.writestr(name, encode_json(data))
+            replace(temporary, out)
+        finally:
+            temporary.unlink(missing_ok=True)
+    finally:
+        for reader in readers:
+            reader.close()
+    return out
+# End merge function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+"""
+Structural comparison of toolboxes
+"""
+
+
+from abc import abstractmethod
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+from zlib import crc32
+
+from autobox.constant import (
+    DOLLAR_RC, DOT, ScriptToolContentKeys, ScriptToolContentResourceKeys,
+    TOOL_CONTENT, TOOL_CONTENT_RC, TOOLSET)
+from autobox.reader import ToolboxReader
+from autobox.script import ScriptTool
+from autobox.toolbox import Toolbox
+from autobox.type import (
+    CHANGES, ChangeSet, PATH, ParameterChange, ToolChange)
+from autobox.writer import MemoryWriter, encode_json
+
+
+__all__ = ['diff']
+
+
+VOLATILE: frozenset[str] = frozenset({ScriptToolContentKeys.updated})
+MEMBERS: str = 'members'
+ORDER: str = 'order'
+
+
+def _digest(toolset: str, content: dict[str, Any], resource: dict[str, Any],
+            members: dict[str, int]) -> str:
+    """
+    Digest of a tool, the same for an archive and a toolbox object.  The
+    content (volatile fields excluded) and resource are encoded the way
+    they are written, other members contribute their checksums.
+    """
+    content = {k: v for k, v in content.items() if k not in VOLATILE}
+    hasher = sha256(toolset.encode())
+    hasher.update(encode_json(content))
+    hasher.update(encode_json(resource))
+    for name, crc in sorted(members.items()):
+        hasher.update(f'{name}{crc}'.encode())
+    return hasher.hexdigest()
+# End _digest function
+
+
+def _resolve(value: Any, mapping: dict[str, str]) -> Any:
+    """
+    Resolve resource references ($rc:) using the resource mapping
+    """
+    if isinstance(value, str):
+        if value.startswith(DOLLAR_RC):
+            return mapping.get(value.removeprefix(DOLLAR_RC), value)
+        return value
+    if isinstance(value, dict):
+        return {k: _resolve(v, mapping) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_resolve(v, mapping) for v in value]
+    return value
+# End _resolve function
+
+
+def _flatten(data: dict[str, Any], prefix: str = '') -> dict[str, Any]:
+    """
+    Flatten nested dictionaries into dotted keys, lists are leaf values.
+    """
+    flat = {}
+    for key, value in data.items():
+        key = f'{prefix}{key}'
+        if isinstance(value, dict) and value:
+            flat.update(_flatten(value, prefix=f'{key}{DOT}'))
+        else:
+            flat[key] = value
+    return flat
+# End _flatten function
+
+
+def _compare(old: dict[str, Any], new: dict[str, Any]) -> CHANGES:
+    """
+    Compare flat dictionaries, returns the old and new value of each change.
+    """
+    changes = {}
+    for key in sorted(old.keys() | new.keys()):
+        if (before := old.get(key)) != (after := new.get(key)):
+            changes[key] = before, after
+    return changes
+# End _compare function
+
+
+class _Source:
+    """
+    Source of tools to compare, an archive or an in-memory toolbox.
+    """
+    def __init__(self) -> None:
+        """
+        Initialize the _Source class
+        """
+        super().__init__()
+        self._tools: dict[str, tuple[str, str]] = {}
+    # End init built-in
+
+    @property
+    def tools(self) -> dict[str, tuple[str, str]]:
+        """
+        Tools keyed on case-folded name, the value is the name and toolset.
+        """
+        return self._tools
+    # End tools property
+
+    @property
+    @abstractmethod
+    def properties(self) -> dict[str, Any]:  # pragma: no cover
+        """
+        Toolbox Properties
+        """
+        pass
+    # End properties property
+
+    def digest(self, key: str) -> str:
+        """
+        Digest of a tool, volatile fields excluded.
+        """
+        return _digest(self._tools[key][1], *self.load(key))
+    # End digest method
+
+    @abstractmethod
+    def load(self, key: str) -> tuple[
+            dict[str, Any], dict[str, Any], dict[str, int]]:  # pragma: no cover
+        """
+        Load the content, resource, and member checksums of a tool, the
+        tool content members are excluded from the checksums.
+        """
+        pass
+    # End load method
+
+    def close(self) -> None:
+        """
+        Close the source
+        """
+        pass
+    # End close method
+# End _Source class
+
+
+class _ArchiveSource(_Source):
+    """
+    Archive Source, tools are read from a toolbox file, members other than
+    the tool content are compared using their stored checksums.
+    """
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize the _ArchiveSource class
+        """
+        super().__init__()
+        self._reader: ToolboxReader = ToolboxReader(path)
+        self._tools = {t.name.casefold(): (t.name, t.toolset)
+                       for t in self._reader.tools}
+    # End init built-in
+
+    @property
+    def properties(self) -> dict[str, Any]:
+        """
+        Toolbox Properties
+        """
+        return {'alias': self._reader.alias, 'label': self._reader.label,
+                'description': self._reader.description}
+    # End properties property
+
+    def _members(self, key: str) -> dict[str, int]:
+        """
+        Member checksums keyed on the name relative to the tool folder
+        """
+        members = {}
+        for info in self._reader.get_tool_members(key):
+            _, _, name = info.filename.partition('/')
+            members[name] = info.CRC
+        return members
+    # End _members method
+
+    def load(self, key: str) -> tuple[
+            dict[str, Any], dict[str, Any], dict[str, int]]:
+        """
+        Load the content, resource, and member checksums of a tool.
+        """
+        content, resource = self._reader.read_tool(key)
+        members = self._members(key)
+        for name in TOOL_CONTENT, TOOL_CONTENT_RC:
+            members.pop(name, None)
+        return content, resource, members
+    # End load method
+
+    def close(self) -> None:
+        """
+        Close the source
+        """
+        self._reader.close()
+    # End close method
+# End _ArchiveSource class
+
+
+class _ModelSource(_Source):
+    """
+    Model Source, content is built in memory from the toolbox objects.
+    """
+    def __init__(self, toolbox: Toolbox, target: Path) -> None:
+        """
+        Initialize the _ModelSource class
+        """
+        super().__init__()
+        self._toolbox: Toolbox = toolbox
+        self._target: Path = target
+        self._objects: dict[str, ScriptTool] = {}
+        self._cache: dict[str, tuple[
+            dict[str, Any], dict[str, Any], dict[str, int]]] = {}
+        for tool, toolset in self._walk():
+            key = tool.name.casefold()
+            self._objects[key] = tool
+            self._tools[key] = tool.name, toolset
+    # End init built-in
+
+    def _walk(self) -> list[tuple[ScriptTool, str]]:
+        """
+        Walk the tools and the qualified name of the containing toolset
+        """
+        tools = [(t, '') for t in self._toolbox.tools]
+        toolsets = list(self._toolbox.toolsets)
+        while toolsets:
+            toolset = toolsets.pop(0)
+            tools.extend((t, toolset.qualified_name) for t in toolset.tools)
+            toolsets.extend(toolset.toolsets)
+        return tools
+    # End _walk method
+
+    def _build(self, key: str) -> tuple[
+            dict[str, Any], dict[str, Any], dict[str, int]]:
+        """
+        Build the content, resource, and member checksums of a tool, cached.
+        The members are written in memory so their checksums match those
+        stored in an archive.
+        """
+        if key not in self._cache:
+            tool = self._objects[key]
+            writer = MemoryWriter()
+            # noinspection PyProtectedMember
+            tool._serialize(writer, target=self._target)
+            members = {}
+            for name, data in writer.files.items():
+                _, _, name = name.partition('/')
+                if name not in (TOOL_CONTENT, TOOL_CONTENT_RC):
+                    members[name] = crc32(data)
+            # noinspection PyProtectedMember
+            self._cache[key] = *tool._get_cached_content(self._target), members
+        return self._cache[key]
+    # End _build method
+
+    @property
+    def properties(self) -> dict[str, Any]:
+        """
+        Toolbox Properties
+        """
+        return {'alias': self._toolbox.alias, 'label': self._toolbox.label,
+                'description': self._toolbox.description}
+    # End properties property
+
+    def load(self, key: str) -> tuple[
+            dict[str, Any], dict[str, Any], dict[str, int]]:
+        """
+        Load the content, resource, and member checksums of a tool.
+        """
+        return self._build(key)
+    # End load method
+# End _ModelSource class
+
+
+def _make_source(value: Path | Toolbox, target: PATH) -> _Source:
+    """
+    Make Source from a toolbox path or a toolbox object
+    """
+    if isinstance(value, Toolbox):
+        return _ModelSource(value, target=target or Path.cwd())
+    return _ArchiveSource(Path(value))
+# End _make_source function
+
+
+def _split_content(content: dict[str, Any], resource: dict[str, Any]) \
+        -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """
+    Split Content into resolved tool level values and resolved parameters
+    """
+    mapping = resource.get(ScriptToolContentResourceKeys.map, {})
+    content = {k: v for k, v in content.items() if k not in VOLATILE}
+    parameters = content.pop(ScriptToolContentKeys.parameters, None) or {}
+    return _resolve(content, mapping), _resolve(parameters, mapping)
+# End _split_content function
+
+
+def _compare_parameters(old: dict[str, dict], new: dict[str, dict]) \
+        -> tuple[list[str], list[str], list[ParameterChange], CHANGES]:
+    """
+    Compare Parameters, returns added, removed, modified, and order changes.
+    """
+    old_keys = {k.casefold(): k for k in old}
+    new_keys = {k.casefold(): k for k in new}
+    added = [new_keys[k] for k in new_keys if k not in old_keys]
+    removed = [old_keys[k] for k in old_keys if k not in new_keys]
+    modified = []
+    common = [k for k in old_keys if k in new_keys]
+    for key in common:
+        before, after = old[old_keys[key]], new[new_keys[key]]
+        if changes := _compare(_flatten(before), _flatten(after)):
+            modified.append(ParameterChange(name=new_keys[key], changes=changes))
+    order = {}
+    new_order = [k for k in new_keys if k in old_keys]
+    if common != new_order:
+        order[ORDER] = ([old_keys[k] for k in common],
+                        [new_keys[k] for k in new_order])
+    return added, removed, modified, order
+# End _compare_parameters function
+
+
+def _compare_tool(key: str, old: _Source, new: _Source) -> ToolChange | None:
+    """
+    Compare a tool present in both sources
+    """
+    old_content, old_resource, old_members = old.load(key)
+    new_content, new_resource, new_members = new.load(key)
+    old_values, old_parameters = _split_content(old_content, old_resource)
+    new_values, new_parameters = _split_content(new_content, new_resource)
+    old_values[TOOLSET] = old.tools[key][1]
+    new_values[TOOLSET] = new.tools[key][1]
+    changes = _compare(_flatten(old_values), _flatten(new_values))
+    changes.update(_compare(
+        _flatten({MEMBERS: old_members}), _flatten({MEMBERS: new_members})))
+    added, removed, modified, order = _compare_parameters(
+        old_parameters, new_parameters)
+    changes.update({f'{ScriptToolContentKeys.parameters}{DOT}{k}': v
+                    for k, v in order.items()})
+    if not (changes or added or removed or modified):
+        return None
+    return ToolChange(
+        name=new.tools[key][0], changes=changes, added_parameters=added,
+        removed_parameters=removed, modified_parameters=modified)
+# End _compare_tool function
+
+
+def diff(a: Path | Toolbox, b: Path | Toolbox,
+         target: PATH = None) -> ChangeSet:
+    """
+    Structural difference between two toolboxes, each can be a path to a
+    toolbox file or a toolbox object.  Tools are compared by digest first
+    and only tools which differ are compared in detail.  Volatile fields
+    (e.g. the updated timestamp) are ignored.
+
+    :param a: The original toolbox, a path or a toolbox object.
+    :param b: The changed toolbox, a path or a toolbox object.
+    :param target: Folder used to resolve relative paths (e.g. symbology)
+        for toolbox objects, defaults to the folder of the changed toolbox
+        when it is a path, then to the folder of the original toolbox when
+        it is a path, otherwise the current working directory.
+    """
+    if target is None:
+        folders = [Path(v).parent for v in (b, a)
+                   if not isinstance(v, Toolbox)]
+        target = next(iter(folders), None)
+    old, new = _make_source(a, target=target), _make_source(b, target=target)
+    try:
+        changes = _compare(old.properties, new.properties)
+        added = [new.tools[k][0] for k in new.tools if k not in old.tools]
+        removed = [old.tools[k][0] for k in old.tools if k not in new.tools]
+        modified = []
+        for key in old.tools:
+            if key not in new.tools or old.digest(key) == new.digest(key):
+                continue
+            if change := _compare_tool(key, old=old, new=new):
+                modified.append(change)
+    finally:
+        old.close()
+        new.close()
+    return ChangeSet(changes=changes, added_tools=added,
+                     removed_tools=removed, modified_tools=modified)
+# End diff function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Compress, repack existing toolboxes under a compression policy
+"""
+
+
+from enum import StrEnum
+from os import replace
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+from zlib import DEFLATED, MAX_WBITS, compressobj
+
+from autobox.archive import make_sibling_path, read_raw, write_raw
+from autobox.constant import (
+    DOT, TOOL, TOOLBOX, TOOLBOX_CONTENT, TOOLBOX_CONTENT_RC)
+from autobox.reader import ToolboxReader
+from autobox.type import RepackResult
+from autobox.util import validate_path
+
+
+__all__ = ['CompressionPolicy', 'repack']
+
+
+_CHUNK_SIZE: int = 1 << 16
+
+
+class CompressionPolicy(StrEnum):
+    """
+    Compression Policy Enumeration
+    """
+    KEEP = 'keep'
+    STORE = 'store'
+    DEFLATE = 'deflate'
+    SMALLEST = 'smallest'
+# End CompressionPolicy class
+
+
+def _deflate(zin: ZipFile, info: ZipInfo, level: int) -> bytes:
+    """
+    Deflate a member, the member is inflated and compressed in chunks
+    """
+    compressor = compressobj(level, DEFLATED, -MAX_WBITS)
+    chunks = []
+    with zin.open(info) as source:
+        while chunk := source.read(_CHUNK_SIZE):
+            chunks.append(compressor.compress(chunk))
+    chunks.append(compressor.flush())
+    return b''.join(chunks)
+# End _deflate function
+
+
+def _recompress(zin: ZipFile, info: ZipInfo, policy: CompressionPolicy,
+                level: int) -> tuple[bytes, int]:
+    """
+    Recompress a member according to the policy, returns the compressed
+    bytes and the compression type.
+    """
+    if policy == CompressionPolicy.KEEP:
+        return read_raw(zin, info), info.compress_type
+    if policy == CompressionPolicy.STORE:
+        if info.compress_type == ZIP_STORED:
+            return read_raw(zin, info), ZIP_STORED
+        return zin.read(info), ZIP_STORED
+    deflated = _deflate(zin, info, level=level)
+    if policy == CompressionPolicy.DEFLATE:
+        return deflated, ZIP_DEFLATED
+    candidates = [(read_raw(zin, info), info.compress_type),
+                  (deflated, ZIP_DEFLATED)]
+    if info.file_size < min(len(data) for data, _ in candidates):
+        candidates.append((zin.read(info), ZIP_STORED))
+    return min(candidates, key=lambda candidate: len(candidate[0]))
+# End _recompress function
+
+
+def _referenced_prefixes(reader: ToolboxReader) -> tuple[str, ...]:
+    """
+    Referenced Prefixes, the folders of the tools listed in the toolbox
+    content.
+    """
+    return tuple(f'{t.folder}{DOT}{TOOL}/' for t in reader.tools)
+# End _referenced_prefixes function
+
+
+def repack(path: Path | str,
+           policy: CompressionPolicy | str = CompressionPolicy.SMALLEST,
+           level: int = 9, drop_orphans: bool = True) -> RepackResult:
+    """
+    Repack a toolbox, members are streamed from the existing archive into a
+    new archive under the compression policy and the new archive replaces
+    the existing one atomically.  Nothing is extracted to disk.
+
+    :param path: Path to the toolbox.
+    :param policy: Compression policy, keep copies members raw, store and
+        deflate recompress every member, smallest keeps whichever of the
+        existing, deflated, or stored bytes is smallest.
+    :param level: Compression level used for deflate, 0 to 9.
+    :param drop_orphans: Drop members not referenced from the toolbox
+        content, e.g. folders of tools which are no longer listed.
+    """
+    path = validate_path(path, text=TOOLBOX)
+    policy = CompressionPolicy(policy)
+    if not 0 <= level <= 9:
+        raise ValueError(f'Invalid compression level: {level}')
+    before = path.stat().st_size
+    dropped = []
+    temporary = make_sibling_path(path)
+    try:
+        with (ToolboxReader(path) as reader,
+              ZipFile(temporary, mode='w') as zout):
+            if TOOLBOX_CONTENT not in reader.names:
+                raise ValueError(f'Toolbox content not found: {path}')
+            prefixes = _referenced_prefixes(reader)
+            # noinspection PyProtectedMember
+            zin = reader._open()
+            for info in zin.infolist():
+                name = info.filename
+                is_referenced = (name in (TOOLBOX_CONTENT, TOOLBOX_CONTENT_RC)
+                                 or (prefixes and name.startswith(prefixes)))
+                if drop_orphans and (info.is_dir() or not is_referenced):
+                    dropped.append(name)
+                    continue
+                data, compress_type = _recompress(
+                    zin, info, policy=policy, level=level)
+                write_raw(zout, info, data, compress_type=compress_type)
+        replace(temporary, path)
+    finally:
+        temporary.unlink(missing_ok=True)
+    return RepackResult(
+        path=path, before=before, after=path.stat().st_size, dropped=dropped)
+# End repack function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
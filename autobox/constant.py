@@ -4,6 +4,7 @@ Constants
 """
 
 
+from sys import byteorder
 from typing import ClassVar
 
 
@@ -62,6 +63,20 @@ XML: str = 'xml'
 XML_SERIALIZE: str = f'{XML}serialize'
 
 
+# NOTE buffer protocol formats of numbers, e.g. array.array and numpy arrays
+INTEGER_FORMATS: frozenset[str] = frozenset('bBhHiIlLqQ?')
+FLOAT_FORMATS: frozenset[str] = frozenset('fd')
+# NOTE byte order prefixes, e.g. numpy arrays use < or > (standard sizes)
+BYTE_ORDERS: frozenset[str] = frozenset('@=<>!')
+NATIVE_BYTE_ORDERS: frozenset[str] = frozenset(
+    '@=<' if byteorder == 'little' else '@=>!')
+SIGNED_TYPECODES: str = 'bhilq'
+UNSIGNED_TYPECODES: str = 'BHILQ'
+FLOAT_TYPECODES: str = 'fd'
+LONG_TYPECODE: str = 'q'
+DOUBLE_TYPECODE: str = 'd'
+
+
 OUT: str = 'out'
 DERIVED: str = 'derived'
 OPTIONAL: str = 'optional'
@@ -87,6 +102,8 @@ TOOLSET: str = f'{TOOL}set'
 TOOLBOX: str = f'{TOOL}box'
 PARAMETER: str = 'parameter'
 FILTER: str = 'filter'
+ARCHIVE: str = 'archive'
+DIRECTORY: str = 'directory'
 
 
 TOOL_DOT: str = f'{TOOL}{DOT}'
@@ -260,6 +277,27 @@ class ItemsContentKeys:
 # End ItemsContentKeys class
 
 
+class LayerFileKeys:
+    """
+    Layer File (.lyrx) Keys
+    """
+    type: ClassVar[str] = 'type'
+    layers: ClassVar[str] = 'layers'
+    layer_definitions: ClassVar[str] = 'layerDefinitions'
+    uri: ClassVar[str] = 'uRI'
+    renderer: ClassVar[str] = 'renderer'
+    symbol: ClassVar[str] = 'symbol'
+# End LayerFileKeys class
+
+
+CIM_FEATURE_LAYER: str = 'CIMFeatureLayer'
+CIM_LAS_DATASET_LAYER: str = 'CIMLASDatasetLayer'
+CIM_MOSAIC_LAYER: str = 'CIMMosaicLayer'
+CIM_RASTER_LAYER: str = 'CIMRasterLayer'
+CIM_TIN_LAYER: str = 'CIMTinLayer'
+CIM_SYMBOL_REFERENCE: str = 'CIMSymbolReference'
+
+
 class ToolAttributeKeywords:
     """
     Tool Attribute Keywords
@@ -278,5 +316,36 @@ class ToolAttributeKeywords:
 # End ToolAttributeKeywords class
 
 
+class DiagnosticRules:
+    """
+    Diagnostic Rules
+    """
+    archive: ClassVar[str] = 'archive'
+    toolbox_name: ClassVar[str] = 'toolbox-name'
+    toolbox_alias: ClassVar[str] = 'toolbox-alias'
+    toolset_name: ClassVar[str] = 'toolset-name'
+    toolset_repeat: ClassVar[str] = 'toolset-repeat'
+    tool_name: ClassVar[str] = 'tool-name'
+    tool_folder: ClassVar[str] = 'tool-folder'
+    tool_repeat: ClassVar[str] = 'tool-repeat'
+    tool_content: ClassVar[str] = 'tool-content'
+    image_type: ClassVar[str] = 'image-type'
+    parameter_label: ClassVar[str] = 'parameter-label'
+    parameter_name: ClassVar[str] = 'parameter-name'
+    parameter_repeat: ClassVar[str] = 'parameter-repeat'
+    data_type: ClassVar[str] = 'data-type'
+    required_value: ClassVar[str] = 'required-value'
+    default_value: ClassVar[str] = 'default-value'
+    dependency_missing: ClassVar[str] = 'dependency-missing'
+    dependency_type: ClassVar[str] = 'dependency-type'
+    filter_type: ClassVar[str] = 'filter-type'
+    filter_value: ClassVar[str] = 'filter-value'
+    layer_file: ClassVar[str] = 'layer-file'
+    layer_mismatch: ClassVar[str] = 'layer-mismatch'
+    path_missing: ClassVar[str] = 'path-missing'
+    resource_missing: ClassVar[str] = 'resource-missing'
+# End DiagnosticRules class
+
+
 if __name__ == '__main__':  # pragma: no cover
     pass
@@ -4,26 +4,64 @@ Classes for Default Value
 """
 
 
+from abc import abstractmethod
 from enum import StrEnum
-from typing import ClassVar, NoReturn, Self, Type
+from typing import Any, ClassVar, NoReturn, Self, Type
+from weakref import WeakValueDictionary
 
 from autobox.enum import ArealUnit, LinearUnit, TimeUnit
 from autobox.type import NUMBER, STRING
 
 
-class BaseRangeDomain:
+_INTERNED: WeakValueDictionary[tuple[type, str], 'BaseValue'] = (
+    WeakValueDictionary())
+
+
+class BaseValue:
     """
-    Base Range Domain
+    Base Value, immutable once initialized, the string representation is
+    built once and cached.  Use interned to share one instance between the
+    many parameters which use the same default value.
     """
-    def __init__(self, minimum: NUMBER, maximum: NUMBER) -> None:
+    __slots__ = '_text', '__weakref__'
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
         """
-        Initialize the BaseRangeDomain class
+        Set Attribute, not allowed, values are immutable
         """
-        super().__init__()
-        minimum, maximum = self._validate_range(minimum, maximum)
-        self._min: NUMBER = minimum
-        self._max: NUMBER = maximum
-    # End init built-in
+        raise AttributeError(
+            f'{self.__class__.__name__} is immutable, cannot set {name}')
+    # End setattr built-in
+
+    def __delattr__(self, name: str) -> NoReturn:
+        """
+        Delete Attribute, not allowed, values are immutable
+        """
+        raise AttributeError(
+            f'{self.__class__.__name__} is immutable, cannot delete {name}')
+    # End delattr built-in
+
+    def __setstate__(self, state: tuple[None, dict[str, Any]]) -> None:
+        """
+        Set State, used when unpickling
+        """
+        _, values = state
+        self._set(**values)
+    # End setstate built-in
+
+    def __copy__(self) -> Self:
+        """
+        Copy, the same instance since values are immutable
+        """
+        return self
+    # End copy built-in
+
+    def __deepcopy__(self, memo: dict) -> Self:
+        """
+        Deep Copy, the same instance since values are immutable
+        """
+        return self
+    # End deepcopy built-in
 
     def __eq__(self, other: Self) -> bool:
         """
@@ -43,11 +81,79 @@ class BaseRangeDomain:
 
     def __repr__(self) -> str:
         """
-        String Representation
+        String Representation, built on first use
         """
-        return f'{self.minimum} {self.maximum}'
+        try:
+            return self._text
+        except AttributeError:
+            text = self._make_text()
+            self._set(_text=text)
+            return text
     # End repr built-in
 
+    def _set(self, **values: Any) -> None:
+        """
+        Set attribute values, only used when initializing
+        """
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+    # End _set method
+
+    @abstractmethod
+    def _make_text(self) -> str:  # pragma: no cover
+        """
+        Make Text, the string representation
+        """
+        pass
+    # End _make_text method
+
+    @abstractmethod
+    def as_tuple(self) -> tuple:  # pragma: no cover
+        """
+        As Tuple
+        """
+        pass
+    # End as_tuple method
+
+    @classmethod
+    def interned(cls, *args: Any, **kwargs: Any) -> Self:
+        """
+        Interned, returns the shared instance for values of the same class
+        which have the same string representation.  Instances are held
+        weakly, they are released once no longer used.
+        """
+        value = cls(*args, **kwargs)
+        key = cls, repr(value)
+        if (existing := _INTERNED.get(key)) is not None:
+            return existing
+        _INTERNED[key] = value
+        return value
+    # End interned method
+# End BaseValue class
+
+
+class BaseRangeDomain(BaseValue):
+    """
+    Base Range Domain
+    """
+    __slots__ = '_min', '_max'
+
+    def __init__(self, minimum: NUMBER, maximum: NUMBER) -> None:
+        """
+        Initialize the BaseRangeDomain class
+        """
+        super().__init__()
+        minimum, maximum = self._validate_range(minimum, maximum)
+        self._set(_min=minimum, _max=maximum)
+    # End init built-in
+
+    def _make_text(self) -> str:
+        """
+        Make Text
+        """
+        return f'{self.minimum} {self.maximum}'
+    # End _make_text method
+
     def _validate_range(self, minimum: NUMBER, maximum: NUMBER) \
             -> tuple[NUMBER, NUMBER]:
         """
@@ -97,10 +203,11 @@ class BaseRangeDomain:
 # End BaseRangeDomain class
 
 
-class BaseUnitValue:
+class BaseUnitValue(BaseValue):
     """
     Base Unit Value
     """
+    __slots__ = '_value', '_unit'
     unit_type: ClassVar[Type[StrEnum]] = StrEnum
 
     def __init__(self, value: NUMBER, unit: StrEnum) -> None:
@@ -108,32 +215,16 @@ class BaseUnitValue:
         Initialize the BaseUnitValue class
         """
         super().__init__()
-        self._value: NUMBER = self._validate_value(value)
-        self._unit: StrEnum = self._validate_unit(unit)
+        self._set(_value=self._validate_value(value),
+                  _unit=self._validate_unit(unit))
     # End init built-in
 
-    def __eq__(self, other: Self) -> bool:
-        """
-        Equality
-        """
-        if not isinstance(other, self.__class__):
-            return False
-        return self.as_tuple() == other.as_tuple()
-    # End eq built-in
-
-    def __hash__(self) -> int:
-        """
-        Hash
-        """
-        return hash(self.as_tuple())
-    # End hash built-in
-
-    def __repr__(self) -> str:
+    def _make_text(self) -> str:
         """
-        String Representation
+        Make Text
         """
         return f'{self._value} {self._unit}'
-    # End repr built-in
+    # End _make_text method
 
     @staticmethod
     def _validate_value(value: NUMBER) -> NUMBER | NoReturn:
@@ -163,43 +254,29 @@ class BaseUnitValue:
 # End BaseUnitValue class
 
 
-class BaseBoundingBox:
+class BaseBoundingBox(BaseValue):
     """
     Base Bounding Box
     """
+    __slots__ = '_x', '_y'
+
     def __init__(self, x: 'XDomain', y: 'YDomain') -> None:
         """
         Initialize the Envelope class
         """
         super().__init__()
-        self._x: XDomain = self._validate_domain(x, XDomain)
-        self._y: YDomain = self._validate_domain(y, YDomain)
+        self._set(_x=self._validate_domain(x, XDomain),
+                  _y=self._validate_domain(y, YDomain))
     # End init built-in
 
-    def __eq__(self, other: Self) -> bool:
-        """
-        Equality
-        """
-        if not isinstance(other, self.__class__):
-            return False
-        return self.as_tuple() == other.as_tuple()
-    # End eq built-in
-
-    def __hash__(self) -> int:
-        """
-        Hash
-        """
-        return hash(self.as_tuple())
-    # End hash built-in
-
     # noinspection PyUnresolvedReferences
-    def __repr__(self):
+    def _make_text(self) -> str:
         """
-        String Representation
+        Make Text
         """
         return (f'{self._x.minimum} {self._y.minimum} '
                 f'{self._x.maximum} {self._y.maximum}')
-    # End repr built-in
+    # End _make_text method
 
     @staticmethod
     def _validate_domain(value, type_) -> BaseRangeDomain | NoReturn:
@@ -226,45 +303,32 @@ class ArealUnitValue(BaseUnitValue):
     """
     Areal Unit Value
     """
+    __slots__ = ()
     unit_type: ClassVar[Type[ArealUnit]] = ArealUnit
 # End ArealUnitValue class
 
 
-class CellSizeXY:
+class CellSizeXY(BaseValue):
     """
     Cell Size XY
     """
+    __slots__ = '_x', '_y'
+
     def __init__(self, x: NUMBER, y: NUMBER) -> None:
         """
         Initialize the CellSizeXY class
         """
         super().__init__()
-        self._x: NUMBER = self._validate_value(x, 'x')
-        self._y: NUMBER = self._validate_value(y, 'y')
+        self._set(_x=self._validate_value(x, 'x'),
+                  _y=self._validate_value(y, 'y'))
     # End init built-in
 
-    def __eq__(self, other: Self) -> bool:
-        """
-        Equality
+    def _make_text(self) -> str:
         """
-        if not isinstance(other, CellSizeXY):
-            return False
-        return self.as_tuple() == other.as_tuple()
-    # End eq built-in
-
-    def __hash__(self) -> int:
-        """
-        Hash
-        """
-        return hash(self.as_tuple())
-    # End hash built-in
-
-    def __repr__(self) -> str:
-        """
-        String Representation
+        Make Text
         """
         return f'{self._x} {self._y}'
-    # End repr built-in
+    # End _make_text method
 
     @staticmethod
     def _validate_value(value: NUMBER, text: str) -> NUMBER | NoReturn:
@@ -291,7 +355,7 @@ class Envelope(BaseBoundingBox):
     """
     Envelope
     """
-
+    __slots__ = ()
 # End Envelope class
 
 
@@ -299,23 +363,25 @@ class Extent(BaseBoundingBox):
     """
     Extent
     """
+    __slots__ = '_crs',
+
     def __init__(self, x: 'XDomain', y: 'YDomain', crs: STRING = None) -> None:
         """
         Initialize the Extent class
         """
         super().__init__(x=x, y=y)
-        self._crs: STRING = self._validate_coordinate_system(crs)
+        self._set(_crs=self._validate_coordinate_system(crs))
     # End init built-in
 
-    def __repr__(self) -> str:
+    def _make_text(self) -> str:
         """
-        String Representation
+        Make Text
         """
-        values = super().__repr__()
+        values = super()._make_text()
         if self._crs:
             return f'{values} {self._crs}'
         return values
-    # End repr built-in
+    # End _make_text method
 
     @staticmethod
     def _validate_coordinate_system(value: STRING) -> STRING | NoReturn:
@@ -343,45 +409,32 @@ class LinearUnitValue(BaseUnitValue):
     """
     Linear Unit Value
     """
+    __slots__ = ()
     unit_type: ClassVar[Type[LinearUnit]] = LinearUnit
 # End LinearUnitValue class
 
 
-class Point:
+class Point(BaseValue):
     """
     Point
     """
+    __slots__ = '_x', '_y'
+
     def __init__(self, x: NUMBER, y: NUMBER) -> None:
         """
         Initialize the Point class
         """
         super().__init__()
-        self._x: NUMBER = self._validate_value(x, 'x')
-        self._y: NUMBER = self._validate_value(y, 'y')
+        self._set(_x=self._validate_value(x, 'x'),
+                  _y=self._validate_value(y, 'y'))
     # End init built-in
 
-    def __eq__(self, other: Self) -> bool:
-        """
-        Equality
-        """
-        if not isinstance(other, self.__class__):
-            return False
-        return self.as_tuple() == other.as_tuple()
-    # End eq built-in
-
-    def __hash__(self) -> int:
-        """
-        Hash
-        """
-        return hash(self.as_tuple())
-    # End hash built-in
-
-    def __repr__(self) -> str:
+    def _make_text(self) -> str:
         """
-        String Representation
+        Make Text
         """
         return f'{self._x} {self._y}'
-    # End repr built-in
+    # End _make_text method
 
     @staticmethod
     def _validate_value(value: NUMBER, text: str) -> NUMBER | NoReturn:
@@ -406,6 +459,7 @@ class TimeUnitValue(BaseUnitValue):
     """
     Time Unit Value
     """
+    __slots__ = ()
     unit_type: ClassVar[Type[TimeUnit]] = TimeUnit
 # End TimeUnitValue class
 
@@ -414,6 +468,7 @@ class MDomain(BaseRangeDomain):
     """
     M Domain
     """
+    __slots__ = ()
 # End MDomain class
 
 
@@ -421,6 +476,7 @@ class XDomain(BaseRangeDomain):
     """
     X Domain
     """
+    __slots__ = ()
 # End XDomain class
 
 
@@ -428,6 +484,7 @@ class YDomain(BaseRangeDomain):
     """
     Y Domain
     """
+    __slots__ = ()
 # End YDomain class
 
 
@@ -435,6 +492,7 @@ class XYDomain(BaseBoundingBox):
     """
     XY Domain
     """
+    __slots__ = ()
 # End XYDomain class
 
 
@@ -442,6 +500,7 @@ class ZDomain(BaseRangeDomain):
     """
     Z Domain
     """
+    __slots__ = ()
 # End ZDomain class
 
 
@@ -4,24 +4,53 @@ Classes for Default Value
 """
 
 
+from abc import abstractmethod
 from enum import StrEnum
-from typing import ClassVar, NoReturn, Self, Type
+from typing import Any, ClassVar, NoReturn, Self, Type
+from weakref import WeakValueDictionary
 
 from autobox.enum import ArealUnit, LinearUnit, TimeUnit
 from autobox.type import NUMBER, STRING
 
 
-class BaseRangeDomain:
+_INTERNED: WeakValueDictionary[tuple[type, str], BaseValue]
+
+
+class BaseValue:
+    """
+    Base Value
+    """
+    __slots__ = '_text', '__weakref__'
+    _text: str
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn: ...
+    def __delattr__(self, name: str) -> NoReturn: ...
+    def __setstate__(self, state: tuple[None, dict[str, Any]]) -> None: ...
+    def __copy__(self) -> Self: ...
+    def __deepcopy__(self, memo: dict) -> Self: ...
+    def __eq__(self, other: Self) -> bool: ...
+    def __hash__(self) -> int: ...
+    def __repr__(self) -> str: ...
+    def _set(self, **values: Any) -> None: ...
+    @abstractmethod
+    def _make_text(self) -> str: ...
+    @abstractmethod
+    def as_tuple(self) -> tuple: ...
+    @classmethod
+    def interned(cls, *args: Any, **kwargs: Any) -> Self: ...
+# End BaseValue class
+
+
+class BaseRangeDomain(BaseValue):
     """
     Base Range Domain
     """
+    __slots__ = '_min', '_max'
     _min: NUMBER
     _max: NUMBER
 
     def __init__(self, minimum: NUMBER, maximum: NUMBER) -> None: ...
-    def __eq__(self, other: Self) -> bool: ...
-    def __hash__(self) -> int: ...
-    def __repr__(self) -> str: ...
+    def _make_text(self) -> str: ...
     def _validate_range(self, minimum: NUMBER, maximum: NUMBER) -> tuple[NUMBER, NUMBER]: ...
     @staticmethod
     def _validate_value(value: NUMBER, text: str) -> NUMBER | NoReturn: ...
@@ -33,16 +62,18 @@ class BaseRangeDomain:
 # End BaseRangeDomain class
 
 
-class BaseUnitValue:
+class BaseUnitValue(BaseValue):
     """
     Base Unit Value
     """
+    __slots__ = '_value', '_unit'
     unit_type: ClassVar[Type[StrEnum]]
 
     _value: NUMBER
     _unit: StrEnum
 
     def __init__(self, value: NUMBER, unit: StrEnum) -> None: ...
+    def _make_text(self) -> str: ...
     @staticmethod
     def _validate_value(value: NUMBER) -> NUMBER | NoReturn: ...
     def _validate_unit(self, value: StrEnum) -> StrEnum | NoReturn: ...
@@ -50,17 +81,16 @@ class BaseUnitValue:
 # End BaseUnitValue class
 
 
-class BaseBoundingBox:
+class BaseBoundingBox(BaseValue):
     """
     Base Bounding Box
     """
+    __slots__ = '_x', '_y'
     _x: XDomain
     _y: YDomain
 
     def __init__(self, x: XDomain, y: YDomain) -> None: ...
-    def __eq__(self, other) -> bool: ...
-    def __hash__(self) -> int: ...
-    def __repr__(self): ...
+    def _make_text(self) -> str: ...
     @staticmethod
     def _validate_domain(value, type_) -> BaseRangeDomain | NoReturn: ...
     def as_tuple(self) -> tuple[NUMBER, NUMBER, NUMBER, NUMBER]: ...
@@ -71,6 +101,7 @@ class ArealUnitValue(BaseUnitValue):
     """
     Areal Unit Value
     """
+    __slots__ = ()
     _unit: ArealUnit
 
     def __init__(self, value: NUMBER, unit: ArealUnit) -> None: ...
@@ -85,6 +116,7 @@ class Envelope(BaseBoundingBox):
     """
     Envelope
     """
+    __slots__ = ()
 # End Envelope class
 
 
@@ -92,25 +124,26 @@ class Extent(BaseBoundingBox):
     """
     Extent
     """
+    __slots__ = '_crs',
     _crs: STRING
 
     def __init__(self, x: XDomain, y: YDomain, crs: STRING = None) -> None: ...
+    def _make_text(self) -> str: ...
     @staticmethod
     def _validate_coordinate_system(value: STRING) -> STRING | NoReturn: ...
 # End Extent class
 
 
-class CellSizeXY:
+class CellSizeXY(BaseValue):
     """
     Cell Size XY
     """
+    __slots__ = '_x', '_y'
     _x: NUMBER
     _y: NUMBER
 
     def __init__(self, x: NUMBER, y: NUMBER) -> None: ...
-    def __eq__(self, other: Self) -> bool: ...
-    def __hash__(self) -> int: ...
-    def __repr__(self) -> str: ...
+    def _make_text(self) -> str: ...
     @staticmethod
     def _validate_value(value: NUMBER, text: str) -> NUMBER | NoReturn: ...
     def as_tuple(self) -> tuple[NUMBER, NUMBER]: ...
@@ -121,6 +154,7 @@ class LinearUnitValue(BaseUnitValue):
     """
     Linear Unit Value
     """
+    __slots__ = ()
     _unit: LinearUnit
 
     def __init__(self, value: NUMBER, unit: LinearUnit) -> None: ...
@@ -134,17 +168,16 @@ class LinearUnitValue(BaseUnitValue):
 class MDomain(BaseRangeDomain): ...
 
 
-class Point:
+class Point(BaseValue):
     """
     Point
     """
+    __slots__ = '_x', '_y'
     _x: NUMBER
     _y: NUMBER
 
     def __init__(self, x: NUMBER, y: NUMBER) -> None: ...
-    def __eq__(self, other: Self) -> bool: ...
-    def __hash__(self) -> int: ...
-    def __repr__(self) -> str: ...
+    def _make_text(self) -> str: ...
     @staticmethod
     def _validate_value(value: NUMBER, text: str) -> NUMBER | NoReturn: ...
     def as_tuple(self) -> tuple[NUMBER, NUMBER]: ...
@@ -155,6 +188,7 @@ class TimeUnitValue(BaseUnitValue):
     """
     Time Unit Value
     """
+    __slots__ = ()
     _unit: TimeUnit
 
     def __init__(self, value: NUMBER, unit: TimeUnit) -> None: ...
@@ -173,6 +207,7 @@ class XYDomain(BaseBoundingBox):
     """
     XY Domain
     """
+    __slots__ = ()
 # End XYDomain class
 
 
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Diagnostics, collect validation problems rather than raising on the first
+"""
+
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Generator, NoReturn
+
+from autobox.constant import DOT
+from autobox.type import Diagnostic
+
+
+__all__ = ['collect', 'has_diagnostics', 'is_collecting', 'raise_or_collect',
+           'report', 'scope']
+
+
+_DIAGNOSTICS: ContextVar[list[Diagnostic] | None] = ContextVar(
+    'diagnostics', default=None)
+_SCOPE: ContextVar[tuple[str, ...]] = ContextVar('scope', default=())
+
+
+@contextmanager
+def collect() -> Generator[list[Diagnostic], None, None]:
+    """
+    Collect diagnostics, within the context validation problems are recorded
+    and the offending value is replaced by a fallback so that construction
+    and saving keep going.  Yields the list the diagnostics are added to.
+    """
+    diagnostics = []
+    token = _DIAGNOSTICS.set(diagnostics)
+    try:
+        yield diagnostics
+    finally:
+        _DIAGNOSTICS.reset(token)
+# End collect function
+
+
+@contextmanager
+def scope(name: str) -> Generator[None, None, None]:
+    """
+    Scope, prefixes the location of diagnostics recorded within the context,
+    e.g. the tool name while its parameters are built.
+    """
+    token = _SCOPE.set((*_SCOPE.get(), name))
+    try:
+        yield
+    finally:
+        _SCOPE.reset(token)
+# End scope function
+
+
+def is_collecting() -> bool:
+    """
+    Is Collecting, True when diagnostics are being collected
+    """
+    return _DIAGNOSTICS.get() is not None
+# End is_collecting function
+
+
+def has_diagnostics() -> bool:
+    """
+    Has Diagnostics, True when diagnostics are being collected and at least
+    one problem has been recorded
+    """
+    return bool(_DIAGNOSTICS.get())
+# End has_diagnostics function
+
+
+def _make_location(location: Any) -> str:
+    """
+    Make Location, the dotted object path including the current scope
+    """
+    parts = (*_SCOPE.get(), str(location) if location is not None else '')
+    return DOT.join(part for part in parts if part)
+# End _make_location function
+
+
+def report(location: Any, rule: str, message: str, value: Any = None) -> None:
+    """
+    Report a problem which does not raise, e.g. values dropped by a filter,
+    nothing happens unless diagnostics are being collected.
+    """
+    if (diagnostics := _DIAGNOSTICS.get()) is None:
+        return
+    diagnostics.append(Diagnostic(
+        location=_make_location(location), rule=rule, message=message,
+        value=value))
+# End report function
+
+
+def raise_or_collect(error: Exception, location: Any, rule: str,
+                     value: Any = None) -> None | NoReturn:
+    """
+    Raise or Collect, raises the error unless diagnostics are being
+    collected in which case it is recorded and the caller carries on with a
+    fallback value.
+    """
+    if (diagnostics := _DIAGNOSTICS.get()) is None:
+        raise error
+    diagnostics.append(Diagnostic(
+        location=_make_location(location), rule=rule, message=str(error),
+        value=value))
+# End raise_or_collect function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Directory Layout, exploded toolbox output and packing into an archive
+"""
+
+
+from os import replace
+from pathlib import Path
+from typing import NoReturn
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from autobox.archive import make_sibling_path
+from autobox.constant import ATBX, DIRECTORY, TOOLBOX_CONTENT
+from autobox.writer import DirectoryWriter, list_files
+
+
+__all__ = ['pack', 'sync_folder']
+
+
+def sync_folder(source: Path, target: Path) -> list[str]:
+    """
+    Sync Folder, files in the target are written only when their bytes
+    differ from the source, files no longer in the source are removed.
+    Returns the relative paths of the files which were written or removed.
+    """
+    with DirectoryWriter(target, prune=True) as writer:
+        for name, path in list_files(source).items():
+            writer.write_bytes(name, path.read_bytes())
+    return writer.changed
+# End sync_folder function
+
+
+def pack(folder: Path, path: Path | None = None,
+         overwrite: bool = False) -> Path | NoReturn:
+    """
+    Pack a toolbox saved with the directory layout into an archive, the
+    archive is written alongside the folder unless a path is given.
+
+    :param folder: Folder holding the toolbox content and tool folders.
+    :param path: Optional path of the archive.
+    :param overwrite: Overwrite the archive if it exists.
+    """
+    folder = Path(folder)
+    if not folder.joinpath(TOOLBOX_CONTENT).is_file():
+        raise FileNotFoundError(f'Toolbox {DIRECTORY} not found: {folder}')
+    if path is None:
+        path = folder.parent.joinpath(f'{folder.name}{ATBX}')
+    path = Path(path)
+    if path.exists() and not overwrite:
+        raise FileExistsError(f'File already exists: {path}')
+    temporary = make_sibling_path(path)
+    try:
+        with ZipFile(temporary, mode='w', compression=ZIP_DEFLATED) as zout:
+            for name, full_path in list_files(folder).items():
+                zout.write(full_path, name)
+        replace(temporary, path)
+    finally:
+        temporary.unlink(missing_ok=True)
+    return path
+# End pack function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
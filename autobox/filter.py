@@ -5,23 +5,31 @@ Enumerations
 
 
 from abc import abstractmethod
+from array import array
 from enum import StrEnum
+from itertools import islice
 from math import isfinite
 from numbers import Real
-from typing import ClassVar, Type
+from operator import eq
+from pathlib import PurePath
+from typing import Any, ClassVar, Iterable, Self, Type
 
 
 from autobox.constant import (
-    DOLLAR_RC, DOT, DomainContentKeys, GP_AREAL_UNIT, GP_CODED_VALUE_DOMAIN,
-    GP_DOUBLE, GP_FEATURE_CLASS_DOMAIN, GP_FIELD_DOMAIN, GP_FILE_DOMAIN,
-    GP_LINEAR_UNIT, GP_LONG, GP_RANGE_DOMAIN, GP_TIME_UNIT, GP_WORKSPACE_DOMAIN,
-    ItemsContentKeys, ParameterContentKeys, TRAVEL_MODES_STUB, XML,
+    BYTE_ORDERS, DOLLAR_RC, DOT, DOUBLE_TYPECODE, DiagnosticRules,
+    DomainContentKeys, FLOAT_FORMATS, FLOAT_TYPECODES, GP_AREAL_UNIT,
+    GP_CODED_VALUE_DOMAIN, GP_DOUBLE, GP_FEATURE_CLASS_DOMAIN,
+    GP_FIELD_DOMAIN, GP_FILE_DOMAIN, GP_LINEAR_UNIT, GP_LONG,
+    GP_RANGE_DOMAIN, GP_TIME_UNIT, GP_WORKSPACE_DOMAIN, INTEGER_FORMATS,
+    ItemsContentKeys, LONG_TYPECODE, NATIVE_BYTE_ORDERS, ParameterContentKeys,
+    SIGNED_TYPECODES, TRAVEL_MODES_STUB, UNSIGNED_TYPECODES, XML,
     XML_SERIALIZE)
+from autobox.diagnostic import is_collecting, report
 from autobox.enum import (
     ArealUnit, FieldType, GeometryType, LinearUnit, TimeUnit,
     TravelModeUnitType, WorkspaceType)
 from autobox.type import (
-    MAP_DICT_STR_LIST, MAP_STR, MAP_STR_LIST, NUMBER, STRING, STRINGS)
+    MAP_DICT_STR_LIST, MAP_STR, MAP_STR_LIST, NUMBER, NUMBERS, STRING, STRINGS)
 from autobox.util import unique
 
 
@@ -31,16 +39,55 @@ __all__ = ['ArealUnitFilter', 'FeatureClassTypeFilter', 'FieldTypeFilter',
 
 class AbstractFilter:
     """
-    Abstract Filter
+    Abstract Filter, frozen once initialized so that the serialized domain
+    can be cached and a filter shared between parameters.
     """
     def __init__(self, values: list | tuple) -> None:
         """
         Initialize the AbstractEnumerationFilter class
         """
         super().__init__()
-        self._values: list = self._validate_values(values)
+        self._values: tuple = self._make_values(
+            self._validate_values(values) or ())
+        self._cache: dict[STRING, Any] = {}
+        self._frozen: bool = True
     # End init built-in
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Set Attribute, not allowed once the filter is initialized
+        """
+        if getattr(self, '_frozen', False):
+            raise AttributeError(
+                f'{self.__class__.__name__} is frozen, cannot set {name}')
+        super().__setattr__(name, value)
+    # End setattr built-in
+
+    def __copy__(self) -> Self:
+        """
+        Copy, the same instance since filters are frozen
+        """
+        return self
+    # End copy built-in
+
+    def __deepcopy__(self, memo: dict) -> Self:
+        """
+        Deep Copy, the same instance since filters are frozen
+        """
+        return self
+    # End deepcopy built-in
+
+    def _report_invalid(self, values: list | tuple, invalid: list) -> None:
+        """
+        Report Invalid values which are dropped, only recorded when
+        collecting diagnostics.
+        """
+        if not invalid:
+            return
+        report(self.__class__.__name__, rule=DiagnosticRules.filter_value,
+               message=f'Invalid values dropped: {invalid}', value=values)
+    # End _report_invalid method
+
     @abstractmethod
     def _validate_values(self, values: list | tuple) -> list:  # pragma: no cover
         """
@@ -57,19 +104,48 @@ class AbstractFilter:
         pass
     # End _serialize method
 
+    # noinspection PyMethodMayBeStatic
+    def _make_values(self, values: list | tuple) -> tuple:
+        """
+        Make Values, the validated values are stored in a tuple
+        """
+        return tuple(values)
+    # End _make_values method
+
+    # noinspection PyMethodMayBeStatic
+    def _make_cache_key(self, name: STRING) -> STRING:
+        """
+        Make Cache Key, the serialized domain does not depend on the name
+        """
+        return None
+    # End _make_cache_key method
+
     @property
-    def values(self) -> list:
+    def values(self) -> tuple:
         """
         Values
         """
         return self._values
     # End values property
 
+    # noinspection PyMethodMayBeStatic
+    def accepts(self, value: Any) -> bool:
+        """
+        Accepts, True when the value is allowed by the filter, filters which
+        do not restrict values accept everything.
+        """
+        return True
+    # End accepts method
+
     def serialize(self, name: STRING = None) -> dict:
         """
-        Serialize the Filter
+        Serialize the Filter, the result is cached and shared so it must not
+        be modified.
         """
-        return self._serialize(name)
+        key = self._make_cache_key(name)
+        if key not in self._cache:
+            self._cache[key] = self._serialize(name)
+        return self._cache[key]
     # End serialize method
 # End AbstractFilter class
 
@@ -88,6 +164,8 @@ class AbstractEnumerationFilter(AbstractFilter):
         """
         if not isinstance(values, (list, tuple)):
             values = values,
+        self._report_invalid(values, invalid=[
+            v for v in values if not isinstance(v, self.enumeration)])
         values = [v for v in values if isinstance(v, self.enumeration)]
         return unique([v for v in values if v in self.enumeration])
     # End _validate_values method
@@ -106,17 +184,27 @@ class BaseCodedDomainFilter(AbstractEnumerationFilter):
     """
     Base Enumeration Filter
     """
+    _items: ClassVar[dict[StrEnum, MAP_STR]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Initialize Subclass, the item of each enumeration member is built
+        once per class.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._items = {member: {ItemsContentKeys.type: cls.keyword,
+                               ItemsContentKeys.value: member.value,
+                               ItemsContentKeys.code: member.value}
+                      for member in cls.enumeration}
+    # End init subclass built-in
+
     def _serialize(self, name: STRING = None) -> dict[str, MAP_STR_LIST]:
         """
         Serialize
         """
         if not self.values:
             return {}
-        items = []
-        for value in self.values:
-            items.append({ItemsContentKeys.type: self.keyword,
-                          ItemsContentKeys.value: value.value,
-                          ItemsContentKeys.code: value.value})
+        items = [self._items[value] for value in self.values]
         return {ParameterContentKeys.domain: {
             DomainContentKeys.type: GP_CODED_VALUE_DOMAIN,
             DomainContentKeys.items: items}}
@@ -197,6 +285,8 @@ class FileTypeFilter(AbstractEnumerationFilter):
         """
         if not isinstance(values, (list, tuple)):
             values = values,
+        self._report_invalid(values, invalid=[
+            v for v in values if not isinstance(v, str) or not v.strip()])
         values = [v.strip() for v in values if isinstance(v, str)]
         values = [v.lstrip(DOT) for v in values]
         return unique([v for v in values if v])
@@ -212,6 +302,18 @@ class FileTypeFilter(AbstractEnumerationFilter):
             DomainContentKeys.type: GP_FILE_DOMAIN,
             DomainContentKeys.file_types: list(self.values)}}
     # End _serialize method
+
+    def accepts(self, value: Any) -> bool:
+        """
+        Accepts, True when the path has one of the file types
+        """
+        if not self.values:
+            return True
+        if not isinstance(value, PurePath):
+            return False
+        suffix = value.suffix.lstrip(DOT).casefold()
+        return any(suffix == v.casefold() for v in self.values)
+    # End accepts method
 # End FileTypeFilter class
 
 
@@ -314,6 +416,16 @@ class AbstractRangeFilter(AbstractFilter):
             DomainContentKeys.minimum: repr(minimum),
             DomainContentKeys.maximum: repr(maximum)}}
     # End _serialize method
+
+    def accepts(self, value: Any) -> bool:
+        """
+        Accepts, True when the value is within the range
+        """
+        if not self.values:
+            return True
+        minimum, maximum = self.values
+        return isinstance(value, Real) and minimum <= value <= maximum
+    # End accepts method
 # End AbstractRangeFilter class
 
 
@@ -325,7 +437,9 @@ class LongRangeFilter(AbstractRangeFilter):
         """
         Validate Values
         """
-        return self._validate_and_convert(values, type_=int)
+        if not (validated := self._validate_and_convert(values, type_=int)):
+            self._report_invalid(values, invalid=list(values))
+        return validated
     # End _validate_values method
 # End LongRangeFilter class
 
@@ -338,25 +452,141 @@ class DoubleRangeFilter(AbstractRangeFilter):
         """
         Validate Values
         """
-        return self._validate_and_convert(values, type_=float)
+        if not (validated := self._validate_and_convert(values, type_=float)):
+            self._report_invalid(values, invalid=list(values))
+        return validated
     # End _validate_values method
 # End DoubleRangeFilter class
 
 
 class AbstractNumberValueFilter(AbstractFilter):
     """
-    Abstract Number Value Filter
+    Abstract Number Value Filter, values are stored in an array of machine
+    numbers rather than as Python objects.  Values can be specified using a
+    list, tuple, or any object supporting the buffer protocol such as
+    array.array or a numpy array, buffers are validated in bulk.
     """
     keyword: ClassVar[str] = ''
+    typecode: ClassVar[str] = ''
+    number_type: ClassVar[Type[NUMBER]] = int
 
     @abstractmethod
-    def _validate_values(self, values: list | tuple) -> list:  # pragma: no cover
+    def _validate_values(self, values: NUMBERS) -> list | array:  # pragma: no cover
         """
         Validate Values
         """
         pass
     # End _validate_values method
 
+    def _validate_numbers(self, values: NUMBERS) -> list | array:
+        """
+        Validate Numbers, buffers are validated in bulk, other values are
+        checked one by one.
+        """
+        if (view := self._as_buffer(values)) is not None:
+            try:
+                return self._validate_buffer(view)
+            except OverflowError:
+                values = view.tolist()
+        if is_collecting():
+            self._report_invalid(values, invalid=self._find_invalid(values))
+        return self._validate_and_convert(values, type_=self.number_type)
+    # End _validate_numbers method
+
+    @staticmethod
+    def _as_buffer(values: Any) -> memoryview | None:
+        """
+        As Buffer, a one-dimensional view of numbers when the values support
+        the buffer protocol, otherwise None.  Formats with a byte order
+        prefix (e.g. '<q' from numpy) are converted to native numbers.
+        """
+        if isinstance(values, (str, bytes, bytearray)):
+            return None
+        try:
+            view = memoryview(values)
+        except TypeError:
+            return None
+        if view.ndim != 1:
+            return None
+        order, code = view.format[:-1], view.format[-1:]
+        if code not in INTEGER_FORMATS | FLOAT_FORMATS:
+            return None
+        if not order:
+            return view
+        if order not in BYTE_ORDERS:
+            return None
+        return AbstractNumberValueFilter._as_native(view, order, code=code)
+    # End _as_buffer method
+
+    @staticmethod
+    def _as_native(view: memoryview, order: str, code: str) \
+            -> memoryview | None:
+        """
+        As Native, a view of the numbers in native byte order using the
+        array type of the same kind and size, None when there is no such
+        type.
+        """
+        if code in FLOAT_FORMATS:
+            typecodes = FLOAT_TYPECODES
+        elif code.islower():
+            typecodes = SIGNED_TYPECODES
+        else:
+            typecodes = UNSIGNED_TYPECODES
+        for typecode in typecodes:
+            if array(typecode).itemsize != view.itemsize:
+                continue
+            values = array(typecode, view.tobytes())
+            if order not in NATIVE_BYTE_ORDERS:
+                values.byteswap()
+            return memoryview(values)
+        return None
+    # End _as_native method
+
+    def _validate_buffer(self, view: memoryview) -> array:
+        """
+        Validate Buffer, values are checked, converted, and made unique in
+        bulk.  When the memory layout matches the array the bytes are copied
+        as is, e.g. signed 64-bit integers or doubles.  Floats are checked
+        using their sum (which is not finite when a value is not finite) and
+        repeats using a sorted copy, values are only looked at one by one
+        when there is something to remove.
+        """
+        typecode = self.typecode
+        values = array(typecode)
+        is_float = view.format in FLOAT_FORMATS
+        if is_float and not isfinite(sum(view, 0.0)):
+            # NOTE a sum of finite values can overflow, nothing is reported
+            numbers = [v for v in view if isfinite(v)]
+            if is_collecting() and len(numbers) != len(view):
+                self._report_invalid(view.tolist(), invalid=[
+                    v for v in view if not isfinite(v)])
+        elif (view.c_contiguous and view.itemsize == values.itemsize and
+              view.format.islower() and
+              is_float == (typecode in FLOAT_FORMATS)):
+            # NOTE lower case formats are signed integers or floats
+            values.frombytes(view.cast('B'))
+            numbers = ()
+        else:
+            numbers = view
+        if is_float and self.number_type is int:
+            numbers = map(int, numbers)
+        values.extend(numbers)
+        ordered = sorted(values)
+        if any(map(eq, ordered, islice(ordered, 1, None))):
+            values = array(typecode, dict.fromkeys(values))
+        return values
+    # End _validate_buffer method
+
+    @staticmethod
+    def _find_invalid(values: list | tuple) -> list:
+        """
+        Find Invalid values, not numbers or not finite
+        """
+        if not isinstance(values, (list, tuple)):
+            return [values]
+        return [v for v in values if not isinstance(v, Real) or not isfinite(v)]
+    # End _find_invalid method
+
     @staticmethod
     def _validate_and_convert(values: list | tuple, type_: Type[NUMBER]) -> list:
         """
@@ -372,14 +602,29 @@ class AbstractNumberValueFilter(AbstractFilter):
             return []
     # End _validate_and_convert method
 
+    def _make_values(self, values: list | array) -> array | tuple:
+        """
+        Make Values, stored in an array, values which do not fit in the
+        array (integers larger than 64-bit) are kept in a tuple.
+        """
+        if not self.typecode:
+            return tuple(values)
+        if isinstance(values, array) and values.typecode == self.typecode:
+            return values
+        try:
+            return array(self.typecode, values)
+        except OverflowError:
+            return tuple(values)
+    # End _make_values method
+
     def _serialize(self, name: STRING = None) -> MAP_STR_LIST:
         """
         Serialize
         """
-        if not self.values:
+        if not self._values:
             return {}
         items = []
-        for value in self.values:
+        for value in self._values:
             items.append({ItemsContentKeys.type: self.keyword,
                           ItemsContentKeys.value: repr(value),
                           ItemsContentKeys.code: repr(value)})
@@ -387,6 +632,23 @@ class AbstractNumberValueFilter(AbstractFilter):
             DomainContentKeys.type: GP_CODED_VALUE_DOMAIN,
             DomainContentKeys.items: items}}
     # End _serialize method
+
+    @property
+    def values(self) -> tuple[NUMBER, ...]:
+        """
+        Values, made from the stored numbers on each access
+        """
+        if isinstance(self._values, tuple):
+            return self._values
+        return tuple(self._values)
+    # End values property
+
+    def accepts(self, value: Any) -> bool:
+        """
+        Accepts, True when the value is one of the values
+        """
+        return not self._values or value in self._values
+    # End accepts method
 # End AbstractNumberValueFilter class
 
 
@@ -395,12 +657,14 @@ class LongValueFilter(AbstractNumberValueFilter):
     Long Value Filter
     """
     keyword: ClassVar[str] = GP_LONG
+    typecode: ClassVar[str] = LONG_TYPECODE
+    number_type: ClassVar[Type[int]] = int
 
-    def _validate_values(self, values: list[int] | tuple[int, ...]) -> list[int]:
+    def _validate_values(self, values: NUMBERS) -> list[int] | array:
         """
         Validate Values
         """
-        return self._validate_and_convert(values, type_=int)
+        return self._validate_numbers(values)
     # End _validate_values method
 # End LongValueFilter class
 
@@ -410,27 +674,39 @@ class DoubleValueFilter(AbstractNumberValueFilter):
     Double Value Filter
     """
     keyword: ClassVar[str] = GP_DOUBLE
+    typecode: ClassVar[str] = DOUBLE_TYPECODE
+    number_type: ClassVar[Type[float]] = float
 
-    def _validate_values(self, values: list[float] | tuple[float, ...]) -> list[float]:
+    def _validate_values(self, values: NUMBERS) -> list[float] | array:
         """
         Validate Values
         """
-        return self._validate_and_convert(values, type_=float)
+        return self._validate_numbers(values)
     # End _validate_values method
 # End DoubleValueFilter class
 
 
 class StringValueFilter(AbstractFilter):
     """
-    String Value Filter
+    String Value Filter, designed for large lists of values (tens of
+    thousands) where validation and serialization are done in bulk.
     """
-    def _validate_values(self, values: STRINGS) -> list[str]:
+    def _validate_values(self, values: STRINGS | Iterable[str]) -> list[str]:
         """
-        Validate Values
+        Validate Values, strings are de-duplicated in a single pass, invalid
+        values are only gathered when collecting diagnostics.
         """
-        if not isinstance(values, (list, tuple)):
+        if isinstance(values, str) or not isinstance(values, Iterable):
             values = values,
-        return unique([v for v in values if isinstance(v, str)])
+        elif not isinstance(values, (list, tuple)):
+            values = tuple(values)
+        if is_collecting():
+            self._report_invalid(values, invalid=[
+                v for v in values if not isinstance(v, str)])
+        try:
+            return [v for v in dict.fromkeys(values) if isinstance(v, str)]
+        except TypeError:
+            return unique([v for v in values if isinstance(v, str)])
     # End _validate_values method
 
     def _serialize(self, name: STRING = None) -> tuple[MAP_STR_LIST, MAP_STR]:
@@ -441,25 +717,76 @@ class StringValueFilter(AbstractFilter):
             return {}, {}
         items = []
         resources = {}
-        name_domain = f'{name.casefold()}{DOT}{ParameterContentKeys.domain}'
+        prefix = f'{name.casefold()}{DOT}{ParameterContentKeys.domain}{DOT}'
+        value_key, code_key = ItemsContentKeys.value, ItemsContentKeys.code
         for value in self.values:
-            code = f'{name_domain}{DOT}{value}'
-            items.append({ItemsContentKeys.value: value,
-                          ItemsContentKeys.code: f'{DOLLAR_RC}{code}'})
+            code = f'{prefix}{value}'
+            items.append({value_key: value, code_key: f'{DOLLAR_RC}{code}'})
             resources[code] = value
         return {ParameterContentKeys.domain: {
             DomainContentKeys.type: GP_CODED_VALUE_DOMAIN,
             DomainContentKeys.items: items}}, resources
     # End _serialize method
 
+    def _make_cache_key(self, name: STRING) -> STRING:
+        """
+        Make Cache Key, codes and resources are named after the parameter
+        """
+        if not isinstance(name, str):
+            return None
+        return name.casefold()
+    # End _make_cache_key method
+
     def serialize(self, name: STRING = None) -> tuple[MAP_STR_LIST, MAP_STR]:
         """
-        Serialize the Filter
+        Serialize the Filter, the result is cached and shared so it must not
+        be modified.
         """
-        return self._serialize(name)
+        return super().serialize(name)
     # End serialize method
+
+    def accepts(self, value: Any) -> bool:
+        """
+        Accepts, True when the value is one of the values
+        """
+        return not self.values or value in self.values
+    # End accepts method
 # End StringValueFilter class
 
 
+FILTER_KEYWORDS: dict[Type[AbstractFilter], str] = {
+    FileTypeFilter: GP_FILE_DOMAIN,
+    LongRangeFilter: GP_RANGE_DOMAIN,
+    DoubleRangeFilter: GP_RANGE_DOMAIN,
+    StringValueFilter: GP_CODED_VALUE_DOMAIN,
+}
+
+
+def filter_keyword(cls: Type[AbstractFilter]) -> str:
+    """
+    Filter Keyword, the domain keyword a filter class is serialized with,
+    coded value domains are identified by the type of their items.
+    """
+    if keyword := FILTER_KEYWORDS.get(cls):
+        return keyword
+    return cls.keyword
+# End filter_keyword function
+
+
+def domain_keyword(domain: dict[str, Any]) -> STRING:
+    """
+    Domain Keyword, comparable to the filter keyword
+    """
+    keyword = domain.get(DomainContentKeys.type)
+    if keyword != GP_CODED_VALUE_DOMAIN:
+        return keyword
+    for item in domain.get(DomainContentKeys.items) or []:
+        if isinstance(item, dict) and (
+                item_keyword := item.get(ItemsContentKeys.type)):
+            return item_keyword
+    return keyword
+# End domain_keyword function
+
+
 if __name__ == '__main__':  # pragma: no cover
     pass
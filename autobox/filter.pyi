@@ -5,16 +5,17 @@ Filter Stubs
 
 
 from abc import abstractmethod
+from array import array
 from enum import StrEnum
 from numbers import Real
-from typing import ClassVar, Type
+from typing import Any, ClassVar, Iterable, Self, Type
 
 from autobox.enum import (
     ArealUnit, FieldType, GeometryType, LinearUnit, TimeUnit,
     TravelModeUnitType, WorkspaceType)
 from autobox.type import (
     AREAL_UNITS, FIELD_TYPES, GEOMETRY_TYPES, LINEAR_UNITS, MAP_DICT_STR_LIST,
-    MAP_STR, MAP_STR_LIST, NUMBER, STRING, STRINGS, TIME_UNITS, TRAVEL_MODES,
+    MAP_STR, MAP_STR_LIST, NUMBER, NUMBERS, STRING, STRINGS, TIME_UNITS, TRAVEL_MODES,
     WORKSPACE_TYPES)
 
 
@@ -22,15 +23,24 @@ class AbstractFilter:
     """
     Abstract Filter
     """
-    _values: list
+    _values: tuple
+    _cache: dict[STRING, Any]
+    _frozen: bool
 
     def __init__(self, values: list | tuple) -> None: ...
+    def __setattr__(self, name: str, value: Any) -> None: ...
+    def __copy__(self) -> Self: ...
+    def __deepcopy__(self, memo: dict) -> Self: ...
+    def _report_invalid(self, values: list | tuple, invalid: list) -> None: ...
     @abstractmethod
     def _validate_values(self, values: list | tuple) -> list: ...
     @abstractmethod
     def _serialize(self, name: STRING = None) -> dict: ...
+    def _make_values(self, values: list | tuple) -> tuple: ...
+    def _make_cache_key(self, name: STRING) -> STRING: ...
     @property
-    def values(self) -> list: ...
+    def values(self) -> tuple: ...
+    def accepts(self, value: Any) -> bool: ...
     def serialize(self, name: STRING = None) -> dict: ...
 # End AbstractFilter class
 
@@ -41,13 +51,13 @@ class AbstractEnumerationFilter(AbstractFilter):
     """
     keyword: ClassVar[str]
     enumeration: ClassVar[Type[StrEnum]]
-    _values: list[StrEnum]
+    _values: tuple[StrEnum, ...]
 
     def __init__(self, values: list[StrEnum] | tuple[StrEnum, ...]) -> None: ...
     def _validate_values(self, values: list[StrEnum] | tuple[StrEnum, ...]) -> list[StrEnum]: ...
     def _serialize(self, name: STRING = None) -> dict: ...
     @property
-    def values(self) -> list[StrEnum]: ...
+    def values(self) -> tuple[StrEnum, ...]: ...
     def serialize(self, name: STRING = None) -> dict: ...
 # End AbstractEnumerationFilter class
 
@@ -58,13 +68,15 @@ class BaseCodedDomainFilter(AbstractEnumerationFilter):
     """
     keyword: ClassVar[str]
     enumeration: ClassVar[Type[StrEnum]]
-    _values: list[StrEnum]
+    _items: ClassVar[dict[StrEnum, MAP_STR]]
+    _values: tuple[StrEnum, ...]
 
+    def __init_subclass__(cls, **kwargs: Any) -> None: ...
     def __init__(self, values: list[StrEnum] | tuple[StrEnum, ...]) -> None: ...
     def _validate_values(self, values: list[StrEnum] | tuple[StrEnum, ...]) -> list[StrEnum]: ...
     def _serialize(self, name: STRING = None) -> dict[str, list[MAP_STR]]: ...
     @property
-    def values(self) -> list[StrEnum]: ...
+    def values(self) -> tuple[StrEnum, ...]: ...
     def serialize(self, name: STRING = None) -> dict[str, list[MAP_STR]]: ...
 # End BaseCodedDomainFilter class
 
@@ -76,13 +88,13 @@ class BaseTypeListFilter(AbstractEnumerationFilter):
     keyword: ClassVar[str]
     items_keyword: ClassVar[str]
     enumeration: ClassVar[Type[StrEnum]]
-    _values: list[StrEnum]
+    _values: tuple[StrEnum, ...]
 
     def __init__(self, values: list[StrEnum] | tuple[StrEnum, ...]) -> None: ...
     def _validate_values(self, values: list[StrEnum] | tuple[StrEnum, ...]) -> list[StrEnum]: ...
     def _serialize(self, name: STRING = None) -> dict[str, list[MAP_STR]]: ...
     @property
-    def values(self) -> list[StrEnum]: ...
+    def values(self) -> tuple[StrEnum, ...]: ...
     def serialize(self, name: STRING = None) -> dict[str, list[MAP_STR]]: ...
 # End BaseTypeListFilter class
 
@@ -93,13 +105,13 @@ class ArealUnitFilter(BaseCodedDomainFilter):
     """
     keyword: ClassVar[str]
     enumeration: ClassVar[Type[ArealUnit]]
-    _values: list[ArealUnit]
+    _values: tuple[ArealUnit, ...]
 
     def __init__(self, values: AREAL_UNITS) -> None: ...
     def _validate_values(self, values: AREAL_UNITS) -> list[ArealUnit]: ...
     def _serialize(self, name: STRING = None) -> dict[str, MAP_STR_LIST]: ...
     @property
-    def values(self) -> list[ArealUnit]: ...
+    def values(self) -> tuple[ArealUnit, ...]: ...
     def serialize(self, name: STRING = None) -> dict[str, MAP_STR_LIST]: ...
 # End ArealUnitFilter class
 
@@ -111,13 +123,13 @@ class FeatureClassTypeFilter(BaseTypeListFilter):
     keyword: ClassVar[str]
     items_keyword: ClassVar[str]
     enumeration: ClassVar[Type[GeometryType]]
-    _values: list[FieldType]
+    _values: tuple[FieldType, ...]
 
     def __init__(self, values: GEOMETRY_TYPES) -> None: ...
     def _validate_values(self, values: GEOMETRY_TYPES) -> list[GeometryType]: ...
     def _serialize(self, name: STRING = None) -> MAP_STR_LIST: ...
     @property
-    def values(self) -> list[GeometryType]: ...
+    def values(self) -> tuple[GeometryType, ...]: ...
     def serialize(self, name: STRING = None) -> MAP_STR_LIST: ...
 # End FeatureClassTypeFilter class
 
@@ -129,13 +141,13 @@ class FieldTypeFilter(BaseTypeListFilter):
     keyword: ClassVar[str]
     items_keyword: ClassVar[str]
     enumeration: ClassVar[Type[FieldType]]
-    _values: list[FieldType]
+    _values: tuple[FieldType, ...]
 
     def __init__(self, values: FIELD_TYPES) -> None: ...
     def _validate_values(self, values: FIELD_TYPES) -> list[FieldType]: ...
     def _serialize(self, name: STRING = None) -> MAP_STR_LIST: ...
     @property
-    def values(self) -> list[FieldType]: ...
+    def values(self) -> tuple[FieldType, ...]: ...
     def serialize(self, name: STRING = None) -> MAP_STR_LIST: ...
 # End FieldTypeFilter class
 
@@ -144,13 +156,14 @@ class FileTypeFilter(BaseTypeListFilter):
     """
     Field Type Filter
     """
-    _values: list[str]
+    _values: tuple[str, ...]
 
     def __init__(self, values: STRINGS) -> None: ...
     def _validate_values(self, values: STRINGS) -> list[str]: ...
     def _serialize(self, name: STRING = None) -> MAP_DICT_STR_LIST: ...
     @property
-    def values(self) -> list[str]: ...
+    def values(self) -> tuple[str, ...]: ...
+    def accepts(self, value: Any) -> bool: ...
     def serialize(self, name: STRING = None) -> MAP_DICT_STR_LIST: ...
 # End FileTypeFilter class
 
@@ -161,13 +174,13 @@ class LinearUnitFilter(BaseCodedDomainFilter):
     """
     keyword: ClassVar[str]
     enumeration: ClassVar[Type[LinearUnit]]
-    _values: list[LinearUnit]
+    _values: tuple[LinearUnit, ...]
 
     def __init__(self, values: LINEAR_UNITS) -> None: ...
     def _validate_values(self, values: LINEAR_UNITS) -> list[LinearUnit]: ...
     def _serialize(self, name: STRING = None) -> dict[str, MAP_STR_LIST]: ...
     @property
-    def values(self) -> list[LinearUnit]: ...
+    def values(self) -> tuple[LinearUnit, ...]: ...
     def serialize(self, name: STRING = None) -> dict[str, MAP_STR_LIST]: ...
 # End LinearUnitFilter class
 
@@ -178,13 +191,13 @@ class TimeUnitFilter(BaseCodedDomainFilter):
     """
     keyword: ClassVar[str]
     enumeration: ClassVar[Type[TimeUnit]]
-    _values: list[TimeUnit]
+    _values: tuple[TimeUnit, ...]
 
     def __init__(self, values: TIME_UNITS) -> None: ...
     def _validate_values(self, values: TIME_UNITS) -> list[TimeUnit]: ...
     def _serialize(self, name: STRING = None) -> dict[str, MAP_STR_LIST]: ...
     @property
-    def values(self) -> list[TimeUnit]: ...
+    def values(self) -> tuple[TimeUnit, ...]: ...
     def serialize(self, name: STRING = None) -> dict[str, MAP_STR_LIST]: ...
 # End TimeUnitFilter class
 
@@ -195,13 +208,13 @@ class TravelModeUnitTypeFilter(BaseTypeListFilter):
     """
     keyword: ClassVar[str]
     enumeration: ClassVar[Type[TravelModeUnitType]]
-    _values: list[TravelModeUnitType]
+    _values: tuple[TravelModeUnitType, ...]
 
     def __init__(self, values: TRAVEL_MODES) -> None: ...
     def _validate_values(self, values: TRAVEL_MODES) -> list[TravelModeUnitType]: ...
     def _serialize(self, name: STRING = None) -> dict[str, MAP_STR_LIST]: ...
     @property
-    def values(self) -> list[TravelModeUnitType]: ...
+    def values(self) -> tuple[TravelModeUnitType, ...]: ...
     def serialize(self, name: STRING = None) -> dict[str, MAP_STR_LIST]: ...
 # End TravelModeUnitTypeFilter class
 
@@ -213,13 +226,13 @@ class WorkspaceTypeFilter(BaseTypeListFilter):
     keyword: ClassVar[str]
     items_keyword: ClassVar[str]
     enumeration: ClassVar[Type[WorkspaceType]]
-    _values: list[WorkspaceType]
+    _values: tuple[WorkspaceType, ...]
 
     def __init__(self, values: WORKSPACE_TYPES) -> None: ...
     def _validate_values(self, values: WORKSPACE_TYPES) -> list[WorkspaceType]: ...
     def _serialize(self, name: STRING = None) -> MAP_STR_LIST: ...
     @property
-    def values(self) -> list[WorkspaceType]: ...
+    def values(self) -> tuple[WorkspaceType, ...]: ...
     def serialize(self, name: STRING = None) -> MAP_STR_LIST: ...
 # End WorkspaceTypeFilter class
 
@@ -234,6 +247,7 @@ class AbstractRangeFilter(AbstractFilter):
     @staticmethod
     def _validate_and_convert(values: tuple, type_: Type[NUMBER]) -> list: ...
     def _serialize(self, name: STRING = None) -> dict[str, MAP_STR]: ...
+    def accepts(self, value: Any) -> bool: ...
 # End AbstractRangeFilter class
 
 
@@ -258,11 +272,28 @@ class AbstractNumberValueFilter(AbstractFilter):
     Abstract Number Value Filter
     """
     keyword: ClassVar[str]
+    typecode: ClassVar[str]
+    number_type: ClassVar[Type[NUMBER]]
+    _values: array | tuple[NUMBER, ...]
+
+    def __init__(self, values: NUMBERS) -> None: ...
     @abstractmethod
-    def _validate_values(self, values: list | tuple) -> list: ...
+    def _validate_values(self, values: NUMBERS) -> list | array: ...
+    def _validate_numbers(self, values: NUMBERS) -> list | array: ...
+    @staticmethod
+    def _as_buffer(values: Any) -> memoryview | None: ...
+    @staticmethod
+    def _as_native(view: memoryview, order: str, code: str) -> memoryview | None: ...
+    def _validate_buffer(self, view: memoryview) -> array: ...
+    @staticmethod
+    def _find_invalid(values: list | tuple) -> list: ...
     @staticmethod
     def _validate_and_convert(values: list | tuple, type_: Type[NUMBER]) -> list: ...
+    def _make_values(self, values: list | array) -> array | tuple: ...
     def _serialize(self, name: STRING = None) -> MAP_STR_LIST: ...
+    @property
+    def values(self) -> tuple[NUMBER, ...]: ...
+    def accepts(self, value: Any) -> bool: ...
 # End AbstractNumberValueFilter class
 
 
@@ -271,7 +302,9 @@ class LongValueFilter(AbstractNumberValueFilter):
     Long Value Filter
     """
     keyword: ClassVar[str]
-    def _validate_values(self, values: list[int] | tuple[int, ...]) -> list[int]: ...
+    typecode: ClassVar[str]
+    number_type: ClassVar[Type[int]]
+    def _validate_values(self, values: NUMBERS) -> list[int] | array: ...
 # End LongValueFilter class
 
 
@@ -280,7 +313,9 @@ class DoubleValueFilter(AbstractNumberValueFilter):
     Double Value Filter
     """
     keyword: ClassVar[str]
-    def _validate_values(self, values: list[float] | tuple[float, ...]) -> list[float]: ...
+    typecode: ClassVar[str]
+    number_type: ClassVar[Type[float]]
+    def _validate_values(self, values: NUMBERS) -> list[float] | array: ...
 # End DoubleValueFilter class
 
 
@@ -288,10 +323,20 @@ class StringValueFilter(AbstractFilter):
     """
     String Value Filter
     """
-    def _validate_values(self, values: STRINGS) -> list[str]: ...
+    def _validate_values(self, values: STRINGS | Iterable[str]) -> list[str]: ...
     def _serialize(self, name: STRING = None) -> tuple[MAP_STR_LIST, MAP_STR]: ...
+    def _make_cache_key(self, name: STRING) -> STRING: ...
+    def serialize(self, name: STRING = None) -> tuple[MAP_STR_LIST, MAP_STR]: ...
+    def accepts(self, value: Any) -> bool: ...
 # End StringValueFilter class
 
 
+FILTER_KEYWORDS: dict[Type[AbstractFilter], str]
+
+
+def filter_keyword(cls: Type[AbstractFilter]) -> str: ...
+def domain_keyword(domain: dict[str, Any]) -> STRING: ...
+
+
 if __name__ == '__main__':  # pragma: no cover
     pass
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Layer File Utilities
+"""
+
+
+from json import loads
+from pathlib import Path
+from typing import Any, NoReturn
+
+from autobox.constant import CIM_SYMBOL_REFERENCE, LayerFileKeys
+from autobox.enum import GeometryType
+from autobox.type import LayerInfo
+from autobox.util import read_bytes
+
+
+__all__ = ['clear_layer_cache', 'read_layer_file']
+
+
+SYMBOL_GEOMETRY: dict[str, frozenset[GeometryType]] = {
+    'CIMPointSymbol': frozenset((GeometryType.POINT, GeometryType.MULTIPOINT)),
+    'CIMLineSymbol': frozenset((GeometryType.POLYLINE,)),
+    'CIMPolygonSymbol': frozenset((GeometryType.POLYGON,)),
+    'CIMMeshSymbol': frozenset((GeometryType.MULTIPATCH,)),
+}
+
+
+_LAYERS: dict[Path, tuple[tuple[int, int], LayerInfo]] = {}
+
+
+def _find_definition(data: dict[str, Any]) -> dict[str, Any] | NoReturn:
+    """
+    Find Definition of the first layer, the first definition when the
+    layer is not referenced, a layer file without definitions is invalid.
+    """
+    definitions = data.get(LayerFileKeys.layer_definitions)
+    if isinstance(definitions, list):
+        definitions = [d for d in definitions if isinstance(d, dict)]
+    if not definitions:
+        raise ValueError('No layer definitions found')
+    layers = data.get(LayerFileKeys.layers)
+    if not isinstance(layers, list) or not layers:
+        return definitions[0]
+    uri, *_ = layers
+    for definition in definitions:
+        if definition.get(LayerFileKeys.uri) == uri:
+            return definition
+    return definitions[0]
+# End _find_definition function
+
+
+def _find_geometry_types(renderer: Any) -> frozenset[GeometryType]:
+    """
+    Find Geometry Types from the symbols referenced by the renderer, the
+    symbols nested within symbols (e.g. marker graphics) are not references
+    and are ignored.
+    """
+    types = set()
+    stack = [renderer]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, list):
+            stack.extend(value)
+            continue
+        if not isinstance(value, dict):
+            continue
+        if value.get(LayerFileKeys.type) == CIM_SYMBOL_REFERENCE:
+            symbol = value.get(LayerFileKeys.symbol)
+            if isinstance(symbol, dict) and isinstance(
+                    type_ := symbol.get(LayerFileKeys.type), str):
+                types.update(SYMBOL_GEOMETRY.get(type_, ()))
+            continue
+        stack.extend(v for v in value.values() if isinstance(v, (dict, list)))
+    return frozenset(types)
+# End _find_geometry_types function
+
+
+def _parse_layer_file(path: Path) -> LayerInfo | NoReturn:
+    """
+    Parse Layer File, content which is not the expected structure raises
+    a ValueError.
+    """
+    data = loads(read_bytes(path))
+    if not isinstance(data, dict):
+        raise ValueError(f'Invalid layer file content: {path}')
+    definition = _find_definition(data)
+    if not isinstance(layer_type := definition.get(LayerFileKeys.type), str):
+        raise ValueError(f'Invalid layer type: {layer_type}')
+    return LayerInfo(
+        layer_type=layer_type,
+        geometry_types=_find_geometry_types(
+            definition.get(LayerFileKeys.renderer)))
+# End _parse_layer_file function
+
+
+def read_layer_file(path: Path) -> LayerInfo:
+    """
+    Read Layer File (.lyrx), parsed once and cached on the path, the result
+    is parsed again when the modified time or size of the file changes.
+    """
+    path = Path(path)
+    stat = path.stat()
+    signature = stat.st_mtime_ns, stat.st_size
+    if (cached := _LAYERS.get(path)) and cached[0] == signature:
+        return cached[1]
+    info = _parse_layer_file(path)
+    _LAYERS[path] = signature, info
+    return info
+# End read_layer_file function
+
+
+def clear_layer_cache() -> None:
+    """
+    Clear the cache of parsed layer files
+    """
+    _LAYERS.clear()
+# End clear_layer_cache function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""
+Lint, validate existing toolboxes against the rules enforced when building
+"""
+
+
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+from zipfile import BadZipFile
+
+from autobox import parameter as parameters
+from autobox.constant import (
+    DERIVED, DOLLAR_RC, DiagnosticRules, ParameterContentKeys, SEMI_COLON,
+    ScriptToolContentKeys, ScriptToolContentResourceKeys, ToolboxContentKeys,
+    ToolboxContentResourceKeys)
+from autobox.filter import domain_keyword, filter_keyword
+from autobox.reader import ToolboxReader
+from autobox.type import LintIssue, STRING, ToolEntry
+from autobox.util import (
+    find_toolboxes, process_map, validate_parameter_name,
+    validate_script_folder_name, validate_script_name, validate_toolbox_alias,
+    validate_toolbox_name, validate_toolset_name)
+
+
+__all__ = ['lint', 'lint_toolbox']
+
+
+def _make_parameter_classes() -> dict[str, list[type]]:
+    """
+    Make Parameter Classes by data type keyword
+    """
+    classes = {}
+    for name in parameters.__all__:
+        cls = getattr(parameters, name)
+        classes.setdefault(cls.keyword, []).append(cls)
+    return classes
+# End _make_parameter_classes function
+
+
+_PARAMETER_CLASSES: dict[str, list[type]] = _make_parameter_classes()
+
+
+def _is_valid_default(value: str, types: tuple[type, ...]) -> bool:
+    """
+    Is Valid Default, only numeric and boolean defaults are checked since
+    the serialized text of other types can not be checked reliably.
+    """
+    if bool in types:
+        return value in ('true', 'false')
+    if not types or not set(types) <= {int, float}:
+        return True
+    convert = float if float in types else int
+    try:
+        convert(value)
+    except ValueError:
+        return False
+    return True
+# End _is_valid_default function
+
+
+def _find_references(value: Any) -> Iterator[str]:
+    """
+    Find resource references ($rc:) in content, returns the resource keys
+    """
+    if isinstance(value, str):
+        if value.startswith(DOLLAR_RC):
+            yield value.removeprefix(DOLLAR_RC)
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from _find_references(v)
+    elif isinstance(value, list):
+        for v in value:
+            yield from _find_references(v)
+# End _find_references function
+
+
+class _Linter:
+    """
+    Linter, collects the issues of a single toolbox
+    """
+    def __init__(self, reader: ToolboxReader) -> None:
+        """
+        Initialize the _Linter class
+        """
+        super().__init__()
+        self._reader: ToolboxReader = reader
+        self._path: str = str(reader.path)
+        self.issues: list[LintIssue] = []
+    # End init built-in
+
+    def _add(self, location: str, rule: str, message: str) -> None:
+        """
+        Add an issue
+        """
+        self.issues.append(LintIssue(self._path, location, rule, message))
+    # End _add method
+
+    def _check_references(self, location: str, content: dict[str, Any],
+                          resource: dict[str, Any]) -> None:
+        """
+        Check for dangling resource references between content and resource
+        """
+        mapping = resource.get(ScriptToolContentResourceKeys.map, {})
+        for key in _find_references(content):
+            if key not in mapping:
+                self._add(location, DiagnosticRules.resource_missing,
+                          f'Resource not found: {DOLLAR_RC}{key}')
+    # End _check_references method
+
+    def _check_repeats(self, location: str, names: Iterable[str],
+                       rule: str, text: str) -> None:
+        """
+        Check for name repetitions, case-insensitive
+        """
+        names = list(names)
+        counter = Counter(n.casefold() for n in names)
+        repeated = sorted({n for n in names if counter[n.casefold()] > 1})
+        if repeated:
+            self._add(location, rule,
+                      f'{text} name repetition detected: {", ".join(repeated)}')
+    # End _check_repeats method
+
+    def _check_toolbox(self) -> None:
+        """
+        Check toolbox name, alias, and toolsets
+        """
+        reader = self._reader
+        name, alias = reader.name, reader.alias
+        if validate_toolbox_name(name) != name:
+            self._add('', DiagnosticRules.toolbox_name,
+                      f'Invalid toolbox name: {name}')
+        if alias and validate_toolbox_alias(alias) != alias:
+            self._add('', DiagnosticRules.toolbox_alias,
+                      f'Invalid toolbox alias: {alias}')
+        self._check_references('', reader.content, reader.resource)
+        mapping = reader.resource.get(ToolboxContentResourceKeys.map, {})
+        toolsets = reader.content.get(ToolboxContentKeys.toolsets, {})
+        names = [mapping.get(k.removeprefix(DOLLAR_RC), k) for k in toolsets
+                 if k != ToolboxContentKeys.root]
+        for name in names:
+            for part in name.split('\\'):
+                if validate_toolset_name(part) != part:
+                    self._add(name, DiagnosticRules.toolset_name,
+                              f'Invalid toolset name: {part}')
+        self._check_repeats('', names, rule=DiagnosticRules.toolset_repeat,
+                            text='Toolset')
+        self._check_repeats('', [t.name for t in reader.tools],
+                            rule=DiagnosticRules.tool_repeat, text='Tool')
+    # End _check_toolbox method
+
+    def _check_tool(self, tool: ToolEntry) -> None:
+        """
+        Check tool name, folder, content, and parameters
+        """
+        name = tool.name
+        if validate_script_name(name) != name:
+            self._add(name, DiagnosticRules.tool_name,
+                      f'Invalid tool name: {name}')
+        if validate_script_folder_name(tool.folder) != tool.folder:
+            self._add(name, DiagnosticRules.tool_folder,
+                      f'Invalid tool folder: {tool.folder}')
+        content, resource = self._reader.read_tool(name)
+        if not content:
+            self._add(name, DiagnosticRules.tool_content,
+                      f'Tool content not found: {name}')
+            return
+        self._check_references(name, content, resource)
+        params = content.get(ScriptToolContentKeys.parameters) or {}
+        self._check_repeats(name, params,
+                            rule=DiagnosticRules.parameter_repeat,
+                            text='Parameter')
+        keywords = {}
+        for key, value in params.items():
+            keywords[key.casefold()] = self._get_keyword(value)
+        for key, value in params.items():
+            self._check_parameter(f'{name}.{key}', key, value, keywords)
+    # End _check_tool method
+
+    @staticmethod
+    def _get_keyword(content: dict[str, Any]) -> STRING:
+        """
+        Get the data type keyword of a parameter, multi value unwrapped
+        """
+        data_type = content.get(ParameterContentKeys.data_type) or {}
+        if isinstance(inner := data_type.get(ParameterContentKeys.data_type),
+                      dict):
+            data_type = inner
+        return data_type.get(ParameterContentKeys.type)
+    # End _get_keyword method
+
+    def _check_parameter(self, location: str, name: str,
+                         content: dict[str, Any],
+                         keywords: dict[str, STRING]) -> None:
+        """
+        Check parameter name, data type, dependencies, filter, and default
+        """
+        if validate_parameter_name(name) != name:
+            self._add(location, DiagnosticRules.parameter_name,
+                      f'Invalid parameter name: {name}')
+        keyword = keywords[name.casefold()]
+        if not (classes := _PARAMETER_CLASSES.get(keyword)):
+            self._add(location, DiagnosticRules.data_type,
+                      f'Unknown data type: {keyword}')
+            return
+        is_derived = str(content.get(
+            ParameterContentKeys.parameter_type)).casefold() == DERIVED
+        allowed = {c.keyword for cls in classes for c in cls.dependency_types}
+        for depends in content.get(ParameterContentKeys.depends) or []:
+            if (other := keywords.get(depends.casefold(), ...)) is ...:
+                self._add(location, DiagnosticRules.dependency_missing,
+                          f'Dependency not found: {depends}')
+            elif other not in allowed and not (is_derived and other == keyword):
+                self._add(location, DiagnosticRules.dependency_type,
+                          f'Invalid dependency type: {other}')
+        if domain := content.get(ParameterContentKeys.domain):
+            allowed = {filter_keyword(f) for cls in classes
+                       for f in cls.filter_types}
+            if (found := domain_keyword(domain)) not in allowed:
+                self._add(location, DiagnosticRules.filter_type,
+                          f'Invalid filter type: {found}')
+        if (value := content.get(ParameterContentKeys.value)) is None:
+            return
+        data_type = content.get(ParameterContentKeys.data_type) or {}
+        values = [str(value)]
+        if isinstance(data_type.get(ParameterContentKeys.data_type), dict):
+            values = values[0].split(SEMI_COLON)
+        for cls in classes:
+            if all(_is_valid_default(v, cls.default_types) for v in values):
+                return
+        self._add(location, DiagnosticRules.default_value,
+                  f'Invalid default value: {value}')
+    # End _check_parameter method
+
+    def run(self) -> list[LintIssue]:
+        """
+        Run all checks, an unreadable archive results in a single issue
+        """
+        try:
+            self._check_toolbox()
+            for tool in self._reader.tools:
+                self._check_tool(tool)
+        except (BadZipFile, KeyError, OSError, ValueError) as err:
+            self._add('', DiagnosticRules.archive, str(err))
+        return self.issues
+    # End run method
+# End _Linter class
+
+
+def lint_toolbox(path: Path | str) -> list[LintIssue]:
+    """
+    Lint a single toolbox, returns the issues found.
+    """
+    try:
+        reader = ToolboxReader(Path(path))
+    except (FileNotFoundError, ValueError) as err:
+        return [LintIssue(str(path), '', DiagnosticRules.archive, str(err))]
+    with reader:
+        return _Linter(reader).run()
+# End lint_toolbox function
+
+
+def lint(paths: Iterable[Path | str], jobs: int = 1) -> list[LintIssue]:
+    """
+    Lint toolboxes, folders are walked for toolboxes.  Toolboxes are
+    checked in worker processes when jobs > 1, issues are returned in the
+    order of the toolboxes.
+
+    :param paths: Toolbox files and / or folders.
+    :param jobs: Number of worker processes.
+    """
+    paths = [str(p) for p in find_toolboxes(paths)]
+    results = process_map(lint_toolbox, paths, jobs=jobs)
+    return [issue for issues in results for issue in issues]
+# End lint function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Migrate, rewrite the tool content fields of existing toolboxes
+"""
+
+
+from json import loads
+from pathlib import Path
+from typing import Any, Iterable
+from zipfile import ZipFile
+
+from autobox.archive import patch_archive
+from autobox.constant import ScriptToolContentKeys, TOOLBOX, TOOL_CONTENT
+from autobox.type import ToolMetadata
+from autobox.util import find_toolboxes, process_map, validate_path
+from autobox.writer import encode_json
+
+
+__all__ = ['migrate', 'migrate_toolbox']
+
+
+FIELDS = dict[str, Any]
+
+
+def _make_fields(fields: ToolMetadata | FIELDS) -> FIELDS:
+    """
+    Make Fields keyed on the content keys, tool metadata is translated
+    """
+    if not isinstance(fields, ToolMetadata):
+        return dict(fields)
+    return {
+        ScriptToolContentKeys.application_version: fields.application_version,
+        ScriptToolContentKeys.product: fields.product,
+    }
+# End _make_fields function
+
+
+def _apply_fields(content: dict[str, Any], fields: FIELDS) -> bool:
+    """
+    Apply fields to the content in place, a value of None removes the field.
+    Returns True when the content changed, key order is preserved.
+    """
+    changed = False
+    for key, value in fields.items():
+        if value is None:
+            if key in content:
+                content.pop(key)
+                changed = True
+        elif content.get(key, ...) != value:
+            content[key] = value
+            changed = True
+    return changed
+# End _apply_fields function
+
+
+def migrate_toolbox(path: Path | str, fields: ToolMetadata | FIELDS) -> bool:
+    """
+    Migrate a toolbox, the fields are written into the content of every
+    tool.  Only the tool content members which change are rewritten, all
+    other members are copied raw.  The toolbox is replaced atomically and
+    is left untouched when no tool content changes.
+
+    :param path: Path to the toolbox.
+    :param fields: Tool metadata or fields keyed on the tool content keys,
+        e.g. {'app_ver': '13.5'}, a value of None removes the field.
+    """
+    path = validate_path(path, text=TOOLBOX)
+    fields = _make_fields(fields)
+    members = {}
+    with ZipFile(path) as zin:
+        for info in zin.infolist():
+            if not info.filename.endswith(f'/{TOOL_CONTENT}'):
+                continue
+            content = loads(zin.read(info))
+            if _apply_fields(content, fields):
+                members[info.filename] = encode_json(content)
+    if not members:
+        return False
+    patch_archive(path, members=members)
+    return True
+# End migrate_toolbox function
+
+
+def migrate(paths: Iterable[Path | str], fields: ToolMetadata | FIELDS,
+            jobs: int = 1) -> list[Path]:
+    """
+    Migrate toolboxes, folders are walked for toolboxes.  Toolboxes are
+    migrated in worker processes when jobs > 1, returns the paths of the
+    toolboxes which changed.
+
+    :param paths: Toolbox files and / or folders.
+    :param fields: Tool metadata or fields keyed on the tool content keys.
+    :param jobs: Number of worker processes.
+    """
+    paths = find_toolboxes(paths)
+    fields = _make_fields(fields)
+    changed = process_map(
+        migrate_toolbox, paths, [fields] * len(paths), jobs=jobs)
+    return [path for path, flag in zip(paths, changed) if flag]
+# End migrate function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
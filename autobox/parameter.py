@@ -9,26 +9,29 @@ from pathlib import Path
 from typing import Any, ClassVar, NoReturn, Self
 
 from autobox.constant import (
-    CSV, DATETIME_FORMAT, DATE_FORMAT, DBF, DERIVED, DOLLAR_RC, DOT, FILTER,
-    GP_AREAL_UNIT, GP_FEATURE_SCHEMA, GP_LINEAR_UNIT, GP_MULTI_VALUE,
-    GP_TABLE_SCHEMA, GP_TIME_UNIT, LYR, LYRX, MXD, OPTIONAL, OUT, PARAMETER,
+    CIM_FEATURE_LAYER, CIM_LAS_DATASET_LAYER, CIM_MOSAIC_LAYER,
+    CIM_RASTER_LAYER, CIM_TIN_LAYER, CSV, DATETIME_FORMAT, DATE_FORMAT, DBF, DERIVED, DOLLAR_RC, DOT,
+    DiagnosticRules, FILTER, GP_AREAL_UNIT, GP_FEATURE_SCHEMA, GP_LINEAR_UNIT,
+    GP_MULTI_VALUE, GP_TABLE_SCHEMA, GP_TIME_UNIT, LYR, LYRX, MXD, OPTIONAL, OUT, PARAMETER,
     PRJ, ParameterContentKeys, ParameterContentResourceKeys, RELATIVE,
     SEMI_COLON, SHP, SchemaContentKeys, ScriptToolContentKeys,
     ScriptToolContentResourceKeys, TAB, TIME_FORMAT, TRUE, TXT)
 from autobox.default import (
     ArealUnitValue, CellSizeXY, Envelope, Extent, LinearUnitValue, MDomain,
     Point, TimeUnitValue, XYDomain, ZDomain)
+from autobox.diagnostic import is_collecting, raise_or_collect
 from autobox.enum import SACellSize
 from autobox.filter import (
     AbstractFilter, ArealUnitFilter, DoubleRangeFilter, DoubleValueFilter,
     FeatureClassTypeFilter, FieldTypeFilter, FileTypeFilter, LinearUnitFilter,
     LongRangeFilter, LongValueFilter, StringValueFilter, TimeUnitFilter,
     TravelModeUnitTypeFilter, WorkspaceTypeFilter)
+from autobox.layer import read_layer_file
 from autobox.type import (
-    BOOL, DATETIME, MAP_STR, NUMBER, PATH, STRING, STRINGS, TYPES, TYPE_FILTERS,
-    TYPE_PARAMS)
+    BOOL, DATETIME, MAP_STR, NUMBER, PARAMETER_CACHE, PATH, STRING, STRINGS,
+    TYPES, TYPE_FILTERS, TYPE_PARAMS)
 from autobox.util import (
-    make_parameter_name, quote, resolve_layer_path, unique,
+    is_file, make_parameter_name, quote, resolve_layer_path,
     validate_parameter_label, validate_parameter_name, validate_path,
     wrap_markup)
 
@@ -88,6 +91,24 @@ class BaseParameter:
     dependency_types: ClassVar[TYPE_PARAMS] = ()
     filter_types: ClassVar[TYPE_FILTERS] = ()
     default_types: ClassVar[TYPES] = ()
+    layer_types: ClassVar[STRINGS] = ()
+    _data_type: ClassVar[MAP_STR] = {ParameterContentKeys.type: keyword}
+    _multi_data_type: ClassVar[MAP_STR] = {
+        ParameterContentKeys.data_type: _data_type,
+        ParameterContentKeys.type: GP_MULTI_VALUE}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Initialize Subclass, content which depends only on the class (the
+        data type and multi value wrapper) is built once per class.
+        """
+        super().__init_subclass__(**kwargs)
+        data_type = {ParameterContentKeys.type: cls.keyword}
+        cls._data_type = data_type
+        cls._multi_data_type = {
+            ParameterContentKeys.data_type: data_type,
+            ParameterContentKeys.type: GP_MULTI_VALUE}
+    # End init subclass built-in
 
     def __init__(self, label: str, name: STRING = None, category: STRING = None,
                  description: STRING = None, default_value: Any = None,
@@ -123,6 +144,8 @@ class BaseParameter:
         self._dependency: InputOutputParameter | None = None
         self._filter: AbstractFilter | None = None
         self._symbology: PATH = None
+        self._revision: int = 0
+        self._cache: PARAMETER_CACHE | None = None
     # End init built-in
 
     @staticmethod
@@ -131,7 +154,10 @@ class BaseParameter:
         Validate label
         """
         if not (validated_label := validate_parameter_label(label)):
-            raise ValueError(f'Invalid parameter label: {label}')
+            raise_or_collect(ValueError(f'Invalid parameter label: {label}'),
+                             location=label,
+                             rule=DiagnosticRules.parameter_label, value=label)
+            return str(label)
         return validated_label
     # End _validate_label method
 
@@ -142,20 +168,24 @@ class BaseParameter:
         """
         if not (validated_name := validate_parameter_name(name)):
             if not (validated_name := make_parameter_name(label)):
-                raise ValueError(f'Invalid parameter name: {name}')
+                raise_or_collect(
+                    ValueError(f'Invalid parameter name: {name}'),
+                    location=name or label,
+                    rule=DiagnosticRules.parameter_name, value=name)
+                return str(name or label)
         return validated_name
     # End _validate_name method
 
     def _validate_multi_default(self, value: Any) -> Any:
         """
-        Validate Multi Default, filter elements based on type then make unique,
-        return a tuple to avoid inplace modification.
+        Validate Multi Default, filter elements based on type and make unique
+        in a single pass, return a tuple to avoid inplace modification.
         """
         if not isinstance(value, (list, tuple)):
             value = value,
-        values = [v for v in value if isinstance(v, self.default_types)]
-        if values:
-            return tuple(unique(values))
+        types = self.default_types
+        if values := dict.fromkeys(v for v in value if isinstance(v, types)):
+            return tuple(values)
     # End _validate_multi_default method
 
     def _validate_default(self, value: Any) -> Any:
@@ -170,28 +200,43 @@ class BaseParameter:
         else:
             if isinstance(value, self.default_types):
                 return value
-        raise TypeError(
-            f'Invalid default value for {self.__class__.__name__}: {value}')
+        return self._invalid_default(TypeError(
+            f'Invalid default value for {self.__class__.__name__}: {value}'),
+            value=value)
     # End _validate_default method
 
+    def _invalid_default(self, error: Exception, value: Any) -> None | NoReturn:
+        """
+        Invalid Default, raise or collect the error, no default is used
+        when collecting.
+        """
+        raise_or_collect(error, location=self._name,
+                         rule=DiagnosticRules.default_value, value=value)
+    # End _invalid_default method
+
     def _validate_required(self, value: BOOL) -> BOOL:
         """
         Validate Required
         """
         if not (isinstance(value, bool) or value is None):
-            raise ValueError(f'Invalid is_required value: {value}')
+            raise_or_collect(ValueError(f'Invalid is_required value: {value}'),
+                             location=self._name,
+                             rule=DiagnosticRules.required_value, value=value)
+            return True
         return value
     # End _validate_required method
 
-    @staticmethod
-    def _validate_type(value: Any, types: TYPES, text: str) -> Any:
+    def _validate_type(self, value: Any, types: TYPES, text: str,
+                       rule: str) -> Any:
         """
         Validate Type
         """
         if value is None or not types:
             return
         if not isinstance(value, types):
-            raise TypeError(f'Invalid {text} type: {value}')
+            raise_or_collect(TypeError(f'Invalid {text} type: {value}'),
+                             location=self._name, rule=rule, value=value)
+            return
         return value
     # End _validate_type method
 
@@ -205,81 +250,122 @@ class BaseParameter:
             if id(self) != id(value):
                 return value
         return self._validate_type(
-            value, types=self.dependency_types, text=PARAMETER)
+            value, types=self.dependency_types, text=PARAMETER,
+            rule=DiagnosticRules.dependency_type)
     # End _validate_dependency method
 
-    @staticmethod
-    def _validate_layer_file(path: PATH) -> PATH:
+    def _validate_layer_file(self, path: PATH) -> PATH:
         """
         Validate Layer File
         """
         if not path:
             return
         text = 'layer file'
-        path = validate_path(path, text=text)
+        if not (path := validate_path(path, text=text)):
+            return
         if path.suffix.casefold() not in (LYRX, LYR):
-            raise TypeError(f'Invalid {text} type: {path.suffix}')
+            raise_or_collect(TypeError(f'Invalid {text} type: {path.suffix}'),
+                             location=self._name,
+                             rule=DiagnosticRules.layer_file, value=path)
+            return
         return path
     # End _validate_layer_file method
 
-    def _build_parameter_type(self) -> dict[str, STRING]:
+    def check_default(self) -> None | NoReturn:
+        """
+        Check Default, the default value (every value when multi value) must
+        be accepted by the filter, the default and the filter are validated
+        separately when set so either may have been set first.
+        """
+        if (value := self._default) is None or self._filter is None:
+            return
+        values = value if self.is_multi else (value,)
+        if not (invalid := [v for v in values if not self._filter.accepts(v)]):
+            return
+        raise_or_collect(
+            ValueError(f'Default value not accepted by '
+                       f'{self._filter.__class__.__name__}: {invalid}'),
+            location=self._name, rule=DiagnosticRules.default_value,
+            value=value)
+    # End check_default method
+
+    def check_symbology(self) -> None | NoReturn:
+        """
+        Check Symbology, the layer file (.lyrx) is parsed (once per file
+        while unchanged) and the type of layer it holds must suit the
+        parameter, as must the geometry it draws when the parameter is
+        filtered by geometry type.  Layer files which cannot be parsed are
+        reported as invalid layer files.
+        """
+        if not (path := self._symbology) or path.suffix.casefold() != LYRX:
+            return
+        try:
+            info = read_layer_file(path)
+        except (AttributeError, KeyError, OSError, TypeError,
+                ValueError) as err:
+            raise_or_collect(
+                ValueError(f'Invalid layer file: {path}, {err}'),
+                location=self._name, rule=DiagnosticRules.layer_file,
+                value=path)
+            return
+        if self.layer_types and info.layer_type not in self.layer_types:
+            raise_or_collect(
+                TypeError(f'Layer file holds a {info.layer_type}, expected '
+                          f'{", ".join(self.layer_types)}: {path}'),
+                location=self._name, rule=DiagnosticRules.layer_mismatch,
+                value=path)
+            return
+        if not isinstance(self._filter, FeatureClassTypeFilter):
+            return
+        if not info.geometry_types or info.geometry_types.intersection(
+                self._filter.values):
+            return
+        found = ', '.join(sorted(info.geometry_types))
+        expected = ', '.join(self._filter.values)
+        raise_or_collect(
+            TypeError(f'Layer file draws {found}, expected {expected}: {path}'),
+            location=self._name, rule=DiagnosticRules.layer_mismatch,
+            value=path)
+    # End check_symbology method
+
+    def _build_parameter_type(self) -> STRING:
         """
         Build Parameter Type
         """
         if self.is_required:
-            value = None
-        elif self.is_required is None:
-            value = DERIVED
-        else:
-            value = OPTIONAL
-        return {ParameterContentKeys.parameter_type: value}
+            return None
+        if self.is_required is None:
+            return DERIVED
+        return OPTIONAL
     # End _build_parameter_type method
 
-    def _build_direction(self) -> dict[str, STRING]:
+    def _build_direction(self) -> STRING:
         """
         Build Direction
         """
         if self.is_input:
-            value = None
-        else:
-            value = OUT
-        return {ParameterContentKeys.direction: value}
+            return None
+        return OUT
     # End _build_direction method
 
-    def _build_display_name(self) -> tuple[MAP_STR, MAP_STR]:
-        """
-        Build Display Name
-        """
-        suffix = ScriptToolContentResourceKeys.title
-        key = f'{self.name.casefold()}{DOT}{suffix}'
-        content = {ParameterContentKeys.display_name: f'{DOLLAR_RC}{key}'}
-        return content, {key: self.label}
-    # End _build_display_name method
-
-    def _build_category(self, categories: dict[str, int]) -> dict[str, STRING]:
+    def _build_category(self, categories: dict[str, int]) -> STRING:
         """
         Build Category
         """
-        key = ParameterContentKeys.category
         if self.category not in categories:
-            value = None
-        else:
-            id_ = categories[self.category]
-            value = f'{DOLLAR_RC}{ScriptToolContentKeys.parameters}.{key}{id_}'
-        return {key: value}
+            return None
+        id_ = categories[self.category]
+        key = ParameterContentKeys.category
+        return f'{DOLLAR_RC}{ScriptToolContentKeys.parameters}.{key}{id_}'
     # End _build_category method
 
-    def _build_data_type(self) -> dict[str, str | MAP_STR]:
+    def _build_data_type(self) -> MAP_STR:
         """
-        Build Data Type with Schema
+        Build Data Type, the content is built once per class
         """
-        key = ParameterContentKeys.data_type
-        data_type = {ParameterContentKeys.type: self.keyword}
         if not self.is_multi:
-            return {key: data_type}
-        return {key: {
-            key: data_type,
-            ParameterContentKeys.type: GP_MULTI_VALUE}}
+            return self._data_type
+        return self._multi_data_type
     # End _build_data_type method
 
     def _build_filter(self) -> tuple[dict, MAP_STR]:
@@ -291,28 +377,28 @@ class BaseParameter:
         return self.filter.serialize(), {}
     # End _build_filter method
 
-    def _build_dependency(self) -> MAP_STR:
+    def _build_dependency(self) -> list[str] | None:
         """
         Build Dependency
         """
         if not self.dependency:
-            return {}
-        return {ParameterContentKeys.depends: [self.dependency.name]}
+            return None
+        return [self.dependency.name]
     # End _build_dependency method
 
-    def _build_symbology(self, target: Path) -> MAP_STR:
+    def _build_symbology(self, target: Path) -> STRING:
         """
         Build Symbology
         """
         if self.is_input or not target or not self.symbology:
-            return {}
-        if not self.symbology.is_file():  # pragma: no cover
-            return {}
+            return None
+        if not is_file(self.symbology):  # pragma: no cover
+            return None
         path = resolve_layer_path(
             layer_file=self.symbology, toolbox_folder=target)
         if not path or path == RELATIVE:  # pragma: no cover
-            return {}
-        return {ParameterContentKeys.symbology: path}
+            return None
+        return path
     # End _build_symbology method
 
     # noinspection PyMethodMayBeStatic
@@ -323,7 +409,7 @@ class BaseParameter:
         return {}
     # End _build_schema method
 
-    def _build_default_value(self) -> dict[str, Any]:
+    def _build_default_value(self) -> Any:
         """
         Build Default Value
         """
@@ -333,65 +419,60 @@ class BaseParameter:
                 value = ()
             elif not isinstance(value, (list, tuple)):  # pragma: no cover
                 value = value,
-            value = self._make_flattened_value(value)
-        else:
-            if value is not None:
-                value = str(value)
-        return {ParameterContentKeys.value: value}
+            return self._make_flattened_value(value)
+        if value is not None:
+            value = str(value)
+        return value
     # End _build_default_value method
 
     @staticmethod
     def _make_flattened_value(value: list | tuple) -> str:
         """
-        Make Flattened Value
+        Make Flattened Value, joined directly from a generator
         """
-        values = []
-        for v in value:
-            if isinstance(v, Path):
-                func = str
-            else:
-                func = repr
-            values.append(quote(func(v)))
-        value = SEMI_COLON.join(values)
-        return value
+        return SEMI_COLON.join(
+            quote(str(v) if isinstance(v, Path) else repr(v)) for v in value)
     # End _make_flattened_value method
 
-    def _build_description(self) -> tuple[MAP_STR, MAP_STR]:
-        """
-        Build Description
-        """
-        if not self.description:
-            return {}, {}
-        suffix = ParameterContentResourceKeys.description
-        key = f'{self.name.casefold()}{DOT}{suffix}'
-        content = {ParameterContentKeys.description: f'{DOLLAR_RC}{key}'}
-        return content, {key: self.description}
-    # End _build_description method
-
     def _serialize(self, categories: dict[str, int], target: Path) \
             -> tuple[dict[str, dict], MAP_STR]:
         """
         Serialize Parameter to a content dictionary and a resource dictionary.
-        """
-        parameter_type = self._build_parameter_type()
-        direction = self._build_direction()
-        display_name_content, display_name_resource = self._build_display_name()
-        category = self._build_category(categories)
-        data_type = self._build_data_type()
+
+        Content is written in a single pass, in the order used by ArcGIS Pro,
+        and only keys with a value are added.
+        """
+        keys = ParameterContentKeys
+        name = self.name.casefold()
+        title = f'{name}{DOT}{ScriptToolContentResourceKeys.title}'
+        content = {}
+        if parameter_type := self._build_parameter_type():
+            content[keys.parameter_type] = parameter_type
+        if direction := self._build_direction():
+            content[keys.direction] = direction
+        content[keys.display_name] = f'{DOLLAR_RC}{title}'
+        if category := self._build_category(categories):
+            content[keys.category] = category
+        content[keys.data_type] = self._build_data_type()
         filter_content, filter_resource = self._build_filter()
-        dependency = self._build_dependency()
-        symbology = self._build_symbology(target)
-        schema = self._build_schema()
-        default_value = self._build_default_value()
-        description_content, description_resource = self._build_description()
-        content = {**parameter_type, **direction, **display_name_content,
-                   **category, **data_type, **filter_content, **dependency,
-                   **symbology, **schema, **default_value,
-                   **description_content}
-        content = {k: v for k, v in content.items() if v}
-        resource = {**filter_resource, **description_resource,
-                    **display_name_resource}
-        resource = {k: v for k, v in resource.items() if v}
+        for key, value in filter_content.items():
+            if value:
+                content[key] = value
+        if dependency := self._build_dependency():
+            content[keys.depends] = dependency
+        if symbology := self._build_symbology(target):
+            content[keys.symbology] = symbology
+        if schema := self._build_schema():
+            content[keys.schema] = schema
+        if value := self._build_default_value():
+            content[keys.value] = value
+        resource = {k: v for k, v in filter_resource.items() if v}
+        if self.description:
+            key = f'{name}{DOT}{ParameterContentResourceKeys.description}'
+            content[keys.description] = f'{DOLLAR_RC}{key}'
+            resource[key] = self.description
+        if self.label:
+            resource[title] = self.label
         return content, resource
     # End _serialize method
 
@@ -421,6 +502,7 @@ class BaseParameter:
     @category.setter
     def category(self, value: STRING) -> None:
         self._category = value
+        self._revision += 1
     # End category property
 
     @property
@@ -433,6 +515,7 @@ class BaseParameter:
     @description.setter
     def description(self, value: STRING) -> None:
         self._description = value
+        self._revision += 1
     # End description property
 
     @property
@@ -445,6 +528,7 @@ class BaseParameter:
     @default_value.setter
     def default_value(self, value: Any) -> None:
         self._default = self._validate_default(value)
+        self._revision += 1
     # End default_value property
 
     @property
@@ -481,6 +565,7 @@ class BaseParameter:
     @is_enabled.setter
     def is_enabled(self, value: bool) -> None:
         self._is_enabled = value
+        self._revision += 1
     # End is_enabled property
 
     @property
@@ -504,6 +589,7 @@ class BaseParameter:
     @dependency.setter
     def dependency(self, value: Self | None) -> None:
         self._dependency = self._validate_dependency(value)
+        self._revision += 1
     # End dependency property
 
     @property
@@ -516,7 +602,9 @@ class BaseParameter:
     @filter.setter
     def filter(self, value: AbstractFilter | None) -> None:
         self._filter = self._validate_type(
-            value, types=self.filter_types, text=FILTER)
+            value, types=self.filter_types, text=FILTER,
+            rule=DiagnosticRules.filter_type)
+        self._revision += 1
     # End dependency property
 
     @property
@@ -529,14 +617,25 @@ class BaseParameter:
     @symbology.setter
     def symbology(self, value: PATH) -> None:
         self._symbology = self._validate_layer_file(value)
+        self._revision += 1
     # End symbology property
 
     def serialize(self, categories: dict[str, int], target: Path) \
             -> tuple[dict[str, dict], MAP_STR]:
         """
         Serialize Parameter to a content dictionary and a resource dictionary.
-        """
-        return self._serialize(categories, target=target)
+        The result is cached until the parameter changes through a setter, its
+        category number changes, or the target changes, the dictionaries may
+        be shared (e.g. by cloned tools) and must not be modified.
+        """
+        if is_collecting():
+            return self._serialize(categories, target=target)
+        key = self._revision, categories.get(self._category), target
+        if self._cache and self._cache[0] == key:
+            return self._cache[1], self._cache[2]
+        content, resource = self._serialize(categories, target=target)
+        self._cache = key, content, resource
+        return content, resource
     # End serialize method
 # End BaseParameter class
 
@@ -614,8 +713,10 @@ class PathEsqueMixin:
         else:
             if value.suffix.casefold() in self.suffixes:
                 return value
-        raise ValueError(
-            f'Incorrect file extension for {self.__class__.__name__}: {value}')
+        # noinspection PyUnresolvedReferences
+        return self._invalid_default(ValueError(
+            f'Incorrect file extension for {self.__class__.__name__}: {value}'),
+            value=value)
     # End _validate_default method
 # End PathEsqueMixin class
 
@@ -625,6 +726,17 @@ class SchemaMixin:
     Schema Mixin
     """
     schema_type: ClassVar[str] = ''
+    _schema: ClassVar[MAP_STR] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Initialize Subclass, the schema block is built once per class.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._schema = {
+            SchemaContentKeys.type: cls.schema_type,
+            SchemaContentKeys.generate_output_catalog_path: TRUE}
+    # End init subclass built-in
 
     def _build_schema(self) -> MAP_STR:
         """
@@ -636,9 +748,7 @@ class SchemaMixin:
         # noinspection PyUnresolvedReferences
         if self.is_required is None:  # pragma: no cover
             return {}
-        return {ParameterContentKeys.schema: {
-            SchemaContentKeys.type: self.schema_type,
-            SchemaContentKeys.generate_output_catalog_path: TRUE}}
+        return self._schema
     # End _build_schema method
 # End SchemaMixin class
 
@@ -653,8 +763,10 @@ class StringNotStoredMixin:
         """
         if value is None:
             return
-        raise ValueError(
-            f'Default value for {self.__class__.__name__} is not stored')
+        # noinspection PyUnresolvedReferences
+        return self._invalid_default(ValueError(
+            f'Default value for {self.__class__.__name__} is not stored'),
+            value=value)
     # End _validate_default method
 # End StringNotStoredMixin class
 
@@ -817,6 +929,7 @@ class LasDatasetParameter(InputOutputParameter):
     that stores airborne lidar data.
     """
     keyword: ClassVar[str] = 'DELasDataset'
+    layer_types: ClassVar[STRINGS] = CIM_LAS_DATASET_LAYER,
 # End LasDatasetParameter class
 
 
@@ -827,6 +940,7 @@ class LasDatasetLayerParameter(InputOutputParameter):
     dataset.
     """
     keyword: ClassVar[str] = 'GPLasDatasetLayer'
+    layer_types: ClassVar[STRINGS] = CIM_LAS_DATASET_LAYER,
 # End LasDatasetLayerParameter class
 
 
@@ -855,6 +969,7 @@ class MosaicDatasetParameter(InputOutputParameter):
     and viewed as a mosaicked image.
     """
     keyword: ClassVar[str] = 'DEMosaicDataset'
+    layer_types: ClassVar[STRINGS] = CIM_MOSAIC_LAYER,
 # End MosaicDatasetParameter class
 
 
@@ -863,6 +978,7 @@ class MosaicLayerParameter(InputOutputParameter):
     A layer that references a mosaic dataset.
     """
     keyword: ClassVar[str] = 'GPMosaicLayer'
+    layer_types: ClassVar[STRINGS] = CIM_MOSAIC_LAYER,
 # End MosaicLayerParameter class
 
 
@@ -961,6 +1077,7 @@ class RasterDatasetParameter(InputOutputParameter):
     A single dataset built from one or more rasters.
     """
     keyword: ClassVar[str] = 'DERasterDataset'
+    layer_types: ClassVar[STRINGS] = CIM_RASTER_LAYER,
 # End RasterDatasetParameter class
 
 
@@ -969,6 +1086,7 @@ class RasterLayerParameter(InputOutputParameter):
     A reference to a raster, including symbology and rendering properties.
     """
     keyword: ClassVar[str] = 'GPRasterLayer'
+    layer_types: ClassVar[STRINGS] = CIM_RASTER_LAYER,
 # End RasterLayerParameter class
 
 
@@ -1192,6 +1310,7 @@ class TinParameter(InputOutputParameter):
     are sample data points with x-, y-, and z-values.
     """
     keyword: ClassVar[str] = 'DETin'
+    layer_types: ClassVar[STRINGS] = CIM_TIN_LAYER,
 # End TinParameter class
 
 
@@ -1201,6 +1320,7 @@ class TinLayerParameter(InputOutputParameter):
     and rendering properties.
     """
     keyword: ClassVar[str] = 'GPTinLayer'
+    layer_types: ClassVar[STRINGS] = CIM_TIN_LAYER,
 # End TinLayerParameter class
 
 
@@ -1244,6 +1364,7 @@ class FeatureClassParameter(SchemaMixin, InputOutputParameter):
     multipoint, polyline, and polygon.
     """
     keyword: ClassVar[str] = 'DEFeatureClass'
+    layer_types: ClassVar[STRINGS] = CIM_FEATURE_LAYER,
     schema_type: ClassVar[str] = GP_FEATURE_SCHEMA
     filter_types: ClassVar[TYPE_FILTERS] = FeatureClassTypeFilter,
 # End FeatureClassParameter class
@@ -1255,6 +1376,7 @@ class FeatureLayerParameter(InputOutputParameter):
     properties.
     """
     keyword: ClassVar[str] = 'GPFeatureLayer'
+    layer_types: ClassVar[STRINGS] = CIM_FEATURE_LAYER,
     filter_types: ClassVar[TYPE_FILTERS] = FeatureClassTypeFilter,
 # End FeatureLayerParameter class
 
@@ -1309,8 +1431,9 @@ class AnalysisCellSizeParameter(InputParameter):
             return value
         if isinstance(value, (float, int)) and value > 0:
             return value
-        raise ValueError(f'Default value for {self.__class__.__name__} '
-                         f'must be greater than 0: {value}')
+        return self._invalid_default(ValueError(
+            f'Default value for {self.__class__.__name__} '
+            f'must be greater than 0: {value}'), value=value)
     # End _validate_default method
 # End AnalysisCellSizeParameter class
 
@@ -1346,14 +1469,14 @@ class BooleanParameter(InputOutputParameter):
             is_required=is_required, is_multi=is_multi, is_enabled=is_enabled)
     # End init built-in
 
-    def _build_default_value(self) -> dict[str, Any]:
+    def _build_default_value(self) -> STRING:
         """
         Build Default Value, stored as string version of lowercase.
         """
         value = self.default_value
         if value is not None:
             value = str(value).casefold()
-        return {ParameterContentKeys.value: value}
+        return value
     # End _build_default_value method
 
     def _validate_required(self, value: BOOL) -> BOOL:
@@ -1361,8 +1484,12 @@ class BooleanParameter(InputOutputParameter):
         Validate Required, disallow optional Boolean parameters
         """
         if value not in (True, None):
-            raise ValueError(f'Invalid is_required value: {value}, can only '
-                             f'be True (Required) or None (Derived)')
+            raise_or_collect(
+                ValueError(f'Invalid is_required value: {value}, can only '
+                           f'be True (Required) or None (Derived)'),
+                location=self._name, rule=DiagnosticRules.required_value,
+                value=value)
+            return True
         return value
     # End _validate_required method
 
@@ -1372,8 +1499,9 @@ class BooleanParameter(InputOutputParameter):
         """
         if isinstance(value, bool):
             return value
-        raise TypeError(
-            f'Invalid default value for {self.__class__.__name__}: {value}')
+        return self._invalid_default(TypeError(
+            f'Invalid default value for {self.__class__.__name__}: {value}'),
+            value=value)
     # End _validate_default method
 # End BooleanParameter class
 
@@ -1429,7 +1557,7 @@ class DateParameter(InputOutputParameter):
         return value.strftime(fmt)
     # End _as_string method
 
-    def _build_default_value(self) -> dict[str, Any]:
+    def _build_default_value(self) -> STRING:
         """
         Build Default Value
         """
@@ -1439,11 +1567,10 @@ class DateParameter(InputOutputParameter):
                 value = ()
             elif not isinstance(value, (list, tuple)):  # pragma: no cover
                 value = value,
-            value = SEMI_COLON.join(quote(self._as_string(v)) for v in value)
-        else:
-            if value is not None:
-                value = self._as_string(value)
-        return {ParameterContentKeys.value: value}
+            return SEMI_COLON.join(quote(self._as_string(v)) for v in value)
+        if value is not None:
+            value = self._as_string(value)
+        return value
     # End _build_default_value method
 # End DateParameter class
 
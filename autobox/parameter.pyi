@@ -17,8 +17,8 @@ from autobox.filter import (
     LongRangeFilter, LongValueFilter, StringValueFilter, TimeUnitFilter,
     TravelModeUnitTypeFilter, WorkspaceTypeFilter)
 from autobox.type import (
-    BOOL, DATETIME, MAP_STR, NUMBER, PATH, STRING, STRINGS, TYPES, TYPE_FILTERS,
-    TYPE_PARAMS)
+    BOOL, DATETIME, MAP_STR, NUMBER, PARAMETER_CACHE, PATH, STRING, STRINGS,
+    TYPES, TYPE_FILTERS, TYPE_PARAMS)
 
 
 class BaseParameter:
@@ -29,6 +29,9 @@ class BaseParameter:
     dependency_types: ClassVar[TYPE_PARAMS]
     filter_types: ClassVar[TYPE_FILTERS]
     default_types: ClassVar[TYPES]
+    layer_types: ClassVar[STRINGS]
+    _data_type: ClassVar[MAP_STR]
+    _multi_data_type: ClassVar[MAP_STR]
 
     _label: str
     _name: str
@@ -42,7 +45,10 @@ class BaseParameter:
     _dependency: InputOutputParameter | None
     _filter: AbstractFilter | None
     _symbology: PATH
+    _revision: int
+    _cache: PARAMETER_CACHE | None
 
+    def __init_subclass__(cls, **kwargs: Any) -> None: ...
     def __init__(self, label: str, name: STRING = None, category: STRING = None,
                  description: STRING = None, default_value: Any = None,
                  is_input: bool = True, is_required: BOOL = True,
@@ -54,24 +60,24 @@ class BaseParameter:
     def _validate_required(self, value: BOOL) -> BOOL: ...
     def _validate_multi_default(self, value: Any) -> Any: ...
     def _validate_default(self, value: Any) -> Any: ...
-    @staticmethod
-    def _validate_type(value: Any, types: TYPES, text: str) -> Any: ...
+    def _invalid_default(self, error: Exception, value: Any) -> None | NoReturn: ...
+    def _validate_type(self, value: Any, types: TYPES, text: str,
+                       rule: str) -> Any: ...
     def _validate_dependency(self, value: Any) -> Any: ...
-    @staticmethod
-    def _validate_layer_file(path: PATH) -> PATH: ...
-    def _build_parameter_type(self) -> dict[str, STRING]: ...
-    def _build_direction(self) -> dict[str, STRING]: ...
-    def _build_display_name(self) -> tuple[MAP_STR, MAP_STR]: ...
-    def _build_category(self, categories: dict[str, int]) -> dict[str, STRING]: ...
-    def _build_data_type(self) -> dict[str, str | MAP_STR]: ...
+    def _validate_layer_file(self, path: PATH) -> PATH: ...
+    def check_default(self) -> None | NoReturn: ...
+    def check_symbology(self) -> None | NoReturn: ...
+    def _build_parameter_type(self) -> STRING: ...
+    def _build_direction(self) -> STRING: ...
+    def _build_category(self, categories: dict[str, int]) -> STRING: ...
+    def _build_data_type(self) -> MAP_STR: ...
     def _build_filter(self) -> tuple[dict, MAP_STR]: ...
-    def _build_dependency(self) -> MAP_STR: ...
+    def _build_dependency(self) -> list[str] | None: ...
     def _build_schema(self) -> MAP_STR: ...
-    def _build_symbology(self, target: PATH) -> MAP_STR: ...
-    def _build_default_value(self) -> dict[str, Any]: ...
+    def _build_symbology(self, target: PATH) -> STRING: ...
+    def _build_default_value(self) -> Any: ...
     @staticmethod
     def _make_flattened_value(value: list | tuple) -> str: ...
-    def _build_description(self) -> tuple[MAP_STR, MAP_STR]: ...
     def _serialize(self, categories: dict[str, int], target: Path) -> tuple[dict[str, dict], MAP_STR]: ...
     @property
     def name(self) -> str: ...
@@ -160,7 +166,9 @@ class SchemaMixin:
     Schema Mixin
     """
     schema_type: ClassVar[str]
+    _schema: ClassVar[MAP_STR]
 
+    def __init_subclass__(cls, **kwargs: Any) -> None: ...
     def _build_schema(self) -> MAP_STR: ...
 # End SchemaMixin class
 
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+Toolbox Reader
+"""
+
+
+from json import loads
+from pathlib import Path
+from typing import Any, NoReturn, Self
+from zipfile import ZipFile, ZipInfo
+
+from autobox.constant import (
+    COLON, DOLLAR_RC, DOT, TOOL, TOOLBOX, TOOLBOX_CONTENT, TOOLBOX_CONTENT_RC,
+    TOOL_CONTENT, TOOL_CONTENT_RC, ToolboxContentKeys,
+    ToolboxContentResourceKeys)
+from autobox.type import STRING, ToolEntry
+from autobox.util import validate_path
+
+
+class ToolboxReader:
+    """
+    Toolbox Reader, lazy read access to an existing toolbox (.atbx) file.
+    Members are only inflated when they are requested.
+    """
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize the ToolboxReader class
+
+        :param path: Path to an existing toolbox file.
+        """
+        super().__init__()
+        self._path: Path = validate_path(path, text=TOOLBOX)
+        self._zip: ZipFile | None = None
+        self._content: dict | None = None
+        self._resource: dict | None = None
+        self._tools: list[ToolEntry] | None = None
+        self._index: dict[str, ToolEntry] | None = None
+    # End init built-in
+
+    def __repr__(self) -> str:
+        """
+        Class Representation
+        """
+        return f'{self.__class__.__name__}(path={str(self.path)!r})'
+    # End repr built-in
+
+    def __enter__(self) -> Self:
+        """
+        Enter Context
+        """
+        return self
+    # End enter built-in
+
+    def __exit__(self, *_) -> None:
+        """
+        Exit Context
+        """
+        self.close()
+    # End exit built-in
+
+    def _open(self) -> ZipFile:
+        """
+        Open the archive on first use
+        """
+        if self._zip is None:
+            self._zip = ZipFile(self.path)
+        return self._zip
+    # End _open method
+
+    def _build_tools(self) -> list[ToolEntry]:
+        """
+        Build Tool Entries from the toolsets in the toolbox content
+        """
+        tools = []
+        mapping = self.resource.get(ToolboxContentResourceKeys.map, {})
+        toolsets = self.content.get(ToolboxContentKeys.toolsets, {})
+        for key, value in toolsets.items():
+            if key == ToolboxContentKeys.root:
+                toolset = ''
+            else:
+                toolset = mapping.get(key.removeprefix(DOLLAR_RC), key)
+            for qualified_name in value.get(ToolboxContentKeys.tools, []):
+                if not qualified_name:
+                    continue
+                name, _, folder = qualified_name.partition(COLON)
+                folder = folder.removesuffix(f'{DOT}{TOOL}') or name
+                tools.append(ToolEntry(
+                    name=name, folder=folder, toolset=toolset))
+        return tools
+    # End _build_tools method
+
+    @property
+    def path(self) -> Path:
+        """
+        Path
+        """
+        return self._path
+    # End path property
+
+    @property
+    def name(self) -> str:
+        """
+        Name, the file name without the extension
+        """
+        return self.path.stem
+    # End name property
+
+    @property
+    def names(self) -> list[str]:
+        """
+        Member Names in archive order
+        """
+        return self._open().namelist()
+    # End names property
+
+    @property
+    def content(self) -> dict[str, Any]:
+        """
+        Toolbox Content
+        """
+        if self._content is None:
+            self._content = self.read_json(TOOLBOX_CONTENT)
+        return self._content
+    # End content property
+
+    @property
+    def resource(self) -> dict[str, Any]:
+        """
+        Toolbox Content Resource
+        """
+        if self._resource is None:
+            self._resource = self.read_json(TOOLBOX_CONTENT_RC)
+        return self._resource
+    # End resource property
+
+    @property
+    def label(self) -> str:
+        """
+        Label
+        """
+        mapping = self.resource.get(ToolboxContentResourceKeys.map, {})
+        return mapping.get(ToolboxContentResourceKeys.title, self.name)
+    # End label property
+
+    @property
+    def description(self) -> STRING:
+        """
+        Description
+        """
+        mapping = self.resource.get(ToolboxContentResourceKeys.map, {})
+        return mapping.get(ToolboxContentResourceKeys.description)
+    # End description property
+
+    @property
+    def alias(self) -> str:
+        """
+        Alias
+        """
+        return self.content.get(ToolboxContentKeys.alias, '')
+    # End alias property
+
+    @property
+    def tools(self) -> list[ToolEntry]:
+        """
+        Tool Entries
+        """
+        if self._tools is None:
+            self._tools = self._build_tools()
+        return self._tools
+    # End tools property
+
+    def close(self) -> None:
+        """
+        Close the underlying archive
+        """
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+    # End close method
+
+    def read_bytes(self, name: str) -> bytes:
+        """
+        Read the bytes of a member
+        """
+        return self._open().read(name)
+    # End read_bytes method
+
+    def read_json(self, name: str) -> dict[str, Any]:
+        """
+        Read a json member, missing members result in an empty dictionary.
+        """
+        try:
+            data = self.read_bytes(name)
+        except KeyError:
+            return {}
+        return loads(data)
+    # End read_json method
+
+    def get_tool(self, name: str) -> ToolEntry | NoReturn:
+        """
+        Get Tool Entry by name, case-insensitive.
+        """
+        if self._index is None:
+            self._index = {t.name.casefold(): t for t in self.tools}
+        if not (tool := self._index.get(name.casefold())):
+            raise KeyError(f'Tool not found: {name}')
+        return tool
+    # End get_tool method
+
+    def get_tool_members(self, name: str) -> list[ZipInfo]:
+        """
+        Get the archive members of a tool, directory entries excluded.
+        """
+        prefix = f'{self.get_tool(name).folder}{DOT}{TOOL}/'
+        return [i for i in self._open().infolist()
+                if i.filename.startswith(prefix) and not i.is_dir()]
+    # End get_tool_members method
+
+    def read_tool(self, name: str) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Read the content and resource of a tool
+        """
+        tool = self.get_tool(name)
+        prefix = f'{tool.folder}{DOT}{TOOL}/'
+        return (self.read_json(f'{prefix}{TOOL_CONTENT}'),
+                self.read_json(f'{prefix}{TOOL_CONTENT_RC}'))
+    # End read_tool method
+# End ToolboxReader class
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
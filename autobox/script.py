@@ -5,23 +5,29 @@ Script Tool
 
 
 from abc import abstractmethod
+from copy import copy, deepcopy
 from datetime import datetime
-from json import dump
 from operator import itemgetter
 from pathlib import Path
-from shutil import copyfile
-from typing import NoReturn, Self
+from typing import Iterable, NoReturn, Self
 
 from autobox.constant import (
-    COLON, DEPENDENCY, DOT, ENCODING, ICON, ILLUSTRATION, JPG, PNG,
-    ParameterContentKeys, RELATIVE, SCRIPT, SCRIPT_STUB, SEMI_COLON, SPACE,
-    ScriptToolContentKeys, ScriptToolContentResourceKeys, TOOL, TOOL_CONTENT,
-    TOOL_CONTENT_RC, TOOL_ICON, TOOL_ILLUSTRATION, TOOL_SCRIPT_EXECUTE_LINK,
-    TOOL_SCRIPT_EXECUTE_PY, TOOL_SCRIPT_VALIDATE_PY, ToolAttributeKeywords)
-from autobox.type import MAP_STR, PARAMETER, PATH, STRING, ToolAttributes
+    COLON, DEPENDENCY, DOT, DiagnosticRules, ICON, ILLUSTRATION,
+    JPG, PNG, ParameterContentKeys, RELATIVE, SCRIPT, SCRIPT_STUB,
+    SEMI_COLON, SPACE, ScriptToolContentKeys, ScriptToolContentResourceKeys,
+    TOOL, TOOL_CONTENT, TOOL_CONTENT_RC, TOOL_ICON, TOOL_ILLUSTRATION,
+    TOOL_SCRIPT_EXECUTE_LINK, TOOL_SCRIPT_EXECUTE_PY, TOOL_SCRIPT_VALIDATE_PY,
+    ToolAttributeKeywords)
+from autobox.diagnostic import is_collecting, raise_or_collect
+from autobox.type import (
+    CONTENT_CACHE, MAP_STR, PARAMETER, PATH, STRING, ToolAttributes,
+    ToolMetadata)
 from autobox.util import (
-    get_repeated_names, validate_path, validate_script_folder_name,
-    validate_script_name, wrap_markup)
+    get_cached_bytes, get_repeated_names, read_text, resolve_path,
+    validate_path, validate_script_folder_name, validate_script_name,
+    wrap_markup)
+from autobox.writer import (
+    AbstractWriter, DirectoryWriter, encode_json, join_name)
 
 
 class AbstractScript:
@@ -39,16 +45,14 @@ class AbstractScript:
         self._embed: bool = embed
     # End init built-in
 
-    def _serialize(self, source: Path, target: Path) -> Path:
+    def _serialize(self, writer: AbstractWriter, folder: str,
+                   target: Path) -> str:
         """
-        Serialize File to Temporary Folder
+        Serialize File using the writer, returns the member name
         """
-        name = self._get_file_name()
-        content = self._get_content(target)
-        exec_path = source.joinpath(name)
-        with exec_path.open(mode='w', encoding=ENCODING) as fout:
-            fout.write(content)
-        return exec_path
+        name = join_name(folder, self._get_file_name())
+        writer.write_text(name, self._get_content(target))
+        return name
     # End _serialize method
 
     def _get_content(self, target: Path) -> str:
@@ -60,9 +64,9 @@ class AbstractScript:
         if self._code:
             return self._code
         if self._embed:
-            return self._path.read_text(encoding=ENCODING)
+            return read_text(self._path)
         try:
-            path = self._path.relative_to(target.resolve())
+            path = self._path.relative_to(resolve_path(target))
         except ValueError:
             return str(self._path)
         return f'{RELATIVE}{path}'
@@ -89,7 +93,9 @@ class AbstractScript:
         """
         Serialize Execution Script to Disk
         """
-        return self._serialize(source=source, target=target)
+        with DirectoryWriter(source) as writer:
+            name = self._serialize(writer, folder='', target=target)
+        return source.joinpath(name)
     # End serialize method
 # End AbstractScript class
 
@@ -174,7 +180,8 @@ class ScriptTool:
     """
     def __init__(self, name: str, label: STRING = None,
                  description: STRING = None, summary: STRING = None,
-                 attributes: ToolAttributes = ToolAttributes()) -> None:
+                 attributes: ToolAttributes = ToolAttributes(),
+                 metadata: ToolMetadata = ToolMetadata()) -> None:
         """
         Initialize the ScriptTool class
 
@@ -187,6 +194,8 @@ class ScriptTool:
             this text can be plain text or html.
         :param attributes: An optional tuple of booleans which set special
             attributes on the script tool.
+        :param metadata: An optional tuple of the application version and
+            product written to the tool content.
         """
         super().__init__()
         self._name: str = self._validate_name(name)
@@ -195,11 +204,15 @@ class ScriptTool:
         self._description: STRING = description
         self._summary: STRING = summary
         self._attributes: ToolAttributes = attributes
+        self._metadata: ToolMetadata = metadata
         self._execution: ExecutionScript | None = None
         self._validation: ValidationScript | None = None
         self._icon: PATH = None
         self._illustration: PATH = None
         self._parameters: list[PARAMETER] = []
+        self._shared: bool = False
+        self._revision: int = 0
+        self._cache: CONTENT_CACHE | None = None
     # End init built-in
 
     def __repr__(self) -> str:
@@ -216,7 +229,10 @@ class ScriptTool:
         Validate Name
         """
         if not (validated_name := validate_script_name(name)):
-            raise ValueError(f'Invalid script name: {name}')
+            raise_or_collect(ValueError(f'Invalid script name: {name}'),
+                             location=name, rule=DiagnosticRules.tool_name,
+                             value=name)
+            return str(name)
         return validated_name
     # End _validate_name method
 
@@ -247,10 +263,11 @@ class ScriptTool:
         mapping = {
             ScriptToolContentKeys.type: 'ScriptTool',
             ScriptToolContentKeys.display_name: '$rc:title',
-            ScriptToolContentKeys.application_version: '13.4',
+            ScriptToolContentKeys.application_version: (
+                self.metadata.application_version),
             ScriptToolContentKeys.description: '$rc:description',
             ScriptToolContentKeys.attributes: [],
-            ScriptToolContentKeys.product: '100',
+            ScriptToolContentKeys.product: self.metadata.product,
             ScriptToolContentKeys.updated: (
                 datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
             ScriptToolContentKeys.parameters: parameter_content,
@@ -266,18 +283,65 @@ class ScriptTool:
         return mapping, parameter_resource
     # End _build_content method
 
+    def _make_cache_key(self, target: Path) -> tuple:
+        """
+        Make Cache Key, changes whenever the tool, its parameters (added,
+        removed, reordered or modified through a setter), or the target
+        changes.  Parameters are held in the key so their ids are not reused.
+        """
+        # noinspection PyProtectedMember
+        return (self._revision, target,
+                tuple((p, p._revision) for p in self._parameters))
+    # End _make_cache_key method
+
+    def _get_cached_content(self, target: Path) \
+            -> tuple[dict[str, str | dict[str, list]], dict[str, MAP_STR]]:
+        """
+        Get Cached Content and Resource, built once and reused while the
+        tool is unchanged, the updated timestamp is that of the last change.
+        Nothing is cached while collecting diagnostics so that problems are
+        reported on every build.  Changes made to default value or filter
+        objects in place are not tracked, assign a new object instead.
+        """
+        if is_collecting():
+            content, parameter_resource = self._build_content(target)
+            return content, self._build_resource(parameter_resource)
+        key = self._make_cache_key(target)
+        if self._cache and self._cache[0] == key:
+            return self._cache[1], self._cache[2]
+        content, parameter_resource = self._build_content(target)
+        resource = self._build_resource(parameter_resource)
+        self._cache = key, content, resource, None
+        return content, resource
+    # End _get_cached_content method
+
+    def _get_cached_bytes(self, target: Path) -> tuple[bytes, bytes]:
+        """
+        Get Cached Bytes of the content and resource, encoded once and
+        cached alongside the content and resource.
+        """
+        content, resource = self._get_cached_content(target)
+        if is_collecting():
+            return encode_json(content), encode_json(resource)
+        key, _, _, encoded = self._cache
+        if encoded is None:
+            encoded = encode_json(content), encode_json(resource)
+            self._cache = key, content, resource, encoded
+        return encoded
+    # End _get_cached_bytes method
+
     def _build_parameters(self, target: Path) \
             -> tuple[dict[str, dict] | str, MAP_STR]:
         """
         Build Parameters
         """
-        if not self.parameters:
+        if not self._parameters:
             return '', {}
         parameters = {}
         resources = {}
         self._check_parameter_repeats()
         categories = self._build_categories()
-        for parameter in self.parameters:
+        for parameter in self._parameters:
             content, resource = parameter.serialize(categories, target=target)
             resources.update(resource)
             parameters[parameter.name] = content
@@ -294,7 +358,7 @@ class ScriptTool:
         """
         counter = 1
         categories = {}
-        for parameter in self.parameters:
+        for parameter in self._parameters:
             if not (category := parameter.category):
                 continue
             if category in categories:
@@ -317,27 +381,36 @@ class ScriptTool:
         return {ScriptToolContentResourceKeys.map: data}
     # End _build_resource method
 
-    def _copy_images(self, source: Path) -> None:
+    def _copy_images(self, writer: AbstractWriter, folder: str) -> None:
         """
-        Copy Images
+        Copy Images, the content is used when it has been read ahead
         """
         for name, path in zip((TOOL_ICON, TOOL_ILLUSTRATION),
                               (self.icon, self.illustration)):
             if not path:
                 continue
-            copyfile(path, source.joinpath(f'{name}{path.suffix}'))
+            member = join_name(folder, f'{name}{path.suffix}')
+            if (data := get_cached_bytes(path)) is None:
+                writer.copy_file(path, member)
+            else:
+                writer.write_bytes(member, data)
     # End _copy_images method
 
-    def _check_parameter_repeats(self) -> None | NoReturn:
+    def _check_parameter_repeats(
+            self, parameters: list[PARAMETER] | None = None) -> None | NoReturn:
         """
         Check for Parameter name repetitions, must be unique on a tool
         regardless of case.
         """
-        if not (names := get_repeated_names(self.parameters)):
+        if parameters is None:
+            parameters = self._parameters
+        if not (names := get_repeated_names(parameters)):
             return
-        names = {t.name for t in self.parameters if t.name.casefold() in names}
+        names = {t.name for t in parameters if t.name.casefold() in names}
         names = f'{SEMI_COLON}{SPACE}'.join(sorted(names))
-        raise ValueError(f'Parameter name repetition detected: {names}')
+        raise_or_collect(
+            ValueError(f'Parameter name repetition detected: {names}'),
+            location=None, rule=DiagnosticRules.parameter_repeat, value=names)
     # End _check_parameter_repeats method
 
     @staticmethod
@@ -347,33 +420,34 @@ class ScriptTool:
         """
         if not path:
             return
-        path = validate_path(path, text=text)
+        if not (path := validate_path(path, text=text)):
+            return
         if path.suffix.casefold() not in (PNG, JPG):
-            raise TypeError(f'Invalid {text} file type: {path.suffix}')
+            raise_or_collect(
+                TypeError(f'Invalid {text} file type: {path.suffix}'),
+                location=text, rule=DiagnosticRules.image_type, value=path)
+            return
         return path
     # End _validate_image method
 
-    def _serialize(self, source: Path, target: Path) -> Path:
+    def _serialize(self, writer: AbstractWriter, target: Path) -> str:
         """
-        Serialize Files to Temporary Folder
+        Serialize Files using the writer, returns the tool folder name
         """
-        content, parameter_resource = self._build_content(target)
-        resource = self._build_resource(parameter_resource)
-        script_path = source.joinpath(f'{self._folder}{DOT}{TOOL}')
-        script_path.mkdir()
+        folder = f'{self._folder}{DOT}{TOOL}'
         for name, data in zip((TOOL_CONTENT, TOOL_CONTENT_RC),
-                              (content, resource)):
-            file_path = script_path.joinpath(name)
-            with file_path.open(mode='w', encoding=ENCODING) as fout:
-                # noinspection PyTypeChecker
-                dump(data, fp=fout, indent=2)
-        if not self.execution_script:
-            self.execution_script = DEFAULT_EXECUTION_SCRIPT
-        self.execution_script.serialize(source=script_path, target=target)
+                              self._get_cached_bytes(target)):
+            writer.write_bytes(join_name(folder, name), data)
+        # NOTE default is not assigned, serializing leaves the tool unchanged
+        script = self.execution_script or DEFAULT_EXECUTION_SCRIPT
+        # noinspection PyProtectedMember
+        script._serialize(writer, folder=folder, target=target)
         if self.validation_script:
-            self.validation_script.serialize(source=script_path, target=target)
-        self._copy_images(script_path)
-        return script_path
+            # noinspection PyProtectedMember
+            self.validation_script._serialize(
+                writer, folder=folder, target=target)
+        self._copy_images(writer, folder=folder)
+        return folder
     # End _serialize method
 
     @property
@@ -426,6 +500,19 @@ class ScriptTool:
         return self._attributes
     # End attributes property
 
+    @property
+    def metadata(self) -> ToolMetadata:
+        """
+        Metadata
+        """
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: ToolMetadata) -> None:
+        self._metadata = value
+        self._revision += 1
+    # End metadata property
+
     @property
     def execution_script(self) -> ExecutionScript | None:
         """
@@ -474,28 +561,128 @@ class ScriptTool:
         self._illustration = self._validate_image(value, text=ILLUSTRATION)
     # End illustration property
 
+    def _detach_parameters(self) -> None:
+        """
+        Detach Parameters, a clone sharing the parameters of its template
+        takes its own copy before it is changed, dependencies between the
+        parameters are kept within the copy.
+        """
+        if not self._shared:
+            return
+        self._parameters = deepcopy(self._parameters)
+        self._shared = False
+    # End _detach_parameters method
+
+    @staticmethod
+    def _validate_parameter(parameter: PARAMETER) -> PARAMETER | NoReturn:
+        """
+        Validate Parameter
+        """
+        if not hasattr(parameter, DEPENDENCY):
+            raise TypeError(f'Expected a parameter, got: {parameter}')
+        return parameter
+    # End _validate_parameter method
+
     @property
     def parameters(self) -> list[PARAMETER]:
         """
         Parameters
         """
         return self._parameters
+
+    @parameters.setter
+    def parameters(self, value: Iterable[PARAMETER]) -> None:
+        self._parameters = [self._validate_parameter(p) for p in value]
+        self._shared = False
     # End parameters property
 
     def add_parameter(self, parameter: PARAMETER) -> None:
         """
         Add Parameter
         """
-        if not hasattr(parameter, DEPENDENCY):
-            raise TypeError(f'Expected a parameter, got: {parameter}')
-        self.parameters.append(parameter)
+        self._validate_parameter(parameter)
+        self._detach_parameters()
+        self._parameters.append(parameter)
     # End add_parameter method
 
+    def add_parameters(self, parameters: Iterable[PARAMETER]) -> None:
+        """
+        Add Parameters, the batch is validated before any parameter is added
+        and the parameter names are checked for repetition once on the tool.
+        """
+        parameters = [self._validate_parameter(p) for p in parameters]
+        self._check_parameter_repeats([*self._parameters, *parameters])
+        self._detach_parameters()
+        self._parameters.extend(parameters)
+    # End add_parameters method
+
+    def clone(self, name: str, label: STRING = None,
+              description: STRING = None, summary: STRING = None,
+              attributes: ToolAttributes | None = None,
+              metadata: ToolMetadata | None = None,
+              execution_script: ExecutionScript | None = None,
+              validation_script: ValidationScript | None = None,
+              icon: PATH = None, illustration: PATH = None) -> Self:
+        """
+        Clone the script tool, any tool can act as a template for many
+        similar tools.  This tool keeps its parameters, the clone shares
+        the parameter objects (and their serialized content) in a list of
+        its own until parameters are added to or set on the clone, at which
+        point the clone takes its own copy of them.  Values which are not
+        overridden are taken from this tool, a label which defaulted to the
+        name follows the new name.
+
+        :param name: The name of the new script tool, alphanumeric
+            characters only, cannot start with a number.
+        :param label: An optional label for the new script tool.
+        :param description: An optional description overriding this one.
+        :param summary: An optional summary overriding this one.
+        :param attributes: Optional attributes overriding these ones.
+        :param metadata: Optional metadata overriding this one.
+        :param execution_script: An optional execution script overriding
+            this one.
+        :param validation_script: An optional validation script overriding
+            this one.
+        :param icon: An optional icon path overriding this one.
+        :param illustration: An optional illustration path overriding this
+            one.
+        """
+        tool = copy(self)
+        tool._name = tool._validate_name(name)
+        tool._folder = tool._validate_folder_name(tool._name)
+        if label is None and self._label != self._name:
+            label = self._label
+        tool._label = tool._validate_label(label, name=tool._name)
+        if description is not None:
+            tool._description = description
+        if summary is not None:
+            tool._summary = summary
+        if attributes is not None:
+            tool._attributes = attributes
+        if metadata is not None:
+            tool._metadata = metadata
+        if execution_script is not None:
+            tool._execution = execution_script
+        if validation_script is not None:
+            tool._validation = validation_script
+        if icon is not None:
+            tool.icon = icon
+        if illustration is not None:
+            tool.illustration = illustration
+        tool._parameters = list(self._parameters)
+        tool._shared = True
+        tool._revision = 0
+        tool._cache = None
+        return tool
+    # End clone method
+
     def serialize(self, source: Path, target: Path) -> Path:
         """
         Serialize Script Tool to Disk
         """
-        return self._serialize(source=source, target=target)
+        with DirectoryWriter(source) as writer:
+            folder = self._serialize(writer, target=target)
+        return source.joinpath(folder)
     # End serialize method
 # End ScriptTool class
 
@@ -4,22 +4,24 @@ Toolbox
 """
 
 
-from json import dump
+from copy import copy
+from functools import partial
 from operator import attrgetter
-from os import walk
 from pathlib import Path
-from shutil import rmtree
-from typing import NoReturn, TYPE_CHECKING
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import Callable, Iterable, NoReturn, TYPE_CHECKING
 
 from autobox.constant import (
-    DOLLAR_RC, DOT, ENCODING, ATBX, ILLUSTRATION, NAME, PARENT, SEMI_COLON,
-    SPACE, TOOLBOX_CONTENT, TOOLBOX_CONTENT_RC, TOOLSET, ToolboxContentKeys,
-    ToolboxContentResourceKeys)
-from autobox.type import MAP_STR, PATH, STRING, TOOLS_MAP
+    ARCHIVE, DIRECTORY, DOLLAR_RC, DOT, ATBX, ILLUSTRATION, NAME,
+    PARENT, SEMI_COLON, SPACE, TOOLBOX_CONTENT, TOOLBOX_CONTENT_RC, TOOLSET,
+    DiagnosticRules, ToolboxContentKeys, ToolboxContentResourceKeys)
+from autobox.diagnostic import (
+    collect, has_diagnostics, is_collecting, raise_or_collect, report, scope)
+from autobox.type import MAP_STR, PATH, STRING, TOOLS_MAP, ValidationResult
 from autobox.util import (
-    get_repeated_names, make_temp_folder, validate_toolbox_alias,
-    validate_toolbox_name)
+    cache_paths, check_deferred_paths, check_paths, get_repeated_names,
+    is_file, validate_toolbox_alias, validate_toolbox_name)
+from autobox.writer import (
+    AbstractWriter, DirectoryWriter, MemoryWriter, NullWriter, ZipWriter)
 
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -66,7 +68,10 @@ class Toolbox:
         Validate Name
         """
         if not (validated_name := validate_toolbox_name(name)):
-            raise ValueError(f'Invalid toolbox name: {name}')
+            raise_or_collect(ValueError(f'Invalid toolbox name: {name}'),
+                             location=name, rule=DiagnosticRules.toolbox_name,
+                             value=name)
+            return str(name)
         return validated_name
     # End _validate_name method
 
@@ -77,7 +82,11 @@ class Toolbox:
         """
         if not (validated_alias := validate_toolbox_alias(alias)):
             if not (validated_alias := validate_toolbox_alias(name)):
-                raise ValueError(f'Invalid toolbox alias: {alias}')
+                raise_or_collect(
+                    ValueError(f'Invalid toolbox alias: {alias}'),
+                    location=name, rule=DiagnosticRules.toolbox_alias,
+                    value=alias)
+                return str(alias or name)
         return validated_alias
     # End _validate_alias method
 
@@ -91,56 +100,49 @@ class Toolbox:
         return label.strip() or name
     # End _validate_label method
 
-    def _serialize(self, source: Path, target: Path) -> None:
+    def _serialize(self, writer: AbstractWriter, target: Path,
+                   prefetch: bool = False) -> None:
         """
-        Serialize Files to Temporary Folder
+        Serialize Files using the writer, paths are checked concurrently and
+        resolved once per save
         """
-        content, toolset_names = self._build_content(
-            source=source, target=target)
+        with cache_paths():
+            self._check_paths(prefetch=prefetch)
+            content, toolset_names = self._build_content(
+                writer=writer, target=target)
         resource = self._build_resource(toolset_names)
         for name, data in zip((TOOLBOX_CONTENT, TOOLBOX_CONTENT_RC),
                               (content, resource)):
-            file_path = source.joinpath(name)
-            with file_path.open(mode='w', encoding=ENCODING) as fout:
-                # noinspection PyTypeChecker
-                dump(data, fp=fout, indent=2)
+            writer.write_json(name, data)
     # End _serialize method
 
-    @staticmethod
-    def _save_toolbox(source: Path, target: Path) -> None:
-        """
-        Save Toolbox
-        """
-        with ZipFile(target, mode='w', compression=ZIP_DEFLATED) as zout:
-            for folder, _, files in walk(source):
-                path = Path(folder)
-                for f in files:
-                    full_path = path.joinpath(f)
-                    zout.write(full_path, full_path.relative_to(source))
-        rmtree(source)
-    # End _save_toolbox method
-
     def _get_toolbox_path(self, folder: Path, overwrite: bool) -> Path | NoReturn:
         """
         Get Toolbox Path, if the file exists and overwrite is False raise
-        an exception otherwise delete the file and return the path.
+        an exception.  An existing file is left in place, the archive writer
+        replaces it once the new archive is complete.
         """
         toolbox_path = folder.joinpath(f'{self.name}{ATBX}')
-        if toolbox_path.is_file():
-            if not overwrite:
-                raise FileExistsError(f'File already exists: {toolbox_path}')
-            else:
-                toolbox_path.unlink(missing_ok=True)
+        if toolbox_path.is_file() and not overwrite:
+            raise FileExistsError(f'File already exists: {toolbox_path}')
         return toolbox_path
     # End _get_toolbox_path method
 
-    def _build_content(self, source: Path, target: Path) -> tuple[
+    def _build_content(self, writer: AbstractWriter, target: Path) -> tuple[
             dict[str, str | dict[str, list]], MAP_STR]:
         """
         Build Content
         """
         toolsets, toolset_names = self._build_toolsets(
-            source=source, target=target)
+            writer=writer, target=target)
+        return self._make_content(toolsets), toolset_names
+    # End _build_content method
+
+    def _make_content(self, toolsets: TOOLS_MAP) \
+            -> dict[str, str | dict[str, list]]:
+        """
+        Make Content from the toolsets mapping
+        """
         mapping = {
             ToolboxContentKeys.version: '1.0',
             ToolboxContentKeys.alias: self.alias,
@@ -152,8 +154,8 @@ class Toolbox:
         }
         if not self.description:
             mapping.pop(ToolboxContentKeys.description)
-        return mapping, toolset_names
-    # End _build_content method
+        return mapping
+    # End _make_content method
 
     def _build_resource(self, toolset_names: MAP_STR) -> dict[str, MAP_STR]:
         """
@@ -165,7 +167,7 @@ class Toolbox:
         return {ToolboxContentResourceKeys.map: {**data, **toolset_names}}
     # End _build_resource method
 
-    def _build_toolsets(self, source: Path, target: Path) \
+    def _build_toolsets(self, writer: AbstractWriter, target: Path) \
             -> tuple[TOOLS_MAP, MAP_STR]:
         """
         Build Toolsets (and tools)
@@ -175,39 +177,42 @@ class Toolbox:
         if not self.tools and not has_toolset_tools:
             return nada, {}
         self._check_tool_repeats()
-        root_mapping = self._build_root_tools(source=source, target=target)
+        root_mapping = self._build_root_tools(writer=writer, target=target)
         if not has_toolset_tools:
             return root_mapping or nada, {}
         toolset_tools, toolset_names = self._build_toolset_tools(
-            source=source, target=target)
+            writer=writer, target=target)
         return {**root_mapping, **toolset_tools} or nada, toolset_names
     # End _build_toolsets method
 
-    def _build_root_tools(self, source: Path, target: Path) -> TOOLS_MAP:
+    def _build_root_tools(self, writer: AbstractWriter, target: Path) \
+            -> TOOLS_MAP:
         """
         Build Root Tools
         """
         if not self.tools:
             return {}
         tools = self._make_tools_list(
-            source=source, target=target, tools=self.tools)
+            writer=writer, target=target, tools=self.tools)
         return {ToolboxContentKeys.root: {ToolboxContentKeys.tools: tools}}
     # End _build_root_tools method
 
     @staticmethod
-    def _make_tools_list(source: Path, target: Path,
+    def _make_tools_list(writer: AbstractWriter, target: Path,
                          tools: list['ScriptTool']) -> list[str]:
         """
         Make Tools List
         """
         names = []
         for tool in sorted(tools, key=attrgetter(NAME)):
-            tool.serialize(source=source, target=target)
+            with scope(tool.name):
+                # noinspection PyProtectedMember
+                tool._serialize(writer, target=target)
             names.append(tool.qualified_name)
         return names
     # End _make_tools_list method
 
-    def _build_toolset_tools(self, source: Path, target: Path) \
+    def _build_toolset_tools(self, writer: AbstractWriter, target: Path) \
             -> tuple[TOOLS_MAP, MAP_STR]:
         """
         Build Toolset Tools and Toolset Mapping
@@ -222,7 +227,7 @@ class Toolbox:
             self._check_toolset_repeats(toolset.toolsets)
             toolsets.extend(toolset.toolsets)
             if not (tools := self._make_tools_list(
-                    source=source, target=target, tools=toolset.tools)):
+                    writer=writer, target=target, tools=toolset.tools)):
                 continue
             counter += 1
             indexed_name = f'{TOOLSET}{counter}{DOT}{NAME}'
@@ -243,13 +248,14 @@ class Toolbox:
         paths = {t.qualified_name
                  for t in toolsets if t.name.casefold() in names}
         paths = f'{SEMI_COLON}{SPACE}'.join(sorted(paths))
-        raise ValueError(f'Toolset name repetition detected: {paths}')
+        raise_or_collect(
+            ValueError(f'Toolset name repetition detected: {paths}'),
+            location=None, rule=DiagnosticRules.toolset_repeat, value=paths)
     # End _check_toolset_repeats method
 
-    def _check_tool_repeats(self) -> None | NoReturn:
+    def _gather_tools(self) -> list['ScriptTool']:
         """
-        Check for Tool name repetitions, tool names must be unique across
-        the toolbox regardless of case.
+        Gather Tools, the root tools followed by the tools in the toolsets
         """
         tools = list(self.tools)
         toolsets = list(self.toolsets)
@@ -257,11 +263,27 @@ class Toolbox:
             toolset = toolsets.pop(0)
             tools.extend(toolset.tools)
             toolsets.extend(toolset.toolsets)
+        return tools
+    # End _gather_tools method
+
+    def _check_tool_repeats(self, others: tuple['Toolbox', ...] = (),
+                            added: list['ScriptTool'] = ()) -> None | NoReturn:
+        """
+        Check for Tool name repetitions, tool names must be unique across
+        the toolbox (and any toolboxes being merged in or tools being added)
+        regardless of case.
+        """
+        tools = self._gather_tools()
+        tools.extend(added)
+        for other in others:
+            tools.extend(other._gather_tools())
         if not (names := get_repeated_names(tools)):
             return
         names = {t.name for t in tools if t.name.casefold() in names}
         names = f'{SEMI_COLON}{SPACE}'.join(sorted(names))
-        raise ValueError(f'Tool name repetition detected: {names}')
+        raise_or_collect(
+            ValueError(f'Tool name repetition detected: {names}'),
+            location=None, rule=DiagnosticRules.tool_repeat, value=names)
     # End _check_tool_repeats method
 
     @property
@@ -327,20 +349,244 @@ class Toolbox:
         """
         if not hasattr(toolset, PARENT):
             raise TypeError(f'Expected a toolset, got: {toolset}')
+        toolset.toolbox = self
         self.toolsets.append(toolset)
     # End add_toolset method
 
-    def save(self, folder: Path, overwrite: bool = False) -> PATH:
-        """
-        Save toolbox into specified folder.
-        """
+    def add_script_tools(self, tools: Iterable['ScriptTool']) -> None:
+        """
+        Add Script Tools, the batch is validated before any tool is added and
+        the tool names are checked for repetition once across the toolbox.
+        """
+        tools = list(tools)
+        for tool in tools:
+            if not hasattr(tool, ILLUSTRATION):
+                raise TypeError(f'Expected a tool, got: {tool}')
+        self._check_tool_repeats(added=tools)
+        self.tools.extend(tools)
+    # End add_script_tools method
+
+    def add_toolsets(self, toolsets: Iterable['Toolset']) -> None:
+        """
+        Add Toolsets, the batch is validated before any toolset is added,
+        the toolset names are checked for repetition once at the root and
+        the toolbox is set on each toolset.
+        """
+        toolsets = list(toolsets)
+        for toolset in toolsets:
+            if not hasattr(toolset, PARENT):
+                raise TypeError(f'Expected a toolset, got: {toolset}')
+        self._check_toolset_repeats([*self.toolsets, *toolsets])
+        for toolset in toolsets:
+            toolset.toolbox = self
+        self.toolsets.extend(toolsets)
+    # End add_toolsets method
+
+    @classmethod
+    def _copy_toolset(cls, toolset: 'Toolset') -> 'Toolset':
+        """
+        Copy Toolset, the toolset and its nested toolsets are copied so that
+        merging leaves the source toolbox untouched, tools are shared.
+        """
+        duplicate = copy(toolset)
+        # noinspection PyProtectedMember
+        duplicate._tools = list(toolset.tools)
+        # noinspection PyProtectedMember
+        duplicate._toolsets = []
+        duplicate.parent = None
+        duplicate.toolbox = None
+        for nested in toolset.toolsets:
+            duplicate.add_toolset(cls._copy_toolset(nested))
+        return duplicate
+    # End _copy_toolset method
+
+    @classmethod
+    def _merge_toolsets(cls, existing: list['Toolset'],
+                        toolsets: list['Toolset'],
+                        add: Callable[['Toolset'], None]) -> None:
+        """
+        Merge Toolsets, toolsets with the same name (regardless of case) at
+        the same depth are combined, others are added as copies.
+        """
+        lookup = {t.name.casefold(): t for t in existing}
+        for toolset in toolsets:
+            if not (match := lookup.get(toolset.name.casefold())):
+                toolset = cls._copy_toolset(toolset)
+                add(toolset)
+                lookup[toolset.name.casefold()] = toolset
+                continue
+            for tool in toolset.tools:
+                match.add_script_tool(tool)
+            cls._merge_toolsets(
+                match.toolsets, list(toolset.toolsets), add=match.add_toolset)
+    # End _merge_toolsets method
+
+    def merge(self, *others: 'Toolbox') -> None:
+        """
+        Merge other toolboxes into this toolbox.  Root tools are added to the
+        root and toolsets are combined by name.  Tool names must be unique
+        across all toolboxes.  Toolsets are copied so the other toolboxes
+        are left unchanged, tools are shared, not copied.
+        """
+        for other in others:
+            if not isinstance(other, Toolbox):
+                raise TypeError(f'Expected a toolbox, got: {other}')
+        self._check_tool_repeats(others)
+        for other in others:
+            for tool in other.tools:
+                self.add_script_tool(tool)
+            self._merge_toolsets(
+                self.toolsets, list(other.toolsets), add=self.add_toolset)
+    # End merge method
+
+    def _get_directory_path(self, folder: Path, overwrite: bool) \
+            -> Path | NoReturn:
+        """
+        Get Directory Path, if the directory exists and overwrite is False
+        raise an exception, existing files are kept so that only changed
+        files are written.
+        """
+        directory = folder.joinpath(self.name)
+        if directory.is_file():
+            raise FileExistsError(f'File already exists: {directory}')
+        if directory.is_dir() and not overwrite:
+            raise FileExistsError(f'Directory already exists: {directory}')
+        return directory
+    # End _get_directory_path method
+
+    def _validate_toolsets(self) -> None:
+        """
+        Validate Toolsets, toolset name repetitions at each depth
+        """
+        toolsets = [(self.toolsets, '')]
+        while toolsets:
+            current, location = toolsets.pop(0)
+            with scope(location):
+                self._check_toolset_repeats(current)
+            toolsets.extend((t.toolsets, t.qualified_name) for t in current)
+    # End _validate_toolsets method
+
+    @staticmethod
+    def _gather_paths(tool: 'ScriptTool') -> list[tuple[STRING, Path, bool]]:
+        """
+        Gather Paths, files referenced by the tool along with the location
+        to report against and whether the content is copied into the toolbox
+        """
+        paths = []
+        for script in tool.execution_script, tool.validation_script:
+            # noinspection PyProtectedMember
+            if script and script._path:
+                # noinspection PyProtectedMember
+                paths.append((None, script._path, script._embed))
+        paths.extend((None, p, True)
+                     for p in (tool.icon, tool.illustration) if p)
+        # noinspection PyProtectedMember
+        paths.extend((p.name, p.symbology, False)
+                     for p in tool._parameters if p.symbology)
+        return paths
+    # End _gather_paths method
+
+    def _check_paths(self, prefetch: bool) -> None:
+        """
+        Check Paths referenced by every tool concurrently, the results are
+        kept in the path cache.  When prefetching, the content of the files
+        copied into the toolbox is read ahead as well.  Paths deferred at
+        assignment are checked first, paths already checked within the
+        context are not checked again.
+        """
+        check_deferred_paths()
+        paths = [(path, copied) for tool in self._gather_tools()
+                 for _, path, copied in self._gather_paths(tool)]
+        check_paths(path for path, _ in paths)
+        if prefetch:
+            check_paths((path for path, copied in paths if copied), read=True)
+    # End _check_paths method
+
+    def _validate_paths(self, tool: 'ScriptTool') -> None:
+        """
+        Validate Paths, files referenced by the tool must still exist
+        """
+        for location, path, _ in self._gather_paths(tool):
+            if is_file(path):
+                continue
+            report(location, rule=DiagnosticRules.path_missing,
+                   message=f'File not found: {path}', value=path)
+    # End _validate_paths method
+
+    def validate(self, folder: PATH = None,
+                 deep: bool = False) -> ValidationResult:
+        """
+        Validate the toolbox without writing anything.  The content of every
+        tool is built in memory and all problems found are collected rather
+        than raising on the first, the predicted size of each tool is
+        returned alongside.
+
+        :param folder: Folder the toolbox would be saved into, used to make
+            relative paths, defaults to the current folder.
+        :param deep: Parse the layer files used for symbology and check they
+            suit their parameters, each layer file is parsed once.
+        """
+        target = Path(folder) if folder else Path.cwd()
+        sizes = {}
+        with collect() as diagnostics, cache_paths():
+            self._check_paths(prefetch=False)
+            self._check_tool_repeats()
+            self._validate_toolsets()
+            for tool in self._gather_tools():
+                with scope(tool.name):
+                    self._validate_paths(tool)
+                    # noinspection PyProtectedMember
+                    for parameter in tool._parameters:
+                        parameter.check_default()
+                        if deep:
+                            parameter.check_symbology()
+                    writer = NullWriter()
+                    try:
+                        # noinspection PyProtectedMember
+                        tool._serialize(writer, target=target)
+                    except (OSError, TypeError, ValueError) as err:
+                        report(None, rule=DiagnosticRules.tool_content,
+                               message=str(err))
+                        continue
+                sizes[tool.name] = sum(writer.sizes.values())
+        return ValidationResult(diagnostics=diagnostics, sizes=sizes)
+    # End validate method
+
+    def save(self, folder: Path, overwrite: bool = False,
+             layout: str = ARCHIVE, prefetch: bool = False) -> PATH:
+        """
+        Save toolbox into specified folder.  The archive layout writes a
+        toolbox (.atbx) file, the directory layout writes the unzipped
+        structure into a folder named for the toolbox and, on later saves,
+        only writes the files which changed.  Use pack to make a toolbox
+        file from the directory.  Referenced files are checked concurrently
+        before serialization, when prefetching the embedded scripts and
+        images are also read concurrently.  When collecting diagnostics
+        nothing is written (and None is returned) if any problem has been
+        recorded, the toolbox would otherwise hold fallback values.
+        """
+        if layout not in (ARCHIVE, DIRECTORY):
+            raise ValueError(f'Invalid layout: {layout}')
         if not folder.is_dir():
             return
-        toolbox = self._get_toolbox_path(folder=folder, overwrite=overwrite)
-        temporary = make_temp_folder()
-        self._serialize(source=temporary, target=folder)
-        self._save_toolbox(source=temporary, target=toolbox)
-        return toolbox
+        if layout == DIRECTORY:
+            path = self._get_directory_path(folder=folder, overwrite=overwrite)
+            make_writer = partial(DirectoryWriter, path, prune=True)
+        else:
+            path = self._get_toolbox_path(folder=folder, overwrite=overwrite)
+            make_writer = partial(ZipWriter, path)
+        if not is_collecting():
+            with make_writer() as writer:
+                self._serialize(writer, target=folder, prefetch=prefetch)
+            return path
+        # NOTE output is held back until it is known to be free of problems
+        buffer = MemoryWriter()
+        self._serialize(buffer, target=folder, prefetch=prefetch)
+        if has_diagnostics():
+            return None
+        with make_writer() as writer:
+            buffer.write_to(writer)
+        return path
     # End save method
 # End Toolbox class
 
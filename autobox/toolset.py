@@ -4,14 +4,16 @@ Toolset
 """
 
 
-from typing import NoReturn, Optional, TYPE_CHECKING
+from typing import Iterable, NoReturn, Optional, TYPE_CHECKING
 
-from autobox.constant import ILLUSTRATION, PARENT
-from autobox.util import validate_toolset_name
+from autobox.constant import (
+    DiagnosticRules, ILLUSTRATION, PARENT, SEMI_COLON, SPACE)
+from autobox.diagnostic import raise_or_collect
+from autobox.util import get_repeated_names, validate_toolset_name
 
 
 if TYPE_CHECKING:  # pragma: no cover
-    from autobox import ScriptTool
+    from autobox import ScriptTool, Toolbox
 
 
 class Toolset:
@@ -30,6 +32,7 @@ class Toolset:
         self._toolsets: list['Toolset'] = []
         self._tools: list['ScriptTool'] = []
         self._parent: Optional['Toolset'] = None
+        self._toolbox: Optional['Toolbox'] = None
     # End init built-in
 
     def __repr__(self) -> str:
@@ -45,10 +48,28 @@ class Toolset:
         Validate Name
         """
         if not (validated_name := validate_toolset_name(name)):
-            raise ValueError(f'Invalid toolset name: {name}')
+            raise_or_collect(ValueError(f'Invalid toolset name: {name}'),
+                             location=name, rule=DiagnosticRules.toolset_name,
+                             value=name)
+            return str(name)
         return validated_name
     # End _validate_name method
 
+    @staticmethod
+    def _check_repeats(values: list['Toolset'] | list['ScriptTool'],
+                       text: str, rule: str) -> None | NoReturn:
+        """
+        Check for name repetitions within the toolset regardless of case.
+        """
+        if not (names := get_repeated_names(values)):
+            return
+        names = {v.name for v in values if v.name.casefold() in names}
+        names = f'{SEMI_COLON}{SPACE}'.join(sorted(names))
+        raise_or_collect(
+            ValueError(f'{text} name repetition detected: {names}'),
+            location=None, rule=rule, value=names)
+    # End _check_repeats method
+
     @property
     def name(self) -> str:
         """
@@ -101,6 +122,21 @@ class Toolset:
         self._parent = value
     # End parent property
 
+    @property
+    def toolbox(self) -> Optional['Toolbox']:
+        """
+        Toolbox the outermost toolset has been added to, if any
+        """
+        toolset = self
+        while toolset.parent:
+            toolset = toolset.parent
+        return toolset._toolbox
+
+    @toolbox.setter
+    def toolbox(self, value: Optional['Toolbox']) -> None:
+        self._toolbox = value
+    # End toolbox property
+
     @property
     def qualified_name(self) -> str:
         """
@@ -132,6 +168,42 @@ class Toolset:
         toolset.parent = self
         self.toolsets.append(toolset)
     # End add_toolset method
+
+    def add_script_tools(self, tools: Iterable['ScriptTool']) -> None:
+        """
+        Add Script Tools, the batch is validated before any tool is added and
+        the tool names are checked for repetition once, across the toolbox
+        when the toolset is in one otherwise within the toolset.
+        """
+        tools = list(tools)
+        for tool in tools:
+            if not hasattr(tool, ILLUSTRATION):
+                raise TypeError(f'Expected a tool, got: {tool}')
+        if (toolbox := self.toolbox) is not None:
+            # noinspection PyProtectedMember
+            toolbox._check_tool_repeats(added=tools)
+        else:
+            self._check_repeats([*self.tools, *tools], text='Tool',
+                                rule=DiagnosticRules.tool_repeat)
+        self.tools.extend(tools)
+    # End add_script_tools method
+
+    def add_toolsets(self, toolsets: Iterable['Toolset']) -> None:
+        """
+        Add Toolsets, the batch is validated before any toolset is added,
+        the toolset names are checked for repetition once and the parent is
+        set on each toolset.
+        """
+        toolsets = list(toolsets)
+        for toolset in toolsets:
+            if not hasattr(toolset, PARENT):
+                raise TypeError(f'Expected a toolset, got: {toolset}')
+        self._check_repeats([*self.toolsets, *toolsets], text='Toolset',
+                            rule=DiagnosticRules.toolset_repeat)
+        for toolset in toolsets:
+            toolset.parent = self
+        self.toolsets.extend(toolsets)
+    # End add_toolsets method
 # End Toolset class
 
 
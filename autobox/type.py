@@ -4,9 +4,10 @@ Types and Aliases
 """
 
 
+from array import array
 from datetime import date, datetime, time
 from pathlib import Path
-from typing import NamedTuple, TYPE_CHECKING, Type, TypeAlias, Union
+from typing import Any, NamedTuple, TYPE_CHECKING, Type, TypeAlias, Union
 
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -25,6 +26,7 @@ DATETIME: TypeAlias = datetime | date | time
 STRING: TypeAlias = str | None
 STRINGS: TypeAlias = list[str] | tuple[str, ...]
 NUMBER: TypeAlias = int | float
+NUMBERS: TypeAlias = list[NUMBER] | tuple[NUMBER, ...] | array | memoryview
 MAP_STR: TypeAlias = dict[str, STRING]
 MAP_STR_LIST: TypeAlias = dict[str, str | list[MAP_STR]]
 MAP_DICT_STR_LIST: TypeAlias = dict[str, dict[str, str | list[str]]]
@@ -40,6 +42,9 @@ FIELD_TYPES: TypeAlias = list['FieldType'] | tuple['FieldType', ...]
 GEOMETRY_TYPES: TypeAlias = list['GeometryType'] | tuple['GeometryType', ...]
 TRAVEL_MODES: TypeAlias = list['TravelModeUnitType'] | tuple['TravelModeUnitType', ...]
 WORKSPACE_TYPES: TypeAlias = list['WorkspaceType'] | tuple['WorkspaceType', ...]
+CONTENT_CACHE: TypeAlias = tuple[
+    tuple, dict[str, Any], dict[str, Any], tuple[bytes, bytes] | None]
+PARAMETER_CACHE: TypeAlias = tuple[tuple, dict[str, Any], MAP_STR]
 
 
 class ToolAttributes(NamedTuple):
@@ -53,5 +58,183 @@ class ToolAttributes(NamedTuple):
 # End ToolAttributes class
 
 
+class ToolMetadata(NamedTuple):
+    """
+    Tool Metadata, application version and product written to the content
+    of each script tool.
+    """
+    application_version: str = '13.4'
+    product: str = '100'
+# End ToolMetadata class
+
+
+class ToolEntry(NamedTuple):
+    """
+    Tool Entry, a tool as listed in the content of an existing toolbox
+    """
+    name: str
+    folder: str
+    toolset: str = ''
+# End ToolEntry class
+
+
+class BenchmarkResult(NamedTuple):
+    """
+    Benchmark Result, timings are in seconds
+    """
+    name: str
+    repeat: int
+    best: float
+    mean: float
+# End BenchmarkResult class
+
+
+CHANGES: TypeAlias = dict[str, tuple[Any, Any]]
+
+
+class ParameterChange(NamedTuple):
+    """
+    Parameter Change, changes are keyed on the dotted path into the parameter
+    content and hold the old and new values.
+    """
+    name: str
+    changes: CHANGES
+# End ParameterChange class
+
+
+class ToolChange(NamedTuple):
+    """
+    Tool Change
+    """
+    name: str
+    changes: CHANGES
+    added_parameters: list[str]
+    removed_parameters: list[str]
+    modified_parameters: list[ParameterChange]
+# End ToolChange class
+
+
+class ChangeSet(NamedTuple):
+    """
+    Change Set, the structural differences between two toolboxes
+    """
+    changes: CHANGES
+    added_tools: list[str]
+    removed_tools: list[str]
+    modified_tools: list[ToolChange]
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        True when there are no differences
+        """
+        return not (self.changes or self.added_tools or
+                    self.removed_tools or self.modified_tools)
+    # End is_empty property
+# End ChangeSet class
+
+
+class CatalogEntry(NamedTuple):
+    """
+    Catalog Entry, a parameter of a tool in a cataloged toolbox
+    """
+    path: str
+    tool: str
+    toolset: str
+    parameter: str
+    label: str
+    data_type: str
+    is_multi: bool
+    filter_type: STRING
+# End CatalogEntry class
+
+
+class RefreshResult(NamedTuple):
+    """
+    Refresh Result, counts of cataloged toolboxes by outcome
+    """
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    failed: int = 0
+# End RefreshResult class
+
+
+class LintIssue(NamedTuple):
+    """
+    Lint Issue, location is a dotted path to the offending object within the
+    toolbox (e.g. tool.parameter), empty for the toolbox itself.
+    """
+    path: str
+    location: str
+    rule: str
+    message: str
+# End LintIssue class
+
+
+class RepackResult(NamedTuple):
+    """
+    Repack Result, sizes are in bytes
+    """
+    path: Path
+    before: int
+    after: int
+    dropped: list[str]
+# End RepackResult class
+
+
+class Diagnostic(NamedTuple):
+    """
+    Diagnostic, location is a dotted path to the offending object within the
+    toolbox (e.g. tool.parameter), empty for the toolbox itself.
+    """
+    location: str
+    rule: str
+    message: str
+    value: Any = None
+# End Diagnostic class
+
+
+class ValidationResult(NamedTuple):
+    """
+    Validation Result, sizes are the uncompressed bytes of each tool keyed
+    on the tool name, tools which failed to build have no size.
+    """
+    diagnostics: list[Diagnostic]
+    sizes: dict[str, int]
+
+    @property
+    def is_valid(self) -> bool:
+        """
+        Is Valid, True when there are no diagnostics
+        """
+        return not self.diagnostics
+    # End is_valid property
+# End ValidationResult class
+
+
+class ValidatedNames(NamedTuple):
+    """
+    Validated Names, in the order given with None for names which could not
+    be validated.  Collisions are keyed on the case-folded name with the
+    positions of every name sharing it.
+    """
+    names: list[STRING]
+    collisions: dict[str, list[int]]
+# End ValidatedNames class
+
+
+class LayerInfo(NamedTuple):
+    """
+    Layer Info, parsed from a layer file (.lyrx), the layer type of the
+    first layer (e.g. CIMFeatureLayer) and the geometry types its renderer
+    draws, empty when unknown.
+    """
+    layer_type: STRING
+    geometry_types: frozenset['GeometryType']
+# End LayerInfo class
+
+
 if __name__ == '__main__':  # pragma: no cover
     pass
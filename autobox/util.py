@@ -5,15 +5,21 @@ Utility Functionality
 
 
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from os import walk
 from pathlib import Path
-from re import sub
+from re import compile as recompile
 from tempfile import mkdtemp
-from typing import NoReturn, TYPE_CHECKING
+from typing import (
+    Any, Callable, Generator, Iterable, NoReturn, Pattern, TYPE_CHECKING)
 
 from autobox.constant import (
-    DOT_DOT_SLASH, DOUBLE_SPACE, DOUBLE_UNDERSCORE, ATBX, RELATIVE, SPACE,
-    UNDERSCORE)
-from autobox.type import STRING
+    DOT_DOT_SLASH, DOUBLE_SPACE, DOUBLE_UNDERSCORE, ATBX, DiagnosticRules,
+    ENCODING, RELATIVE, SPACE, UNDERSCORE)
+from autobox.diagnostic import raise_or_collect
+from autobox.type import STRING, ValidatedNames
 
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -29,6 +35,31 @@ WINDOWS_RESERVED: set[str] = (
 )
 
 
+def _make_table(keep: Callable[[str], bool],
+                replacement: STRING) -> list[STRING]:
+    """
+    Make Table for str.translate covering ASCII, characters which are not
+    kept are replaced (or removed when the replacement is None).  Other
+    characters are left as is by str.translate.
+    """
+    return [c if keep(c) else replacement for c in map(chr, range(128))]
+# End _make_table function
+
+
+NAME_SPECIAL: str = '\\/:*?&"<>|'
+TOOLBOX_SPECIAL: str = '<>:"/\\|?*'
+TOOLBOX_TABLE: list[STRING] = _make_table(
+    lambda c: c >= SPACE and c not in TOOLBOX_SPECIAL, replacement=UNDERSCORE)
+SPACE_TABLE: list[STRING] = _make_table(
+    lambda c: c not in NAME_SPECIAL, replacement=SPACE)
+UNDERSCORE_TABLE: list[STRING] = _make_table(
+    lambda c: c not in NAME_SPECIAL, replacement=UNDERSCORE)
+ALNUM_TABLE: list[STRING] = _make_table(str.isalnum, replacement=None)
+WORD_TABLE: list[STRING] = _make_table(str.isalnum, replacement=UNDERSCORE)
+SPACE_RUN: Pattern = recompile(' {2,}')
+UNDERSCORE_RUN: Pattern = recompile('_{2,}')
+
+
 def validate_toolbox_name(value: str) -> STRING:
     """
     Validates the toolbox value, needs to be a valid file value on window.
@@ -41,9 +72,8 @@ def validate_toolbox_name(value: str) -> STRING:
     if value.casefold().endswith(ATBX):
         if not (value := value[:-len(ATBX)]):
             return
-    value = sub(r'[<>:"/\\|?*\x00-\x1F]', repl=UNDERSCORE, string=value)
-    while DOUBLE_UNDERSCORE in value:
-        value = value.replace(DOUBLE_UNDERSCORE, UNDERSCORE)
+    if DOUBLE_UNDERSCORE in (value := value.translate(TOOLBOX_TABLE)):
+        value = UNDERSCORE_RUN.sub(UNDERSCORE, value)
     value = value.strip(UNDERSCORE)
     if not value or value == UNDERSCORE:
         return
@@ -92,7 +122,11 @@ def _validate_alpha_start_sans_special(value: str) -> STRING:
         return
     if not (value := value.strip()):
         return
-    if not (value := ''.join(c for c in value if c.isalnum())):
+    if value.isascii():
+        value = value.translate(ALNUM_TABLE)
+    else:
+        value = ''.join(c for c in value if c.isalnum())
+    if not value:
         return
     return _remove_leading_non_alpha(value)
 # End _validate_alpha_start_sans_special function
@@ -104,12 +138,9 @@ def _remove_leading_non_alpha(value: str) -> STRING:
     """
     if not value:
         return
-    first, *_ = value
-    while not first.isalpha():
-        if not (value := value[1:]):
-            return
-        first, *_ = value
-    return value
+    for i, character in enumerate(value):
+        if character.isalpha():
+            return value[i:]
 # End _remove_leading_non_alpha function
 
 
@@ -119,22 +150,23 @@ def validate_toolset_name(value: str) -> STRING:
     contain special characters.
     """
     return _validate_name_no_special(
-        value, single=SPACE, double=DOUBLE_SPACE)
+        value, table=SPACE_TABLE, double=DOUBLE_SPACE, run=SPACE_RUN)
 # End validate_toolset_name function
 
 
-def _validate_name_no_special(value: str, single: str, double: str) -> STRING:
+def _validate_name_no_special(value: str, table: list[STRING], double: str,
+                              run: Pattern) -> STRING:
     """
     Validate that the value is a string, is not empty, and does not
-    contain special characters.
+    contain special characters.  Special characters are translated using
+    the table and runs of the replacement are collapsed.
     """
     if not isinstance(value, str):
         return
     if not (value := value.strip()):
         return
-    value = sub(r'[\\/:*?&"<>|]', repl=single, string=value)
-    while double in value:
-        value = value.replace(double, single)
+    if double in (value := value.translate(table)):
+        value = run.sub(double[0], value)
     if not (value := value.strip()):
         return
     return value
@@ -147,9 +179,10 @@ def validate_parameter_name(value: str) -> STRING:
     contain special characters, and does not start with a number.
     """
     value = _validate_name_no_special(
-        value, single=SPACE, double=DOUBLE_SPACE)
+        value, table=SPACE_TABLE, double=DOUBLE_SPACE, run=SPACE_RUN)
     value = _validate_name_no_special(
-        value, single=UNDERSCORE, double=DOUBLE_UNDERSCORE)
+        value, table=UNDERSCORE_TABLE, double=DOUBLE_UNDERSCORE,
+        run=UNDERSCORE_RUN)
     return _remove_leading_non_alpha(value)
 # End validate_parameter_name function
 
@@ -162,8 +195,8 @@ def validate_parameter_label(value: str) -> STRING:
         return
     if not (value := value.strip()):
         return
-    while DOUBLE_SPACE in value:
-        value = value.replace(DOUBLE_SPACE, SPACE)
+    if DOUBLE_SPACE in value:
+        value = SPACE_RUN.sub(SPACE, value)
     return value
 # End validate_parameter_label function
 
@@ -173,13 +206,82 @@ def make_parameter_name(value: str) -> STRING:
     Make Parameter Name from Validated Parameter Label, general aim of this
     function is to make a valid python identifier starting with a letter.
     """
-    value = ''.join(c if c.isalnum() else UNDERSCORE for c in value)
+    if isinstance(value, str) and value.isascii():
+        value = value.translate(WORD_TABLE)
+    else:
+        value = ''.join(c if c.isalnum() else UNDERSCORE for c in value)
     if not (value := _remove_leading_non_alpha(value)):
         return
     return value.casefold()
 # End make_parameter_name function
 
 
+def _validate_names(values: Iterable[str],
+                    validator: Callable[[str], STRING]) -> ValidatedNames:
+    """
+    Validate Names in a single pass, collisions are detected on the
+    case-folded validated names as they are produced.
+    """
+    names = []
+    append = names.append
+    first = {}
+    collisions = {}
+    for i, value in enumerate(values):
+        append(name := validator(value))
+        if name is None:
+            continue
+        key = name.casefold()
+        if (j := first.setdefault(key, i)) == i:
+            continue
+        if (positions := collisions.get(key)) is None:
+            collisions[key] = [j, i]
+        else:
+            positions.append(i)
+    return ValidatedNames(names=names, collisions=collisions)
+# End _validate_names function
+
+
+def validate_toolbox_names(values: Iterable[str]) -> ValidatedNames:
+    """
+    Validate Toolbox Names in bulk, see validate_toolbox_name.
+    """
+    return _validate_names(values, validator=validate_toolbox_name)
+# End validate_toolbox_names function
+
+
+def validate_script_names(values: Iterable[str]) -> ValidatedNames:
+    """
+    Validate Script Names in bulk, see validate_script_name.
+    """
+    return _validate_names(values, validator=validate_script_name)
+# End validate_script_names function
+
+
+def validate_toolset_names(values: Iterable[str]) -> ValidatedNames:
+    """
+    Validate Toolset Names in bulk, see validate_toolset_name.
+    """
+    return _validate_names(values, validator=validate_toolset_name)
+# End validate_toolset_names function
+
+
+def validate_parameter_names(values: Iterable[str]) -> ValidatedNames:
+    """
+    Validate Parameter Names in bulk, see validate_parameter_name.
+    """
+    return _validate_names(values, validator=validate_parameter_name)
+# End validate_parameter_names function
+
+
+def make_parameter_names(values: Iterable[str]) -> ValidatedNames:
+    """
+    Make Parameter Names in bulk from validated parameter labels, see
+    make_parameter_name.
+    """
+    return _validate_names(values, validator=make_parameter_name)
+# End make_parameter_names function
+
+
 def make_temp_folder() -> Path:
     """
     Make Temporary Folder
@@ -205,20 +307,59 @@ def wrap_markup(value: STRING) -> STRING:
 # End wrap_markup function
 
 
-def validate_path(path: Path, text: str) -> Path | NoReturn:
+def validate_path(path: Path, text: str) -> Path | None | NoReturn:
     """
-    Validate Path
+    Validate Path, an invalid or missing path is raised or collected, no
+    path is used when collecting.
     """
     try:
         path = Path(path)
     except TypeError:
-        raise ValueError(f'Invalid {text} path provided: {path}')
-    if not path.is_file():
-        raise FileNotFoundError(f'File not found: {path}')
-    return path.resolve()
+        return raise_or_collect(
+            ValueError(f'Invalid {text} path provided: {path}'),
+            location=text, rule=DiagnosticRules.path_missing, value=path)
+    if (deferred := _DEFERRED.get()) is not None:
+        deferred.append((path := path.absolute(), text))
+        return path
+    if not is_file(path):
+        return raise_or_collect(
+            FileNotFoundError(f'File not found: {path}'),
+            location=text, rule=DiagnosticRules.path_missing, value=path)
+    return resolve_path(path)
 # End validate_path function
 
 
+def find_toolboxes(paths: Iterable[Path]) -> list[Path]:
+    """
+    Find Toolboxes, toolbox files are kept and folders are walked for
+    toolbox files, order preserving and without repeats.
+    """
+    found = []
+    for path in map(Path, paths):
+        if path.is_file():
+            found.append(path)
+            continue
+        for root, _, files in walk(path):
+            found.extend(Path(root, f) for f in sorted(files)
+                         if f.casefold().endswith(ATBX))
+    return unique(found)
+# End find_toolboxes function
+
+
+def process_map(func: Callable, *iterables: Iterable, jobs: int = 1) -> list:
+    """
+    Process Map, map the function over the iterables in worker processes
+    when jobs > 1, results are in the order of the iterables.
+    """
+    arguments = list(zip(*iterables))
+    if jobs <= 1 or len(arguments) <= 1:
+        return [func(*args) for args in arguments]
+    chunk = max(1, len(arguments) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(func, *zip(*arguments), chunksize=chunk))
+# End process_map function
+
+
 def unique(values: list | tuple) -> list:
     """
     Unique list of elements, order preserving
@@ -250,13 +391,201 @@ def get_repeated_names(values: list['Toolset'] | list['ScriptTool'] |
 # End get_repeated_names method
 
 
+_PATHS: ContextVar[dict[tuple, Any] | None] = ContextVar(
+    'paths', default=None)
+_DEFERRED: ContextVar[list[tuple[Path, str]] | None] = ContextVar(
+    'deferred', default=None)
+
+
+@contextmanager
+def cache_paths() -> Generator[dict[tuple, Any], None, None]:
+    """
+    Cache Paths, within the context resolved paths, file checks and layer
+    paths are memoized so that each file (and the target folder) is looked
+    up once, e.g. while a toolbox is saved.  Nested contexts share the
+    outer cache.  Files changed on disk within the context are not noticed.
+    """
+    if (cache := _PATHS.get()) is not None:
+        yield cache
+        return
+    cache = {}
+    token = _PATHS.set(cache)
+    try:
+        yield cache
+    finally:
+        _PATHS.reset(token)
+# End cache_paths function
+
+
+def _memoize(func: Callable, *args: Any) -> Any:
+    """
+    Memoize the result of the function call when paths are being cached
+    """
+    if (cache := _PATHS.get()) is None:
+        return func(*args)
+    key = func, *args
+    try:
+        return cache[key]
+    except KeyError:
+        cache[key] = result = func(*args)
+        return result
+# End _memoize function
+
+
+def resolve_path(path: Path) -> Path:
+    """
+    Resolve Path, memoized when paths are being cached
+    """
+    return _memoize(Path.resolve, path)
+# End resolve_path function
+
+
+def is_file(path: Path) -> bool:
+    """
+    Is File, memoized when paths are being cached
+    """
+    return _memoize(Path.is_file, path)
+# End is_file function
+
+
+def read_bytes(path: Path) -> bytes:
+    """
+    Read Bytes, memoized when paths are being cached
+    """
+    return _memoize(Path.read_bytes, path)
+# End read_bytes function
+
+
+def read_text(path: Path) -> str:
+    """
+    Read Text, memoized when paths are being cached, newlines are translated
+    the same as Path.read_text.
+    """
+    text = read_bytes(path).decode(ENCODING)
+    if '\r' not in text:
+        return text
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+# End read_text function
+
+
+def get_cached_bytes(path: Path) -> bytes | None:
+    """
+    Get Cached Bytes, the content of the file when already read while paths
+    are being cached, otherwise None.
+    """
+    if (cache := _PATHS.get()) is None:
+        return None
+    return cache.get((Path.read_bytes, path))
+# End get_cached_bytes function
+
+
+def _check_path(path: Path, read: bool) \
+        -> tuple[bool, Path | None, bytes | None]:
+    """
+    Check Path, whether the path is a file, the resolved path, and the
+    content when reading (None when it cannot be read).
+    """
+    if not path.is_file():
+        return False, None, None
+    data = None
+    if read:
+        try:
+            data = path.read_bytes()
+        except OSError:  # pragma: no cover
+            pass
+    return True, path.resolve(), data
+# End _check_path function
+
+
+def check_paths(paths: Iterable[Path], jobs: int = 8,
+                read: bool = False) -> dict[Path, bool]:
+    """
+    Check Paths concurrently using a pool of threads, useful when files are
+    on a network share.  Returns whether each path is a file.  When paths
+    are being cached the results (and the content when reading) are added
+    to the cache so that later checks, resolves and reads within the
+    context do not touch the file system again.
+    """
+    cache = _PATHS.get()
+    pending = paths = unique(map(Path, paths))
+    if cache is not None:
+        pending = [p for p in paths if (Path.is_file, p) not in cache or (
+                read and (Path.read_bytes, p) not in cache)]
+    if jobs <= 1 or len(pending) <= 1:
+        results = [_check_path(p, read=read) for p in pending]
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(
+                _check_path, pending, [read] * len(pending)))
+    if cache is None:
+        return {p: exists for p, (exists, _, _) in zip(pending, results)}
+    for path, (exists, resolved, data) in zip(pending, results):
+        cache[Path.is_file, path] = exists
+        if resolved is not None:
+            cache[Path.resolve, path] = resolved
+        if data is not None:
+            cache[Path.read_bytes, path] = data
+    return {p: cache[Path.is_file, p] for p in paths}
+# End check_paths function
+
+
+@contextmanager
+def defer_paths() -> Generator[None, None, None]:
+    """
+    Defer Paths, within the context paths given to tools and parameters are
+    recorded (as absolute paths) rather than checked one at a time.  The
+    recorded paths are checked together by check_deferred_paths when a
+    toolbox is saved or validated, or on leaving the context, and the
+    results are kept in the path cache for the rest of the context.  Nested
+    contexts share the outer.
+    """
+    if _DEFERRED.get() is not None:
+        yield
+        return
+    token = _DEFERRED.set([])
+    try:
+        with cache_paths():
+            yield
+            check_deferred_paths()
+    finally:
+        _DEFERRED.reset(token)
+# End defer_paths function
+
+
+def check_deferred_paths(jobs: int = 8) -> None | NoReturn:
+    """
+    Check Deferred Paths concurrently, a missing file is raised or
+    collected.  Does nothing outside a defer paths context.
+    """
+    if not (deferred := _DEFERRED.get()):
+        return
+    pending = deferred.copy()
+    deferred.clear()
+    found = check_paths((path for path, _ in pending), jobs=jobs)
+    for path, text in pending:
+        if found[path]:
+            continue
+        raise_or_collect(
+            FileNotFoundError(f'File not found: {path}'),
+            location=text, rule=DiagnosticRules.path_missing, value=path)
+# End check_deferred_paths function
+
+
 def resolve_layer_path(layer_file: Path, toolbox_folder: Path) -> str:
     """
     Resolve Layer Path, return relative if possible, absolute if necessary.
     """
-    layer_file = layer_file.resolve()
+    return _memoize(_resolve_layer_path, layer_file, toolbox_folder)
+# End resolve_layer_path function
+
+
+def _resolve_layer_path(layer_file: Path, toolbox_folder: Path) -> str:
+    """
+    Resolve Layer Path, return relative if possible, absolute if necessary.
+    """
+    layer_file = resolve_path(layer_file)
     layer_folder = layer_file.parent
-    toolbox_folder = toolbox_folder.resolve()
+    toolbox_folder = resolve_path(toolbox_folder)
     # NOTE on different drives, need full path
     if layer_folder.drive != toolbox_folder.drive:  # pragma: no cover
         return str(layer_file)
@@ -276,7 +605,7 @@ def resolve_layer_path(layer_file: Path, toolbox_folder: Path) -> str:
         return f'{RELATIVE}{path}'
     return _build_relative(layer_parts=layer_file.parts[1:],
                            toolbox_parts=toolbox_folder.parts[1:])
-# End resolve_layer_path function
+# End _resolve_layer_path function
 
 
 def _build_relative(layer_parts: tuple[str, ...],
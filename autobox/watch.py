@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+Watch Mode, incremental rebuild of toolboxes on source changes
+"""
+
+
+from pathlib import Path
+from time import monotonic, sleep
+from typing import Callable, Iterable
+
+from autobox.archive import patch_archive
+from autobox.constant import ATBX, DOT, TOOL
+from autobox.script import ScriptTool
+from autobox.toolbox import Toolbox
+from autobox.writer import MemoryWriter
+
+
+STAT = tuple[int, int] | None
+
+
+def _stat(path: Path) -> STAT:
+    """
+    Stat a file, modification time and size, None when missing.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return
+    return stat.st_mtime_ns, stat.st_size
+# End _stat function
+
+
+def referenced_files(tool: ScriptTool) -> set[Path]:
+    """
+    Referenced Files, files whose content is copied into the toolbox when
+    the tool is serialized.  Linked execution scripts are excluded since only
+    their path is stored in the toolbox.
+    """
+    paths = set()
+    for script in tool.execution_script, tool.validation_script:
+        # noinspection PyProtectedMember
+        if script and script._path and script._embed:
+            # noinspection PyProtectedMember
+            paths.add(script._path)
+    paths.update(p for p in (tool.icon, tool.illustration) if p)
+    # noinspection PyProtectedMember
+    paths.update(p.symbology for p in tool._parameters if p.symbology)
+    return paths
+# End referenced_files function
+
+
+def serialize_tool(tool: ScriptTool, target: Path) -> dict[str, bytes]:
+    """
+    Serialize a single tool, returns archive member names and bytes.
+    """
+    writer = MemoryWriter()
+    # noinspection PyProtectedMember
+    tool._serialize(writer, target=target)
+    return writer.files
+# End serialize_tool function
+
+
+class Watcher:
+    """
+    Watcher, polls the files referenced by the tools of one or more toolboxes
+    and rebuilds only the affected tools when those files change.  A change
+    to any of the sources (e.g. the module defining the toolboxes) results
+    in a full rebuild.
+    """
+    def __init__(self, load: Callable[[], list[Toolbox]], folder: Path,
+                 sources: Iterable[Path] = (), interval: float = 0.5,
+                 debounce: float = 0.25) -> None:
+        """
+        Initialize the Watcher class
+
+        :param load: Callable which returns the toolboxes to build, called
+            for the initial build and on every full rebuild.
+        :param folder: Folder where the toolboxes are saved.
+        :param sources: Files which trigger a full rebuild when changed.
+        :param interval: Seconds between polls.
+        :param debounce: Seconds without further changes before a rebuild,
+            a burst of edits results in a single rebuild.
+        """
+        super().__init__()
+        self._load: Callable[[], list[Toolbox]] = load
+        self._folder: Path = folder
+        self._sources: set[Path] = {Path(s).resolve() for s in sources}
+        self._interval: float = interval
+        self._debounce: float = debounce
+        self._tools: dict[Path, list[tuple[Path, ScriptTool]]] = {}
+        self._snapshot: dict[Path, STAT] = {}
+        self._pending: set[Path] = set()
+        self._changed_at: float = 0.
+    # End init built-in
+
+    def _track(self, toolboxes: list[Toolbox]) -> None:
+        """
+        Track the sources and the files referenced by the tools
+        """
+        self._tools.clear()
+        for tbx in toolboxes:
+            archive = self._folder.joinpath(f'{tbx.name}{ATBX}')
+            # noinspection PyProtectedMember
+            for tool in tbx._gather_tools():
+                for path in referenced_files(tool):
+                    self._tools.setdefault(path, []).append((archive, tool))
+        paths = self._sources | self._tools.keys()
+        self._snapshot = {p: _stat(p) for p in paths}
+    # End _track method
+
+    def _patch(self, changed: set[Path]) -> list[Path]:
+        """
+        Patch the archives by serializing only the affected tools
+        """
+        affected: dict[Path, dict[int, ScriptTool]] = {}
+        for path in changed:
+            for archive, tool in self._tools.get(path, []):
+                affected.setdefault(archive, {})[id(tool)] = tool
+        for archive, tools in affected.items():
+            members = {}
+            prefixes = []
+            for tool in tools.values():
+                members.update(serialize_tool(tool, target=self._folder))
+                # noinspection PyProtectedMember
+                prefixes.append(f'{tool._folder}{DOT}{TOOL}/')
+            patch_archive(archive, members=members, prefixes=prefixes)
+        return sorted(affected)
+    # End _patch method
+
+    @property
+    def files(self) -> list[Path]:
+        """
+        Files being watched
+        """
+        return sorted(self._snapshot)
+    # End files property
+
+    def build(self) -> list[Path]:
+        """
+        Build (or rebuild) all toolboxes and track their referenced files
+        """
+        toolboxes = self._load()
+        paths = [tbx.save(self._folder, overwrite=True) for tbx in toolboxes]
+        self._track(toolboxes)
+        self._pending.clear()
+        return paths
+    # End build method
+
+    def poll(self) -> set[Path]:
+        """
+        Poll the watched files, returns the files changed since last poll.
+        """
+        changed = set()
+        for path, previous in self._snapshot.items():
+            if (current := _stat(path)) != previous:
+                self._snapshot[path] = current
+                changed.add(path)
+        return changed
+    # End poll method
+
+    def step(self, now: float | None = None) -> list[Path]:
+        """
+        Poll once and rebuild when changes have settled, returns the paths
+        of the toolboxes which were written.
+        """
+        if now is None:
+            now = monotonic()
+        if changed := self.poll():
+            self._pending.update(changed)
+            self._changed_at = now
+            return []
+        if not self._pending or now - self._changed_at < self._debounce:
+            return []
+        pending = set(self._pending)
+        self._pending.clear()
+        if pending & self._sources:
+            return self.build()
+        return self._patch(pending)
+    # End step method
+
+    def run(self, iterations: int | None = None,
+            on_change: Callable[[list[Path]], None] | None = None,
+            on_error: Callable[[Exception], None] | None = None) -> None:
+        """
+        Run the watch loop, indefinitely unless a number of iterations is
+        given.  Errors are raised unless an error callback is provided.
+        """
+        count = 0
+        while iterations is None or count < iterations:
+            count += 1
+            try:
+                if (paths := self.step()) and on_change:
+                    on_change(paths)
+            except (OSError, TypeError, ValueError) as err:
+                if on_error is None:
+                    raise
+                on_error(err)
+            sleep(self._interval)
+    # End run method
+# End Watcher class
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
@@ -0,0 +1,432 @@
+# -*- coding: utf-8 -*-
+"""
+Writers, output backends used when serializing a toolbox
+"""
+
+
+from abc import abstractmethod
+from json.encoder import INFINITY, encode_basestring_ascii
+from os import replace, walk
+from pathlib import Path
+from re import compile as recompile
+from types import TracebackType
+from typing import Any, Pattern, Self
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from autobox.archive import make_sibling_path
+from autobox.constant import ENCODING, ScriptToolContentKeys, TOOL_CONTENT
+
+
+__all__ = ['AbstractWriter', 'DirectoryWriter', 'MemoryWriter', 'NullWriter',
+           'ZipWriter', 'encode_json', 'join_name', 'list_files']
+
+
+UPDATED_PATTERN: Pattern = recompile(
+    rb'"' + ScriptToolContentKeys.updated.encode() + rb'"\s*:\s*"[^"]*"')
+
+
+def list_files(folder: Path) -> dict[str, Path]:
+    """
+    List Files, keyed on the relative posix path, sorted
+    """
+    files = {}
+    for root, _, names in walk(folder):
+        path = Path(root)
+        for name in names:
+            full_path = path.joinpath(name)
+            files[full_path.relative_to(folder).as_posix()] = full_path
+    return dict(sorted(files.items()))
+# End list_files function
+
+
+def _is_same(name: str, data: bytes, path: Path) -> bool:
+    """
+    Is Same, compares the bytes of a new file against an existing file, the
+    updated timestamp in tool content is ignored so that a tool which did
+    not change keeps its existing content (and timestamp).
+    """
+    try:
+        existing = path.read_bytes()
+    except OSError:
+        return False
+    if existing == data:
+        return True
+    if not name.endswith(TOOL_CONTENT):
+        return False
+    return UPDATED_PATTERN.sub(b'', existing) == UPDATED_PATTERN.sub(b'', data)
+# End _is_same function
+
+
+INDENT: str = '  '
+
+
+def _encode_float(value: float) -> str:
+    """
+    Encode Float, same as the standard library
+    """
+    if value != value:
+        return 'NaN'
+    if value == INFINITY:
+        return 'Infinity'
+    if value == -INFINITY:
+        return '-Infinity'
+    return float.__repr__(value)
+# End _encode_float function
+
+
+def _encode_key(key: Any) -> str:
+    """
+    Encode Key, keys which are not strings are converted the same as the
+    standard library
+    """
+    if isinstance(key, float):
+        return f'"{_encode_float(key)}"'
+    if key is True:
+        return '"true"'
+    if key is False:
+        return '"false"'
+    if key is None:
+        return '"null"'
+    if isinstance(key, int):
+        return f'"{int.__repr__(key)}"'
+    raise TypeError(f'keys must be str, int, float, bool or None, '
+                    f'not {key.__class__.__name__}')
+# End _encode_key function
+
+
+def _encode_value(obj: Any, indent: str, chunks: list[str]) -> None:
+    """
+    Encode Value, appends the chunks of the indented JSON to the list.  This
+    produces the same text as json.dumps with an indent of 2 but without the
+    nested generators of the pure Python encoder (the C encoder is not used
+    by the standard library when indenting), which matters for large
+    domains with tens of thousands of items.
+    """
+    if isinstance(obj, str):
+        chunks.append(encode_basestring_ascii(obj))
+    elif obj is None:
+        chunks.append('null')
+    elif obj is True:
+        chunks.append('true')
+    elif obj is False:
+        chunks.append('false')
+    elif isinstance(obj, int):
+        chunks.append(int.__repr__(obj))
+    elif isinstance(obj, float):
+        chunks.append(_encode_float(obj))
+    elif isinstance(obj, dict):
+        if not obj:
+            chunks.append('{}')
+            return
+        inner = f'{indent}{INDENT}'
+        separator = f',\n{inner}'
+        append = chunks.append
+        append(f'{{\n{inner}')
+        first = True
+        for key, value in obj.items():
+            if first:
+                first = False
+            else:
+                append(separator)
+            if isinstance(key, str):
+                append(encode_basestring_ascii(key))
+            else:
+                append(_encode_key(key))
+            if isinstance(value, str):
+                append(f': {encode_basestring_ascii(value)}')
+            else:
+                append(': ')
+                _encode_value(value, indent=inner, chunks=chunks)
+        append(f'\n{indent}}}')
+    elif isinstance(obj, (list, tuple)):
+        if not obj:
+            chunks.append('[]')
+            return
+        inner = f'{indent}{INDENT}'
+        separator = f',\n{inner}'
+        append = chunks.append
+        append(f'[\n{inner}')
+        first = True
+        for value in obj:
+            if first:
+                first = False
+            else:
+                append(separator)
+            if isinstance(value, str):
+                append(encode_basestring_ascii(value))
+            else:
+                _encode_value(value, indent=inner, chunks=chunks)
+        append(f'\n{indent}]')
+    else:
+        raise TypeError(f'Object of type {obj.__class__.__name__} '
+                        f'is not JSON serializable')
+# End _encode_value function
+
+
+def encode_json(obj: Any) -> bytes:
+    """
+    Encode JSON, indented the same as toolboxes saved by ArcGIS Pro
+    """
+    chunks = []
+    _encode_value(obj, indent='', chunks=chunks)
+    return ''.join(chunks).encode(ENCODING)
+# End encode_json function
+
+
+def join_name(*parts: str) -> str:
+    """
+    Join Name, makes a member name (relative posix path) from its parts,
+    empty parts are skipped.
+    """
+    return '/'.join(part for part in parts if part)
+# End join_name function
+
+
+class AbstractWriter:
+    """
+    Abstract Writer, members are identified by relative posix paths, e.g.
+    Script.tool/tool.content.  Text and JSON are written as utf-8 bytes so
+    every backend produces identical members.
+    """
+    def __enter__(self) -> Self:
+        """
+        Context Manager Enter
+        """
+        return self
+    # End enter built-in
+
+    def __exit__(self, exc_type: type[BaseException] | None,
+                 exc_val: BaseException | None,
+                 exc_tb: TracebackType | None) -> None:
+        """
+        Context Manager Exit, output is discarded when an exception occurred
+        """
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+    # End exit built-in
+
+    @abstractmethod
+    def write_bytes(self, name: str, data: bytes) -> None:  # pragma: no cover
+        """
+        Write Bytes
+        """
+        pass
+    # End write_bytes method
+
+    def write_text(self, name: str, text: str) -> None:
+        """
+        Write Text
+        """
+        self.write_bytes(name, text.encode(ENCODING))
+    # End write_text method
+
+    def write_json(self, name: str, obj: Any) -> None:
+        """
+        Write JSON
+        """
+        self.write_bytes(name, encode_json(obj))
+    # End write_json method
+
+    def copy_file(self, path: Path, name: str) -> None:
+        """
+        Copy File
+        """
+        self.write_bytes(name, Path(path).read_bytes())
+    # End copy_file method
+
+    def close(self) -> None:
+        """
+        Close, finish the output
+        """
+        pass
+    # End close method
+
+    def abort(self) -> None:
+        """
+        Abort, discard the output where the backend allows it
+        """
+        pass
+    # End abort method
+# End AbstractWriter class
+
+
+class ZipWriter(AbstractWriter):
+    """
+    Zip Writer, streams members into a new archive which replaces the
+    target archive when closed, nothing is written to a temporary folder.
+    """
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize the ZipWriter class
+        """
+        super().__init__()
+        self._path: Path = Path(path)
+        self._temporary: Path = make_sibling_path(self._path)
+        self._zip: ZipFile = ZipFile(
+            self._temporary, mode='w', compression=ZIP_DEFLATED)
+    # End init built-in
+
+    @property
+    def path(self) -> Path:
+        """
+        Path
+        """
+        return self._path
+    # End path property
+
+    def write_bytes(self, name: str, data: bytes) -> None:
+        """
+        Write Bytes
+        """
+        self._zip.writestr(name, data)
+    # End write_bytes method
+
+    def copy_file(self, path: Path, name: str) -> None:
+        """
+        Copy File, the file is streamed into the archive
+        """
+        self._zip.write(path, name)
+    # End copy_file method
+
+    def close(self) -> None:
+        """
+        Close, the archive is moved into place
+        """
+        try:
+            self._zip.close()
+            replace(self._temporary, self._path)
+        finally:
+            self._temporary.unlink(missing_ok=True)
+    # End close method
+
+    def abort(self) -> None:
+        """
+        Abort, the partial archive is removed
+        """
+        self._zip.close()
+        self._temporary.unlink(missing_ok=True)
+    # End abort method
+# End ZipWriter class
+
+
+class MemoryWriter(AbstractWriter):
+    """
+    Memory Writer, members are kept as bytes keyed on the member name
+    """
+    def __init__(self) -> None:
+        """
+        Initialize the MemoryWriter class
+        """
+        super().__init__()
+        self.files: dict[str, bytes] = {}
+    # End init built-in
+
+    def write_bytes(self, name: str, data: bytes) -> None:
+        """
+        Write Bytes
+        """
+        self.files[name] = data
+    # End write_bytes method
+
+    def write_to(self, writer: AbstractWriter) -> None:
+        """
+        Write To, replays the members into another writer
+        """
+        for name, data in self.files.items():
+            writer.write_bytes(name, data)
+    # End write_to method
+# End MemoryWriter class
+
+
+class DirectoryWriter(AbstractWriter):
+    """
+    Directory Writer, members are written as files below a folder.  A file
+    is only written when its bytes differ from the existing file (ignoring
+    the updated timestamp in tool content).  When pruning, files which were
+    not written are removed on close along with empty folders.
+    """
+    def __init__(self, folder: Path, prune: bool = False) -> None:
+        """
+        Initialize the DirectoryWriter class
+        """
+        super().__init__()
+        self._folder: Path = Path(folder)
+        self._prune: bool = prune
+        self._names: set[str] = set()
+        self.changed: list[str] = []
+        self._folder.mkdir(parents=True, exist_ok=True)
+    # End init built-in
+
+    @property
+    def folder(self) -> Path:
+        """
+        Folder
+        """
+        return self._folder
+    # End folder property
+
+    def write_bytes(self, name: str, data: bytes) -> None:
+        """
+        Write Bytes
+        """
+        self._names.add(name)
+        path = self._folder.joinpath(name)
+        if _is_same(name, data=data, path=path):
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        self.changed.append(name)
+    # End write_bytes method
+
+    def close(self) -> None:
+        """
+        Close, stale files and empty folders are removed when pruning
+        """
+        if not self._prune:
+            return
+        for name, path in list_files(self._folder).items():
+            if name in self._names:
+                continue
+            path.unlink()
+            self.changed.append(name)
+        for root, _, _ in walk(self._folder, topdown=False):
+            path = Path(root)
+            if path != self._folder and not any(path.iterdir()):
+                path.rmdir()
+    # End close method
+# End DirectoryWriter class
+
+
+class NullWriter(AbstractWriter):
+    """
+    Null Writer, nothing is written, the size in bytes of each member is
+    recorded, useful for a dry run.
+    """
+    def __init__(self) -> None:
+        """
+        Initialize the NullWriter class
+        """
+        super().__init__()
+        self.sizes: dict[str, int] = {}
+    # End init built-in
+
+    def write_bytes(self, name: str, data: bytes) -> None:
+        """
+        Write Bytes
+        """
+        self.sizes[name] = len(data)
+    # End write_bytes method
+
+    def copy_file(self, path: Path, name: str) -> None:
+        """
+        Copy File, the file size is recorded without reading the file
+        """
+        self.sizes[name] = Path(path).stat().st_size
+    # End copy_file method
+# End NullWriter class
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Archive Utility Tests
+"""
+
+
+from shutil import copyfile
+from zipfile import ZipFile
+
+from autobox.archive import patch_archive
+from autobox.constant import ATBX, TOOLBOX_CONTENT, TOOLBOX_CONTENT_RC
+
+
+def test_patch_archive(tmp_path, data_path):
+    """
+    Test patch archive drops, replaces, adds, and copies members
+    """
+    name = f'toolsets_with_tools{ATBX}'
+    path = tmp_path.joinpath(name)
+    copyfile(data_path.joinpath(name), path)
+    with ZipFile(path) as zin:
+        original = {i.filename: zin.read(i) for i in zin.infolist()}
+    patch_archive(path, members={TOOLBOX_CONTENT_RC: b'{}', 'extra': b'data'},
+                  prefixes=['ScriptInToolsetA.tool/'])
+    with ZipFile(path) as zin:
+        assert zin.testzip() is None
+        patched = {i.filename: zin.read(i) for i in zin.infolist()}
+    assert patched[TOOLBOX_CONTENT_RC] == b'{}'
+    assert patched['extra'] == b'data'
+    assert patched[TOOLBOX_CONTENT] == original[TOOLBOX_CONTENT]
+    assert not [n for n in patched if n.startswith('ScriptInToolsetA')]
+    assert len(patched) == len(original) - 4 + 1
+    assert list(tmp_path.iterdir()) == [path]
+# End test_patch_archive function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Catalog Tests
+"""
+
+
+from shutil import copyfile
+
+from pytest import mark
+
+from autobox import ScriptTool, Toolbox
+from autobox.catalog import Catalog
+from autobox.constant import ATBX
+from autobox.filter import (
+    DoubleValueFilter, FieldTypeFilter, FileTypeFilter, LongRangeFilter,
+    LongValueFilter, StringValueFilter)
+from autobox.parameter import FieldParameter, FeatureLayerParameter
+
+
+def test_catalog_refresh_query(tmp_path, data_path):
+    """
+    Test catalog refresh is incremental and query by data and filter type
+    """
+    folder = tmp_path.joinpath('toolboxes', 'nested')
+    folder.mkdir(parents=True)
+    for name in 'filter', 'parameters', 'toolsets_with_tools':
+        copyfile(data_path.joinpath(f'{name}{ATBX}'),
+                 folder.joinpath(f'{name}{ATBX}'))
+    folder.joinpath(f'broken{ATBX}').write_bytes(b'not a zip')
+    index = tmp_path.joinpath('index.db')
+    root = tmp_path.joinpath('toolboxes')
+    with Catalog(index) as catalog:
+        result = catalog.refresh(root, jobs=2)
+        assert (result.added, result.failed) == (4, 1)
+        assert list(catalog.errors) == [str(folder.joinpath(f'broken{ATBX}'))]
+        assert catalog.find_tools(FieldParameter, FieldTypeFilter) == [
+            (str(folder.joinpath(f'filter{ATBX}')), 'ScriptWithFilters')]
+        entries = catalog.query(data_type=FeatureLayerParameter)
+        assert entries
+        assert {e.data_type for e in entries} == {'GPFeatureLayer'}
+        assert catalog.query(tool='scriptwithfilters', parameter='field_type')
+
+    with Catalog(index) as catalog:
+        assert catalog.refresh(root).unchanged == 4
+        folder.joinpath(f'filter{ATBX}').unlink()
+        tbx = Toolbox(name='parameters')
+        tbx.add_script_tool(ScriptTool(name='Replaced'))
+        tbx.save(folder, overwrite=True)
+        result = catalog.refresh(root)
+        assert result.removed == 1
+        assert result.updated == 1
+        assert result.unchanged == 2
+        assert not catalog.find_tools(filter_type='GPFieldDomain')
+        assert not catalog.query(tool='ScriptWithFilters')
+        assert len(catalog.paths) == 3
+# End test_catalog_refresh_query function
+
+
+@mark.parametrize('filter_type, names', [
+    (StringValueFilter, ['String_Value']),
+    (LongValueFilter, ['Long_Value']),
+    (DoubleValueFilter, ['Double_Value']),
+    (FileTypeFilter, ['File_Type']),
+    (LongRangeFilter, ['Long_Range', 'Double_Range']),
+    ('GPLong', ['Long_Value']),
+])
+def test_catalog_query_filter_type(data_path, filter_type, names):
+    """
+    Test catalog query by filter class matches the serialized domain
+    """
+    with Catalog(':memory:') as catalog:
+        catalog.refresh(data_path)
+        entries = catalog.query(filter_type=filter_type)
+        assert sorted(e.parameter for e in entries) == sorted(names)
+# End test_catalog_query_filter_type function
+
+
+def test_catalog_version(tmp_path, data_path):
+    """
+    Test catalog rebuilds an index written with another schema version
+    """
+    index = tmp_path.joinpath('index.db')
+    with Catalog(index) as catalog:
+        assert catalog.refresh(data_path).added
+        catalog._connection.execute('PRAGMA user_version = 0')
+    with Catalog(index) as catalog:
+        assert not catalog.paths
+        assert catalog.refresh(data_path).added
+# End test_catalog_version function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
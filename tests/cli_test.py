@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+Command Line Interface Tests
+"""
+
+
+from json import loads
+from shutil import copyfile
+
+from pytest import mark, raises
+
+from autobox.benchmark import BENCHMARKS, run_benchmark
+from autobox.cli import _spec_file, load_toolboxes, main, summarize
+from autobox.constant import ATBX
+
+
+SPEC_CODE: str = '''
+from autobox import ScriptTool, Toolbox, Toolset
+
+first = Toolbox(name='first')
+first.add_script_tool(ScriptTool(name='Alpha'))
+toolset = Toolset(name='Group')
+toolset.add_script_tool(ScriptTool(name='Beta'))
+first.add_toolset(toolset)
+
+
+def make_second():
+    tbx = Toolbox(name='second')
+    tbx.add_script_tool(ScriptTool(name='Alpha', label='Changed'))
+    tbx.add_script_tool(ScriptTool(name='Gamma'))
+    return tbx
+'''
+
+
+def _write_spec(tmp_path):
+    """
+    Write Spec Module
+    """
+    path = tmp_path.joinpath('spec_module.py')
+    path.write_text(SPEC_CODE)
+    return path
+# End _write_spec function
+
+
+@mark.parametrize('suffix, names', [
+    ('', ['first']),
+    (':first', ['first']),
+    (':make_second', ['second']),
+])
+def test_load_toolboxes(tmp_path, suffix, names):
+    """
+    Test loading toolboxes from a spec
+    """
+    path = _write_spec(tmp_path)
+    toolboxes = load_toolboxes(f'{path}{suffix}')
+    assert [t.name for t in toolboxes] == names
+# End test_load_toolboxes function
+
+
+def test_load_toolboxes_errors(tmp_path):
+    """
+    Test loading toolboxes from bad specs
+    """
+    with raises(FileNotFoundError):
+        load_toolboxes(str(tmp_path.joinpath('missing.py')))
+    with raises(ValueError):
+        load_toolboxes('autobox.constant')
+# End test_load_toolboxes_errors function
+
+
+def test_spec_file(tmp_path):
+    """
+    Test spec file resolution for files and module names
+    """
+    path = _write_spec(tmp_path)
+    assert _spec_file(f'{path}:first') == (path, 'first')
+    path, attribute = _spec_file('autobox.constant:DOT')
+    assert path.name == 'constant.py' and attribute == 'DOT'
+    with raises(ImportError):
+        _spec_file('not_a_module_anywhere')
+# End test_spec_file function
+
+
+def test_build_inspect_diff(tmp_path, capsys):
+    """
+    Test build, inspect, and diff commands
+    """
+    path = _write_spec(tmp_path)
+    out = tmp_path.joinpath('out')
+    assert main(['build', str(path), f'{path}:make_second',
+                 '-o', str(out), '--profile']) == 0
+    captured = capsys.readouterr()
+    assert 'serialize' in captured.err
+    first = out.joinpath(f'first{ATBX}')
+    second = out.joinpath(f'second{ATBX}')
+    assert first.is_file() and second.is_file()
+    assert main(['build', str(path), '-o', str(out)]) == 2
+    assert 'already exists' in capsys.readouterr().err
+    assert main(['build', str(path), f'{path}:make_second', '-o', str(out),
+                 '--overwrite', '--jobs', '2']) == 0
+    capsys.readouterr()
+
+    assert main(['inspect', str(first), str(second), '--json']) == 0
+    summaries = loads(capsys.readouterr().out)
+    assert summaries[0]['toolsets'] == {'': ['Alpha'], 'Group': ['Beta']}
+    assert summaries[1]['tools'] == 2
+
+    assert summarize(first, parameters=True)['parameters'] == {
+        'Alpha': [], 'Beta': []}
+
+    assert main(['diff', str(first), str(first)]) == 0
+    assert capsys.readouterr().out == ''
+    assert main(['diff', str(first), str(second)]) == 1
+    assert capsys.readouterr().out.splitlines() == [
+        "alias: 'first' -> 'second'", "label: 'first' -> 'second'",
+        '~ Alpha', "    displayname: 'Alpha' -> 'Changed'",
+        '- Beta', '+ Gamma']
+    assert main(['diff', str(first), str(second), '--json']) == 1
+    changes = loads(capsys.readouterr().out)
+    assert changes['added_tools'] == ['Gamma']
+    assert changes['modified_tools'][0]['name'] == 'Alpha'
+
+    merged = out.joinpath(f'merged{ATBX}')
+    assert main(['merge', str(merged), str(first), str(second)]) == 2
+    assert 'repetition' in capsys.readouterr().err
+    third = out.joinpath(f'third{ATBX}')
+    assert main(['merge', str(third), str(second), '--label', 'Third']) == 0
+    assert capsys.readouterr().out.strip() == str(third)
+    assert summarize(third)['tools'] == 2
+# End test_build_inspect_diff function
+
+
+def test_catalog(tmp_path, data_path, capsys):
+    """
+    Test catalog command resolves class names to keywords
+    """
+    index = str(tmp_path.joinpath('index.db'))
+    assert main(['catalog', index, str(data_path), '--data-type',
+                 'FieldParameter', '--filter-type', 'FieldTypeFilter']) == 0
+    captured = capsys.readouterr()
+    assert 'unchanged 0' in captured.err
+    assert captured.out.splitlines() == [
+        f'{data_path.joinpath(f"filter{ATBX}")}:ScriptWithFilters:Field_Type'
+        f'  Field  GPFieldDomain']
+    assert main(['catalog', index, '--filter-type', 'StringValueFilter']) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        f'{data_path.joinpath(f"filter{ATBX}")}:ScriptWithFilters:String_Value'
+        f'  GPString  GPCodedValueDomain']
+    assert main(['catalog', index, '--tool', 'ScriptWithFilters',
+                 '--json']) == 0
+    assert len(loads(capsys.readouterr().out)) > 1
+# End test_catalog function
+
+
+def test_lint(tmp_path, data_path, capsys):
+    """
+    Test lint command exit code and output
+    """
+    assert main(['lint', str(data_path), '--jobs', '2']) == 0
+    assert capsys.readouterr().out == ''
+    broken = tmp_path.joinpath(f'broken{ATBX}')
+    broken.write_bytes(b'not a zip')
+    assert main(['lint', str(broken), '--json']) == 1
+    issue, = loads(capsys.readouterr().out)
+    assert issue['rule'] == 'archive'
+# End test_lint function
+
+
+def test_migrate(tmp_path, data_path, capsys):
+    """
+    Test migrate command
+    """
+    path = tmp_path.joinpath(f'filter{ATBX}')
+    copyfile(data_path.joinpath(path.name), path)
+    assert main(['migrate', str(tmp_path), '--app-ver', '13.5',
+                 '--set', 'product=200']) == 0
+    assert capsys.readouterr().out.strip() == str(path)
+    assert main(['migrate', str(tmp_path), '--set', 'product']) == 2
+    assert main(['migrate', str(tmp_path)]) == 2
+# End test_migrate function
+
+
+def test_repack(tmp_path, data_path, capsys):
+    """
+    Test repack command
+    """
+    path = tmp_path.joinpath(f'filter{ATBX}')
+    copyfile(data_path.joinpath(path.name), path)
+    assert main(['repack', str(tmp_path), '--policy', 'store']) == 0
+    assert capsys.readouterr().out.startswith(str(path))
+    assert main(['repack', str(path), '--level', '11']) == 2
+# End test_repack function
+
+
+def test_build_directory_and_pack(tmp_path, capsys):
+    """
+    Test build with the directory layout and the pack command
+    """
+    path = _write_spec(tmp_path)
+    out = tmp_path.joinpath('out')
+    assert main(['build', f'{path}:first', '-o', str(out),
+                 '--layout', 'directory']) == 0
+    folder = out.joinpath('first')
+    assert capsys.readouterr().out.strip() == str(folder)
+    assert main(['pack', str(folder)]) == 0
+    assert capsys.readouterr().out.strip() == str(out.joinpath(f'first{ATBX}'))
+    assert main(['pack', str(folder)]) == 2
+# End test_build_directory_and_pack function
+
+
+def test_build_dry_run(tmp_path, capsys):
+    """
+    Test build dry run writes nothing and reports tool sizes
+    """
+    path = _write_spec(tmp_path)
+    out = tmp_path.joinpath('out')
+    assert main(['build', str(path), '-o', str(out), '--dry-run']) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split(':')[:2] for line in lines] == [
+        ['first', 'Alpha'], ['first', 'Beta']]
+    assert all(line.endswith(' bytes') for line in lines)
+    assert not out.exists()
+# End test_build_dry_run function
+
+
+def test_bench(capsys):
+    """
+    Test bench command and benchmark runner
+    """
+    assert main(['bench', '--list']) == 0
+    assert capsys.readouterr().out.split() == sorted(BENCHMARKS)
+    result = run_benchmark('parameter_serialize', repeat=2)
+    assert result.repeat == 2
+    assert 0 < result.best <= result.mean
+    with raises(KeyError):
+        run_benchmark('not_a_benchmark')
+# End test_bench function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
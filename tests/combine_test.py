@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Combine (Merge) Toolbox Tests
+"""
+
+
+from zipfile import ZipFile
+
+from pytest import raises
+
+from autobox import ScriptTool, Toolbox, Toolset, merge
+from autobox.archive import read_raw
+from autobox.constant import ATBX
+from autobox.reader import ToolboxReader
+
+
+def test_merge(tmp_path, data_path):
+    """
+    Test merge toolboxes, tool members are copied raw
+    """
+    source = data_path.joinpath(f'toolsets_with_tools{ATBX}')
+    tbx = Toolbox(name='other', label='Other')
+    tbx.add_script_tool(ScriptTool(name='Another'))
+    toolset = Toolset(name='c')
+    toolset.add_script_tool(ScriptTool(name='Extra'))
+    tbx.add_toolset(toolset)
+    other = tbx.save(tmp_path)
+    out = tmp_path.joinpath(f'merged{ATBX}')
+    assert merge([source, other], out=out) == out
+
+    with ToolboxReader(out) as reader:
+        assert reader.label == 'toolsets_with_tools'
+        assert [(t.name, t.toolset) for t in reader.tools] == [
+            ('Another', ''), ('ScriptInRoot', ''), ('ScriptInToolsetA', 'A'),
+            ('ScriptInToolsetB', 'B'), ('Extra', 'C'),
+            ('ScriptInToolsetC', 'C'), ('ScriptInToolsetD', 'C\\D')]
+    with ZipFile(source) as zin, ZipFile(out) as zout:
+        assert zout.testzip() is None
+        for info in zin.infolist():
+            if info.filename.startswith('ScriptInToolsetA.tool/'):
+                merged = zout.getinfo(info.filename)
+                assert read_raw(zout, merged) == read_raw(zin, info)
+
+    with raises(FileExistsError):
+        merge([source, other], out=out)
+    with raises(ValueError, match='ScriptInRoot'):
+        merge([source, source], out=out, overwrite=True)
+    with raises(ValueError):
+        merge([], out=out, overwrite=True)
+# End test_merge function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
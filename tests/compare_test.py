@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Toolbox Comparison Tests
+"""
+
+
+from autobox import ScriptTool, Toolbox, Toolset, compare, diff
+from autobox.enum import GeometryType
+from autobox.filter import FeatureClassTypeFilter, LongRangeFilter
+from autobox.parameter import (
+    FeatureClassParameter, LongParameter, StringParameter)
+
+
+def _make_toolbox(count: int = 10, default: int = 5) -> Toolbox:
+    """
+    Make Toolbox
+    """
+    tbx = Toolbox(name='compared', label='Compared')
+    toolset = Toolset(name='Nested')
+    tbx.add_toolset(toolset)
+    for i in range(3):
+        tool = ScriptTool(name=f'Tool{i}', label=f'Tool {i}')
+        features = FeatureClassParameter(label='Features', category='Inputs')
+        features.filter = FeatureClassTypeFilter([GeometryType.POINT])
+        number = LongParameter(label='Count', default_value=default)
+        number.filter = LongRangeFilter(0, count)
+        text = StringParameter(label='Text', description='Some text')
+        for param in features, number, text:
+            tool.add_parameter(param)
+        if i:
+            toolset.add_script_tool(tool)
+        else:
+            tbx.add_script_tool(tool)
+    return tbx
+# End _make_toolbox function
+
+
+def test_diff_unchanged(tmp_path):
+    """
+    Test diff for unchanged toolboxes, archives and objects
+    """
+    tbx = _make_toolbox()
+    path = tbx.save(tmp_path)
+    assert diff(path, path).is_empty
+    assert diff(tbx, path).is_empty
+    assert diff(path, tbx).is_empty
+    assert diff(tbx, _make_toolbox()).is_empty
+# End test_diff_unchanged function
+
+
+def test_diff_digest(tmp_path, monkeypatch):
+    """
+    Test unchanged tools are matched by digest across archives and objects
+    """
+    tbx = _make_toolbox()
+    path = tbx.save(tmp_path)
+    calls = []
+    monkeypatch.setattr(compare, '_compare_tool',
+                        lambda key, **_: calls.append(key))
+    for a, b in (path, tbx), (tbx, path), (tbx, _make_toolbox()):
+        assert diff(a, b).is_empty
+    assert not calls
+    changed = _make_toolbox(count=20)
+    assert diff(path, changed).is_empty
+    assert calls == ['tool0', 'tool1', 'tool2']
+# End test_diff_digest function
+
+
+def test_diff_target(tmp_path, data_path, monkeypatch):
+    """
+    Test diff resolves relative paths against the changed toolbox folder
+    first and then the original toolbox folder
+    """
+    tbx = _make_toolbox()
+    features = FeatureClassParameter(label='Output', is_input=False)
+    features.symbology = data_path / 'boxbox.lyrx'
+    tbx.tools[0].add_parameter(features)
+    old, new = tmp_path.joinpath('old'), tmp_path.joinpath('new')
+    old.mkdir()
+    new.mkdir()
+    path = tbx.save(old)
+    assert diff(path, tbx).is_empty
+    assert diff(tbx, path).is_empty
+    assert not diff(path, tbx, target=tmp_path).is_empty
+
+    targets = []
+    make_source = compare._make_source
+    monkeypatch.setattr(compare, '_make_source', lambda value, target: (
+        targets.append(target) or make_source(value, target=target)))
+    diff(path, tbx.save(new))
+    assert targets == [new, new]
+# End test_diff_target function
+
+
+def test_diff_changes(tmp_path):
+    """
+    Test diff reports tool, parameter, filter, and default changes
+    """
+    folder = tmp_path.joinpath('old')
+    folder.mkdir()
+    old = _make_toolbox().save(folder)
+    tbx = _make_toolbox(count=20, default=7)
+    tool0, = tbx.tools
+    tool0.parameters.pop()
+    tool0.add_parameter(LongParameter(label='Extra'))
+    tool1, tool2 = tbx.toolsets[0].tools
+    tbx.toolsets[0].tools.remove(tool2)
+    tbx.add_script_tool(ScriptTool(name='Added'))
+    tool1.parameters[0].filter = FeatureClassTypeFilter(
+        [GeometryType.POLYGON])
+    new = tbx.save(tmp_path)
+
+    changeset = diff(old, new)
+    assert not changeset.is_empty
+    assert changeset.changes == {}
+    assert changeset.added_tools == ['Added']
+    assert changeset.removed_tools == ['Tool2']
+    first, second = changeset.modified_tools
+    assert first.name == 'Tool0'
+    assert first.changes == {}
+    assert first.added_parameters == ['extra']
+    assert first.removed_parameters == ['text']
+    count, = first.modified_parameters
+    assert count.name == 'count'
+    assert count.changes == {'domain.max': ('10', '20'), 'value': ('5', '7')}
+    assert second.name == 'Tool1'
+    features, count = second.modified_parameters
+    assert features.changes == {
+        'domain.geometrytype': (['Point'], ['Polygon'])}
+    assert diff(old, tbx).modified_tools[1] == second
+# End test_diff_changes function
+
+
+def test_diff_tool_level(tmp_path):
+    """
+    Test diff reports tool level changes and parameter order
+    """
+    old = _make_toolbox()
+    new = _make_toolbox()
+    tool = new.toolsets[0].tools.pop()
+    new.add_script_tool(tool)
+    tool.parameters.reverse()
+    new.tools[0]._label = 'Relabeled'
+    changeset = diff(old, new)
+    first, second = changeset.modified_tools
+    assert first.changes == {'displayname': ('Tool 0', 'Relabeled')}
+    assert second.changes == {
+        'params.order': (['features', 'count', 'text'],
+                         ['text', 'count', 'features']),
+        'toolset': ('Nested', '')}
+# End test_diff_tool_level function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Compress (Repack) Tests
+"""
+
+
+from shutil import copyfile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+from pytest import mark, raises
+
+from autobox import repack
+from autobox.archive import patch_archive
+from autobox.compress import CompressionPolicy
+from autobox.constant import ATBX
+
+
+@mark.parametrize('policy, types', [
+    (CompressionPolicy.KEEP, {ZIP_DEFLATED}),
+    (CompressionPolicy.STORE, {ZIP_STORED}),
+    ('deflate', {ZIP_DEFLATED}),
+    ('smallest', {ZIP_DEFLATED, ZIP_STORED}),
+])
+def test_repack(tmp_path, data_path, policy, types):
+    """
+    Test repack under each policy drops orphans and keeps member content
+    """
+    path = tmp_path.joinpath(f'toolsets_with_tools{ATBX}')
+    copyfile(data_path.joinpath(path.name), path)
+    with ZipFile(path) as zin:
+        original = {i.filename: zin.read(i) for i in zin.infolist()
+                    if not i.is_dir()}
+    patch_archive(path, members={
+        'Orphan.tool/tool.content': b'{}', 'stale.txt': b'stale'})
+    result = repack(path, policy=policy)
+    assert result.path == path
+    assert 'Orphan.tool/tool.content' in result.dropped
+    assert 'stale.txt' in result.dropped
+    with ZipFile(path) as zin:
+        assert zin.testzip() is None
+        assert {i.filename: zin.read(i) for i in zin.infolist()} == original
+        assert {i.compress_type for i in zin.infolist()} <= types
+    assert result.after == path.stat().st_size
+    assert list(tmp_path.iterdir()) == [path]
+# End test_repack function
+
+
+def test_repack_keep_orphans(tmp_path, data_path):
+    """
+    Test repack keeps orphans when asked and rejects invalid arguments
+    """
+    path = tmp_path.joinpath(f'basic{ATBX}')
+    copyfile(data_path.joinpath(path.name), path)
+    patch_archive(path, members={'stale.txt': b'stale'})
+    result = repack(path, policy='store', drop_orphans=False)
+    assert result.dropped == []
+    with ZipFile(path) as zin:
+        assert zin.read('stale.txt') == b'stale'
+    with raises(ValueError):
+        repack(path, policy='squash')
+    with raises(ValueError):
+        repack(path, level=10)
+    patch_archive(path, members={}, prefixes=['toolbox.content'])
+    with raises(ValueError):
+        repack(path)
+# End test_repack_keep_orphans function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
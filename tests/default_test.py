@@ -4,6 +4,9 @@ Test Default Value Classes
 """
 
 
+from copy import deepcopy
+from pickle import dumps, loads
+
 from pytest import mark, raises
 
 from autobox.default import (
@@ -253,5 +256,31 @@ def test_point_hash_support():
 # End test_point_hash_support function
 
 
+def test_default_immutable_and_interned():
+    """
+    Test default values are immutable and can be interned
+    """
+    extent = Extent(XDomain(0, 1), YDomain(2, 3), crs='WGS 1984')
+    with raises(AttributeError):
+        extent._crs = None
+    with raises(AttributeError):
+        del extent._x
+    with raises(AttributeError):
+        extent.other = 1
+    assert str(extent) == '0 2 1 3 WGS 1984'
+    assert str(extent) is str(extent)
+    assert loads(dumps(extent)) == extent
+    assert deepcopy(extent) is extent
+
+    value = LinearUnitValue.interned(1, LinearUnit.METERS)
+    assert LinearUnitValue.interned(1, LinearUnit.METERS) is value
+    assert LinearUnitValue(1, LinearUnit.METERS) is not value
+    other = LinearUnitValue.interned(1.0, LinearUnit.METERS)
+    assert other == value and other is not value
+    assert repr(other) == '1.0 Meters'
+    assert XDomain.interned(0, 1) is not YDomain.interned(0, 1)
+# End test_default_immutable_and_interned function
+
+
 if __name__ == '__main__':  # pragma: no cover
     pass
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Diagnostic Tests
+"""
+
+
+from pytest import raises
+
+from autobox import Diagnostic, ScriptTool, Toolbox, Toolset
+from autobox.diagnostic import (
+    collect, has_diagnostics, is_collecting, raise_or_collect, report, scope)
+from autobox.filter import LongValueFilter, StringValueFilter
+from autobox.parameter import BooleanParameter, FieldParameter, LongParameter
+
+
+def test_raise_or_collect():
+    """
+    Test raise_or_collect raises unless collecting
+    """
+    assert not is_collecting()
+    with raises(ValueError):
+        raise_or_collect(ValueError('bad'), location='a', rule='rule')
+    report('a', rule='rule', message='ignored')
+    assert not has_diagnostics()
+    with collect() as diagnostics:
+        assert is_collecting() and not has_diagnostics()
+        raise_or_collect(ValueError('bad'), location='a', rule='rule', value=1)
+        with scope('tool'):
+            report('param', rule='other', message='message')
+            report(None, rule='other', message='tool')
+        assert has_diagnostics()
+    assert not is_collecting()
+    assert diagnostics == [Diagnostic('a', 'rule', 'bad', 1),
+                           Diagnostic('tool.param', 'other', 'message'),
+                           Diagnostic('tool', 'other', 'tool')]
+# End test_raise_or_collect function
+
+
+def test_collect_constructors():
+    """
+    Test constructors keep going and record every problem when collecting
+    """
+    with collect() as diagnostics:
+        tbx = Toolbox(name='')
+        toolset = Toolset(name='')
+        tool = ScriptTool(name='')
+        count = LongParameter(label='Count', default_value='one',
+                              is_required='yes')
+        flag = BooleanParameter(label='Flag', default_value=None)
+        count.filter = StringValueFilter(['a', 1])
+        field = FieldParameter(label='Field')
+        field.dependency = count
+        LongValueFilter([1, 'two', float('nan')])
+    assert [d.rule for d in diagnostics] == [
+        'toolbox-name', 'toolbox-alias', 'toolset-name', 'tool-name',
+        'required-value', 'default-value', 'default-value', 'filter-value',
+        'filter-type', 'dependency-type', 'filter-value']
+    assert tbx.name == '' and toolset.name == '' and tool.name == ''
+    assert count.default_value is None and count.is_required is True
+    assert flag.default_value is None
+    assert count.filter is None and field.dependency is None
+    assert diagnostics[4].location == 'count'
+    assert diagnostics[4].value == 'yes'
+# End test_collect_constructors function
+
+
+def test_collect_save(tmp_path):
+    """
+    Test save keeps going and records repetitions when collecting, nothing
+    is written when a problem is recorded
+    """
+    tbx = Toolbox(name='collected')
+    tool = ScriptTool(name='Repeated')
+    tool.add_parameter(LongParameter(label='Count'))
+    tool.add_parameter(LongParameter(label='count'))
+    tbx.add_script_tool(tool)
+    tbx.add_script_tool(ScriptTool(name='repeated'))
+    with raises(ValueError):
+        tbx.save(tmp_path)
+    with collect() as diagnostics:
+        assert tbx.save(tmp_path, overwrite=True) is None
+        assert tbx.save(tmp_path, layout='directory') is None
+    assert not any(tmp_path.iterdir())
+    assert [(d.location, d.rule) for d in diagnostics] == [
+        ('', 'tool-repeat'), ('Repeated', 'parameter-repeat')] * 2
+
+    tbx = Toolbox(name='clean')
+    tbx.add_script_tool(ScriptTool(name='Tool'))
+    with collect() as diagnostics:
+        path = tbx.save(tmp_path)
+        folder = tbx.save(tmp_path, layout='directory')
+    assert not diagnostics and path.is_file()
+    assert folder.joinpath('toolbox.content').is_file()
+    with collect():
+        Toolbox(name='')
+        assert tbx.save(tmp_path, overwrite=True) is None
+    assert path.is_file()
+# End test_collect_save function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
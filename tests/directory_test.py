@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Directory Layout Tests
+"""
+
+
+from zipfile import ZipFile
+
+from pytest import raises
+
+from autobox import ScriptTool, Toolbox, Toolset, pack
+from autobox.constant import ATBX, DIRECTORY, TOOL_CONTENT, TOOLBOX_CONTENT
+from autobox.directory import sync_folder
+from autobox.parameter import LongParameter
+from autobox.writer import UPDATED_PATTERN
+
+
+def _make_toolbox(label: str = 'Beta') -> Toolbox:
+    """
+    Make Toolbox
+    """
+    tbx = Toolbox(name='exploded')
+    tbx.add_script_tool(ScriptTool(name='Alpha'))
+    toolset = Toolset(name='Group')
+    tool = ScriptTool(name='Beta', label=label)
+    tool.add_parameter(LongParameter(label='Count', default_value=1))
+    toolset.add_script_tool(tool)
+    tbx.add_toolset(toolset)
+    return tbx
+# End _make_toolbox function
+
+
+def _snapshot(folder):
+    """
+    Snapshot of the files in a folder
+    """
+    return {p.relative_to(folder).as_posix(): p.read_bytes()
+            for p in folder.rglob('*') if p.is_file()}
+# End _snapshot function
+
+
+def test_save_directory_and_pack(tmp_path):
+    """
+    Test save with the directory layout, only changed files are written
+    """
+    directory = _make_toolbox().save(tmp_path, layout=DIRECTORY)
+    assert directory == tmp_path.joinpath('exploded')
+    assert directory.joinpath(TOOLBOX_CONTENT).is_file()
+    assert directory.joinpath('Beta.tool', TOOL_CONTENT).is_file()
+    with raises(FileExistsError):
+        _make_toolbox().save(tmp_path, layout=DIRECTORY)
+    with raises(ValueError):
+        _make_toolbox().save(tmp_path, layout='exploded')
+
+    before = _snapshot(directory)
+    alpha = directory.joinpath('Alpha.tool', TOOL_CONTENT)
+    data = UPDATED_PATTERN.sub(
+        b'"updated": "2000-01-01 00:00:00"', alpha.read_bytes())
+    alpha.write_bytes(data)
+    _make_toolbox(label='Changed').save(
+        tmp_path, overwrite=True, layout=DIRECTORY)
+    after = _snapshot(directory)
+    assert after['Alpha.tool/tool.content'] == data
+    changed = {k for k in before if before[k] != after[k]}
+    assert changed == {'Alpha.tool/tool.content', 'Beta.tool/tool.content.rc'}
+
+    path = pack(directory)
+    assert path == tmp_path.joinpath(f'exploded{ATBX}')
+    with ZipFile(path) as zin:
+        assert {i.filename: zin.read(i) for i in zin.infolist()} == after
+    with raises(FileExistsError):
+        pack(directory)
+    with raises(FileNotFoundError):
+        pack(tmp_path)
+# End test_save_directory_and_pack function
+
+
+def test_sync_folder(tmp_path):
+    """
+    Test sync folder writes changed files and removes stale files
+    """
+    source = tmp_path.joinpath('source')
+    target = tmp_path.joinpath('target')
+    source.joinpath('a').mkdir(parents=True)
+    source.joinpath('a', 'one.txt').write_text('one')
+    source.joinpath('two.txt').write_text('two')
+    assert sync_folder(source, target) == ['a/one.txt', 'two.txt']
+    assert sync_folder(source, target) == []
+    source.joinpath('a', 'one.txt').unlink()
+    source.joinpath('two.txt').write_text('2')
+    assert sync_folder(source, target) == ['two.txt', 'a/one.txt']
+    assert not target.joinpath('a').exists()
+    assert target.joinpath('two.txt').read_text() == '2'
+# End test_sync_folder function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
@@ -3,8 +3,13 @@
 Filter Tests
 """
 
-from pytest import approx, mark
+from array import array
+from ctypes import c_double, c_int64, c_uint16
+from pathlib import Path
 
+from pytest import approx, mark, raises
+
+from autobox.diagnostic import collect
 from autobox.enum import (
     ArealUnit, FieldType, GeometryType, LinearUnit, TimeUnit,
     TravelModeUnitType, WorkspaceType)
@@ -267,6 +272,54 @@ def test_double_value_filter():
 # End test_double_value_filter function
 
 
+def test_number_value_filter_buffer():
+    """
+    Test Number Value Filters accept buffers and store arrays
+    """
+    ftr = LongValueFilter(array('q', [3, 1, 3, 2]))
+    assert ftr._values == array('q', [3, 1, 2])
+    assert ftr.values == (3, 1, 2)
+    assert ftr.values is not ftr.values and isinstance(ftr.values, tuple)
+    assert ftr.serialize()['domain']['items'][0]['value'] == '3'
+    assert LongValueFilter(array('d', [1.7, float('nan'), 2.0])).values == (1, 2)
+    assert LongValueFilter(memoryview(array('i', [5, 6]))[::-1]).values == (6, 5)
+    assert LongValueFilter(array('Q', [2 ** 64 - 1])).values == (2 ** 64 - 1,)
+    assert LongValueFilter([2 ** 70, 1])._values == (2 ** 70, 1)
+    assert LongValueFilter([1, 2])._values == array('q', [1, 2])
+
+    ftr = DoubleValueFilter(array('f', [0.5, 0.5, 1.5]))
+    assert ftr._values == array('d', [0.5, 1.5])
+    assert DoubleValueFilter(array('i', [1, 2])).values == (1.0, 2.0)
+    with collect() as diagnostics:
+        ftr = DoubleValueFilter(array('d', [1e308, 1e308, -1.0, 1e308]))
+    assert ftr.values == (1e308, -1.0) and not diagnostics
+    with collect() as diagnostics:
+        ftr = DoubleValueFilter(array('d', [1.0, float('inf')]))
+    assert ftr.values == (1.0,)
+    assert [d.rule for d in diagnostics] == ['filter-value']
+    assert DoubleValueFilter(b'abc').values == ()
+# End test_number_value_filter_buffer function
+
+
+def test_number_value_filter_byte_order():
+    """
+    Test Number Value Filters accept buffers with a byte order prefix
+    """
+    little = (c_int64.__ctype_le__ * 3)(3, 1, 3)
+    big = (c_int64.__ctype_be__ * 3)(3, 1, 3)
+    assert memoryview(little).format == '<q'
+    assert memoryview(big).format == '>q'
+    assert LongValueFilter(little).values == (3, 1)
+    assert LongValueFilter(big).values == (3, 1)
+    doubles = (c_double.__ctype_be__ * 2)(0.5, 1.5)
+    assert DoubleValueFilter(doubles).values == (0.5, 1.5)
+    assert DoubleValueFilter((c_uint16.__ctype_le__ * 2)(1, 2)).values == (
+        1.0, 2.0)
+    assert AbstractNumberValueFilter._as_native(
+        memoryview(b'abc'), order='<', code='d') is None
+# End test_number_value_filter_byte_order function
+
+
 def test_string_value_filter():
     """
     Test String Value Filter
@@ -291,6 +344,48 @@ def test_string_value_filter():
 # End test_string_value_filter function
 
 
+def test_filter_frozen_and_cached():
+    """
+    Test Filter is frozen and the serialized domain cached
+    """
+    ftr = LinearUnitFilter([LinearUnit.METERS, LinearUnit.INCHES])
+    assert ftr.values == (LinearUnit.METERS, LinearUnit.INCHES)
+    with raises(AttributeError):
+        ftr._values = ()
+    content = ftr.serialize()
+    assert ftr.serialize() is content
+    items = content['domain']['items']
+    assert items[0] is LinearUnitFilter._items[LinearUnit.METERS]
+    assert items[0] is LinearUnitFilter([LinearUnit.METERS]).serialize()[
+        'domain']['items'][0]
+    assert ArealUnitFilter._items[ArealUnit.ACRES_US]['type'] == 'GPArealUnit'
+
+    ftr = StringValueFilter(['A', 'B'])
+    content, resource = ftr.serialize('First')
+    assert ftr.serialize('first')[0] is content
+    other, _ = ftr.serialize('Second')
+    assert other['domain']['items'][0]['code'] == '$rc:second.domain.A'
+# End test_filter_frozen_and_cached function
+
+
+def test_string_value_filter_large():
+    """
+    Test String Value Filter with many values from an iterable
+    """
+    count = 20_000
+    values = (f'VALUE-{i % count:05d}' for i in range(count * 2))
+    ftr = StringValueFilter(values)
+    assert len(ftr.values) == count
+    content, resource = ftr.serialize('Codes')
+    items = content['domain']['items']
+    assert len(items) == len(resource) == count
+    assert items[-1] == {'value': 'VALUE-19999',
+                         'code': '$rc:codes.domain.VALUE-19999'}
+    assert StringValueFilter('A').values == ('A',)
+    assert StringValueFilter(['A', ['B'], 'A', 1]).values == ('A',)
+# End test_string_value_filter_large function
+
+
 @mark.parametrize('values, expected', [
     (None, {}),
     ({}, {}),
@@ -403,5 +498,28 @@ def test_string_value_filter_edge_cases():
 # End test_string_value_filter_edge_cases function
 
 
+@mark.parametrize('ftr, value, expected', [
+    (FieldTypeFilter([FieldType.TEXT]), 'anything', True),
+    (LongRangeFilter(1, 3), 2, True),
+    (LongRangeFilter(1, 3), 5, False),
+    (LongRangeFilter(1, 3), '2', False),
+    (DoubleRangeFilter(1, 1), 1, True),
+    (LongValueFilter([1, 2]), 2, True),
+    (LongValueFilter([1, 2]), 3, False),
+    (DoubleValueFilter([]), 3, True),
+    (StringValueFilter(['a', 'b']), 'b', True),
+    (StringValueFilter(['a', 'b']), 'c', False),
+    (FileTypeFilter(['CSV']), Path('table.csv'), True),
+    (FileTypeFilter(['csv']), Path('table.txt'), False),
+    (FileTypeFilter(['csv']), 'table.csv', False),
+])
+def test_filter_accepts(ftr, value, expected):
+    """
+    Test filter accepts values allowed by the filter
+    """
+    assert ftr.accepts(value) is expected
+# End test_filter_accepts function
+
+
 if __name__ == '__main__':  # pragma: no cover
     pass
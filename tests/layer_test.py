@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Layer File Tests
+"""
+
+
+from json import dumps, loads
+from os import utime
+
+from pytest import mark, raises
+
+from autobox import ScriptTool, Toolbox
+from autobox.enum import GeometryType
+from autobox.layer import clear_layer_cache, read_layer_file
+from autobox.parameter import FeatureClassParameter
+
+
+def test_read_layer_file(tmp_path, data_path):
+    """
+    Test layer files are parsed once and again when they change
+    """
+    clear_layer_cache()
+    info = read_layer_file(data_path / 'boxbox.lyrx')
+    assert info.layer_type == 'CIMFeatureLayer'
+    assert info.geometry_types == {GeometryType.POLYGON}
+    assert read_layer_file(data_path / 'boxbox.lyrx') is info
+
+    data = loads(data_path.joinpath('boxbox.lyrx').read_text())
+    definition, *_ = data['layerDefinitions']
+    definition['renderer'] = {'type': 'CIMSimpleRenderer', 'symbol': {
+        'type': 'CIMSymbolReference', 'symbol': {
+            'type': 'CIMPointSymbol', 'symbolLayers': [{
+                'type': 'CIMVectorMarker', 'markerGraphics': [{
+                    'type': 'CIMMarkerGraphic', 'symbol': {
+                        'type': 'CIMPolygonSymbol'}}]}]}}}
+    path = tmp_path / 'points.lyrx'
+    path.write_text(dumps(data))
+    info = read_layer_file(path)
+    assert info.geometry_types == {GeometryType.POINT, GeometryType.MULTIPOINT}
+
+    data['layers'] = ['CIMPATH=Map1/raster.json']
+    data['layerDefinitions'].append(
+        {'type': 'CIMRasterLayer', 'uRI': 'CIMPATH=Map1/raster.json'})
+    path.write_text(dumps(data, indent=2))
+    utime(path, ns=(1, 1))
+    info = read_layer_file(path)
+    assert info.layer_type == 'CIMRasterLayer'
+    assert not info.geometry_types
+
+    path.write_text('[]')
+    with raises(ValueError):
+        read_layer_file(path)
+    path.write_text('{')
+    with raises(ValueError):
+        read_layer_file(path)
+    with raises(FileNotFoundError):
+        read_layer_file(tmp_path / 'missing.lyrx')
+# End test_read_layer_file function
+
+
+@mark.parametrize('data', [
+    {'type': 'CIMLayerDocument'},
+    {'layerDefinitions': {}},
+    {'layerDefinitions': [1, 'two']},
+    {'layers': 'abc', 'layerDefinitions': [{'uRI': 'abc'}]},
+])
+def test_read_layer_file_truncated(tmp_path, data):
+    """
+    Test truncated layer files are reported as invalid
+    """
+    path = tmp_path / 'truncated.lyrx'
+    path.write_text(dumps(data))
+    with raises(ValueError):
+        read_layer_file(path)
+# End test_read_layer_file_truncated function
+
+
+def test_validate_truncated_layer_file(tmp_path, data_path):
+    """
+    Test deep validation reports a truncated layer file
+    """
+    text = data_path.joinpath('boxbox.lyrx').read_text()
+    path = tmp_path / 'truncated.lyrx'
+    path.write_text(text)
+    tbx = Toolbox(name='deep')
+    tool = ScriptTool(name='Styled')
+    features = FeatureClassParameter(label='Features', is_input=False)
+    features.symbology = path
+    tool.add_parameter(features)
+    tbx.add_script_tool(tool)
+    assert tbx.validate(tmp_path, deep=True).is_valid
+    path.write_text(dumps({'type': 'CIMLayerDocument', 'layerDefinitions': {
+        'type': 'CIMFeatureLayer'}}))
+    result = tbx.validate(tmp_path, deep=True)
+    assert [(d.location, d.rule) for d in result.diagnostics] == [
+        ('Styled.features', 'layer-file')]
+    path.write_text(text[:len(text) // 2])
+    result = tbx.validate(tmp_path, deep=True)
+    assert [(d.location, d.rule) for d in result.diagnostics] == [
+        ('Styled.features', 'layer-file')]
+# End test_validate_truncated_layer_file function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Lint Tests
+"""
+
+
+from json import dumps, loads
+from zipfile import ZipFile
+
+from autobox import ScriptTool, Toolbox
+from autobox.archive import patch_archive
+from autobox.constant import ATBX
+from autobox.filter import LongRangeFilter, StringValueFilter
+from autobox.lint import lint, lint_toolbox
+from autobox.parameter import (
+    FieldParameter, LongParameter, StringParameter, TableParameter)
+
+
+def _make_toolbox(tmp_path):
+    """
+    Make Toolbox
+    """
+    tbx = Toolbox(name='linted', alias='linted')
+    tool = ScriptTool(name='Tool')
+    table = TableParameter(label='Table')
+    field = FieldParameter(label='Field')
+    field.dependency = table
+    number = LongParameter(label='Number', default_value=5)
+    number.filter = LongRangeFilter(0, 10)
+    text = StringParameter(label='Text', is_multi=True, default_value=['a'])
+    text.filter = StringValueFilter(['a', 'b'])
+    for param in table, field, number, text:
+        tool.add_parameter(param)
+    tbx.add_script_tool(tool)
+    return tbx.save(tmp_path)
+# End _make_toolbox function
+
+
+def test_lint_clean(tmp_path, data_path):
+    """
+    Test lint reports no issues for valid toolboxes
+    """
+    _make_toolbox(tmp_path)
+    assert lint([tmp_path, data_path], jobs=2) == []
+# End test_lint_clean function
+
+
+def test_lint_issues(tmp_path):
+    """
+    Test lint reports issues for an invalid toolbox
+    """
+    path = _make_toolbox(tmp_path)
+    name = 'Tool.tool/tool.content'
+    with ZipFile(path) as zin:
+        content = loads(zin.read(name))
+    params = content['params']
+    params['field']['depends'] = ['number']
+    params['number']['value'] = 'five'
+    params['number']['domain'] = params['text']['domain']
+    params['text']['displayname'] = '$rc:missing.title'
+    params['Table'] = params.pop('table')
+    params['TABLE'] = params['Table']
+    params['1bad'] = {'datatype': {'type': 'GPNope'}}
+    patch_archive(path, members={name: dumps(content).encode()})
+    issues = lint_toolbox(path)
+    assert {(i.location, i.rule) for i in issues} == {
+        ('Tool', 'resource-missing'),
+        ('Tool', 'parameter-repeat'),
+        ('Tool.field', 'dependency-type'),
+        ('Tool.number', 'filter-type'),
+        ('Tool.number', 'default-value'),
+        ('Tool.1bad', 'parameter-name'),
+        ('Tool.1bad', 'data-type'),
+    }
+    assert all(i.path == str(path) for i in issues)
+
+    broken = tmp_path.joinpath(f'broken{ATBX}')
+    broken.write_bytes(b'not a zip')
+    issue, = lint_toolbox(broken)
+    assert issue.rule == 'archive'
+# End test_lint_issues function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
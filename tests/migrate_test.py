@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Migrate Tests
+"""
+
+
+from shutil import copyfile
+from zipfile import ZipFile
+
+from autobox import ToolMetadata
+from autobox.archive import read_raw
+from autobox.constant import ATBX, TOOL_CONTENT
+from autobox.migrate import migrate, migrate_toolbox
+from helpers import read_from_zip
+
+
+def test_migrate(tmp_path, data_path):
+    """
+    Test migrate rewrites only the tool content members
+    """
+    folder = tmp_path.joinpath('nested')
+    folder.mkdir()
+    for name in 'filter', 'toolsets_with_tools':
+        copyfile(data_path.joinpath(f'{name}{ATBX}'),
+                 folder.joinpath(f'{name}{ATBX}'))
+    path = folder.joinpath(f'filter{ATBX}')
+    with ZipFile(path) as zin:
+        original = {i.filename: (i.CRC, read_raw(zin, i))
+                    for i in zin.infolist()}
+
+    metadata = ToolMetadata(application_version='13.5', product='200')
+    assert migrate([tmp_path], metadata, jobs=2) == sorted(
+        folder.iterdir())
+    name = f'ScriptWithFilters.tool/{TOOL_CONTENT}'
+    content = read_from_zip(path, name=name, as_json=True)
+    assert content['app_ver'] == '13.5'
+    assert content['product'] == '200'
+    with ZipFile(path) as zin:
+        assert zin.testzip() is None
+        for info in zin.infolist():
+            if info.filename.endswith(TOOL_CONTENT):
+                continue
+            assert (info.CRC, read_raw(zin, info)) == original[info.filename]
+
+    assert migrate([tmp_path], metadata) == []
+    assert migrate_toolbox(path, {'app_ver': None, 'extra': 'value'})
+    content = read_from_zip(path, name=name, as_json=True)
+    assert 'app_ver' not in content
+    assert content['extra'] == 'value'
+# End test_migrate function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
@@ -16,6 +16,7 @@ from autobox.default import (
     XDomain, XYDomain,
     YDomain,
     ZDomain)
+from autobox.diagnostic import collect
 from autobox.enum import (
     ArealUnit, SACellSize, FieldType, GeometryType, LinearUnit, TimeUnit,
     WorkspaceType)
@@ -182,6 +183,29 @@ def test_parameter_derived_string():
 # End test_parameter_derived_string function
 
 
+def test_parameter_content_order():
+    """
+    Test Parameter content keys are written in order and class content shared
+    """
+    table = TableParameter(
+        label='Output Table', category='Tables', description='Output rows',
+        is_input=False, is_required=False, is_multi=True)
+    table.default_value = [Path.home() / 'rows.dbf']
+    content, resource = table.serialize({'Tables': 1}, target=None)
+    assert list(content) == [
+        'type', 'direction', 'displayname', 'category', 'datatype', 'schema',
+        'value', 'description']
+    assert list(resource) == ['output_table.descr', 'output_table.title']
+    assert content['datatype'] == {
+        'datatype': {'type': 'DETable'}, 'type': 'GPMultiValue'}
+    other = TableParameter(label='Other', is_input=False, is_multi=True)
+    other_content, _ = other.serialize({}, target=None)
+    assert other_content['datatype'] is content['datatype']
+    assert other_content['schema'] is content['schema']
+    assert FeatureClassParameter._schema['type'] != TableParameter._schema['type']
+# End test_parameter_content_order function
+
+
 def test_parameter_multi_string():
     """
     Test Parameter Multi String
@@ -719,6 +743,61 @@ def test_parameter_symbology(tmp_path, data_path):
 # End test_parameter_symbology function
 
 
+def test_parameter_check_symbology(tmp_path, data_path):
+    """
+    Test parameter symbology checked against the parsed layer file
+    """
+    lyr = data_path / 'boxbox.lyrx'
+    fc = FeatureClassParameter(label='Feature Class', is_input=False)
+    fc.check_symbology()
+    fc.symbology = lyr
+    fc.check_symbology()
+    fc.filter = FeatureClassTypeFilter([GeometryType.POLYGON])
+    fc.check_symbology()
+    fc.filter = FeatureClassTypeFilter([GeometryType.POINT])
+    with raises(TypeError):
+        fc.check_symbology()
+
+    raster = RasterDatasetParameter(label='Raster', is_input=False)
+    raster.symbology = lyr
+    with raises(TypeError):
+        raster.check_symbology()
+    text = StringParameter(label='Text', is_input=False)
+    text.symbology = lyr
+    text.check_symbology()
+
+    broken = tmp_path / 'broken.lyrx'
+    broken.write_text('{')
+    fc.symbology = broken
+    with collect() as diagnostics:
+        fc.check_symbology()
+        raster.check_symbology()
+    assert [(d.location, d.rule) for d in diagnostics] == [
+        ('feature_class', 'layer-file'), ('raster', 'layer-mismatch')]
+# End test_parameter_check_symbology function
+
+
+def test_parameter_check_default():
+    """
+    Test parameter default value checked against the filter
+    """
+    count = LongParameter(label='Count', default_value=5)
+    count.check_default()
+    count.filter = LongRangeFilter(1, 10)
+    count.check_default()
+    count.filter = LongRangeFilter(1, 3)
+    with raises(ValueError):
+        count.check_default()
+    text = StringParameter(label='Text', default_value=('a', 'c'),
+                           is_multi=True)
+    text.filter = StringValueFilter(['a', 'b'])
+    with collect() as diagnostics:
+        text.check_default()
+    assert [(d.location, d.rule) for d in diagnostics] == [
+        ('text', 'default-value')]
+# End test_parameter_check_default function
+
+
 def test_parameter_sans_dep_types_accepts_same():
     """
     Test that a parameter without dependency types accepts the same type
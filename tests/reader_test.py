@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Toolbox Reader Tests
+"""
+
+
+from pytest import mark, raises
+
+from autobox.constant import ATBX, ScriptToolContentKeys
+from autobox.reader import ToolboxReader
+from autobox.type import ToolEntry
+
+
+def test_reader_toolsets_with_tools(data_path):
+    """
+    Test reader on a toolbox with tools in the root and in toolsets
+    """
+    path = data_path.joinpath(f'toolsets_with_tools{ATBX}')
+    with ToolboxReader(path) as reader:
+        assert reader.name == 'toolsets_with_tools'
+        assert reader.label == 'toolsets_with_tools'
+        assert reader.alias == 'toolsetswithtools'
+        assert reader.tools == [
+            ToolEntry('ScriptInRoot', 'ScriptInRoot', ''),
+            ToolEntry('ScriptInToolsetA', 'ScriptInToolsetA', 'A'),
+            ToolEntry('ScriptInToolsetB', 'ScriptInToolsetB', 'B'),
+            ToolEntry('ScriptInToolsetC', 'ScriptInToolsetC', 'C'),
+            ToolEntry('ScriptInToolsetD', 'ScriptInToolsetD', 'C\\D'),
+        ]
+        content, resource = reader.read_tool('scriptinroot')
+        assert content[ScriptToolContentKeys.type] == 'ScriptTool'
+        assert resource['map']['title'] == 'Script in Root'
+        with raises(KeyError):
+            reader.read_tool('NotATool')
+    assert reader._zip is None
+# End test_reader_toolsets_with_tools function
+
+
+@mark.parametrize('name, count', [
+    ('empty', 0),
+    ('basic', 0),
+    ('parameters', 3),
+])
+def test_reader_tool_count(data_path, name, count):
+    """
+    Test reader tool count
+    """
+    with ToolboxReader(data_path.joinpath(f'{name}{ATBX}')) as reader:
+        assert len(reader.tools) == count
+        assert reader.read_json('not.a.member') == {}
+# End test_reader_tool_count function
+
+
+def test_reader_missing_file(tmp_path):
+    """
+    Test reader on a missing file
+    """
+    with raises(FileNotFoundError):
+        ToolboxReader(tmp_path.joinpath(f'missing{ATBX}'))
+# End test_reader_missing_file function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
@@ -13,10 +13,12 @@ from autobox.constant import (
     SCRIPT_STUB, ScriptToolContentKeys, TOOL_CONTENT, TOOL_CONTENT_RC,
     TOOL_ICON, TOOL_ILLUSTRATION, TOOL_SCRIPT_EXECUTE_LINK,
     TOOL_SCRIPT_EXECUTE_PY, TOOL_SCRIPT_VALIDATE_PY)
-from autobox.parameter import FeatureClassParameter
+from autobox.diagnostic import collect
+from autobox.parameter import (
+    FeatureClassParameter, LongParameter, StringParameter)
 from helpers import DATETIME_PATTERN, read_from_zip
 from autobox.script import ExecutionScript, ValidationScript
-from autobox.type import ToolAttributes
+from autobox.type import ToolAttributes, ToolMetadata
 
 
 @mark.parametrize('name, expected', [
@@ -63,6 +65,21 @@ def test_script_tool_bad_add():
 # End test_toolset_bad_add function
 
 
+def test_script_tool_add_parameters():
+    """
+    Test adding parameters in bulk
+    """
+    tool = ScriptTool(name='Bulk')
+    tool.add_parameters(LongParameter(label=f'Count {i}') for i in range(3))
+    assert [p.name for p in tool.parameters] == ['count_0', 'count_1', 'count_2']
+    with raises(TypeError):
+        tool.add_parameters([LongParameter(label='Other'), 1])
+    with raises(ValueError):
+        tool.add_parameters([LongParameter(label='COUNT 1')])
+    assert len(tool.parameters) == 3
+# End test_script_tool_add_parameters function
+
+
 def test_script_parameter_repetition():
     """
     Test script parameter repetition
@@ -129,6 +146,20 @@ def test_script_tool_serialize_root_simple(tmp_path, data_path):
 # End test_script_tool_serialize_root_simple function
 
 
+def test_script_tool_metadata(tmp_path):
+    """
+    Test Script Tool metadata is written to the content
+    """
+    tool = ScriptTool(name='Script')
+    assert tool.metadata == ToolMetadata()
+    tool.metadata = ToolMetadata(application_version='13.5', product='200')
+    script_folder = tool.serialize(tmp_path, tmp_path)
+    content = loads(script_folder.joinpath(TOOL_CONTENT).read_text())
+    assert content[ScriptToolContentKeys.application_version] == '13.5'
+    assert content[ScriptToolContentKeys.product] == '200'
+# End test_script_tool_metadata function
+
+
 def test_script_tool_serialize_root(tmp_path, data_path):
     """
     Test Script Tool Serialize
@@ -351,5 +382,92 @@ def test_script_images(data_path):
 # End test_script_images function
 
 
+def test_script_tool_content_cache(tmp_path):
+    """
+    Test Script Tool content is reused until the tool or a parameter changes
+    """
+    tool = ScriptTool(name='Cached')
+    parameter = LongParameter(label='Count', default_value=1)
+    tool.add_parameter(parameter)
+    first = tool._get_cached_bytes(tmp_path)
+    assert tool._get_cached_bytes(tmp_path) is first
+    assert tool._get_cached_bytes(tmp_path.parent) is not first
+
+    for change in (lambda: setattr(parameter, 'default_value', 2),
+                   lambda: setattr(parameter, 'category', 'Group'),
+                   lambda: setattr(parameter, 'description', 'Text'),
+                   lambda: setattr(parameter, 'is_enabled', False),
+                   lambda: tool.add_parameter(LongParameter(label='Other')),
+                   lambda: tool.parameters.reverse(),
+                   lambda: setattr(tool, 'metadata', ToolMetadata('13.5'))):
+        encoded = tool._get_cached_bytes(tmp_path)
+        change()
+        assert tool._get_cached_bytes(tmp_path) is not encoded
+    content, _ = tool._get_cached_content(tmp_path)
+    assert list(content[ScriptToolContentKeys.parameters]) == ['other', 'count']
+    assert content[ScriptToolContentKeys.application_version] == '13.5'
+
+    tool.add_parameter(LongParameter(label='count'))
+    with collect() as diagnostics:
+        tool._get_cached_bytes(tmp_path)
+        tool._get_cached_bytes(tmp_path)
+    assert [d.rule for d in diagnostics] == ['parameter-repeat'] * 2
+    with raises(ValueError):
+        tool._get_cached_bytes(tmp_path)
+# End test_script_tool_content_cache function
+
+
+def test_script_tool_clone(tmp_path):
+    """
+    Test Script Tool clone shares parameters until the clone is changed
+    """
+    template = ScriptTool(name='Template', description='Shared')
+    count = LongParameter(label='Count', default_value=1)
+    field = FeatureClassParameter(label='Features')
+    template.add_parameter(count)
+    template.add_parameter(field)
+    content, resource = template._get_cached_content(tmp_path)
+
+    tool = template.clone(name='Other Tool', summary='Summary')
+    assert tool.name == 'OtherTool' and tool.label == 'OtherTool'
+    assert tool.description == 'Shared' and template.summary is None
+    assert tool._parameters is not template._parameters
+    assert tool.parameters[0] is count
+    cloned, cloned_resource = tool._get_cached_content(tmp_path)
+    assert (cloned[ScriptToolContentKeys.parameters]['count'] is
+            content[ScriptToolContentKeys.parameters]['count'])
+    assert cloned_resource['map']['title'] == 'OtherTool'
+
+    count.default_value = 9
+    assert template.parameters[0] is count
+    assert tool.parameters[0].default_value == 9
+    tool.parameters.pop()
+    assert template.parameters == [count, field]
+
+    tool.add_parameter(StringParameter(label='Text'))
+    assert tool.parameters[0] is not count
+    assert tool.parameters[0].name == 'count'
+    tool.parameters[0].default_value = 2
+    count.default_value = 7
+    assert template.parameters[0] is count
+    assert (count.default_value, tool.parameters[0].default_value) == (7, 2)
+    assert [p.name for p in tool.parameters] == ['count', 'text']
+
+    other = template.clone(name='Another')
+    other.parameters = [field]
+    assert other.parameters[0] is field
+    other.add_parameter(LongParameter(label='Number'))
+    assert other.parameters[0] is field
+    assert template.parameters == [count, field]
+    with raises(TypeError):
+        other.parameters = [1]
+
+    labelled = ScriptTool(name='Labelled', label='A Label').clone('Copy')
+    assert labelled.label == 'A Label'
+    with raises(TypeError):
+        template.clone(name='Bad', unknown=1)
+# End test_script_tool_clone function
+
+
 if __name__ == '__main__':  # pragma: no cover
     pass
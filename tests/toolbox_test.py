@@ -4,12 +4,15 @@ Toolbox Class Tests
 """
 
 
+from pathlib import Path
 from shutil import copyfile
+from zipfile import ZipFile
 
 from pytest import approx, mark, raises
 
 from autobox.enum import (
     ArealUnit, FieldType, GeometryType, LinearUnit, WorkspaceType)
+from autobox.diagnostic import collect
 from autobox.filter import (
     ArealUnitFilter, DoubleRangeFilter, DoubleValueFilter,
     FeatureClassTypeFilter, FieldTypeFilter, FileTypeFilter, LinearUnitFilter,
@@ -29,6 +32,7 @@ from autobox.constant import (
     TOOL_SCRIPT_EXECUTE_PY, TOOL_SCRIPT_VALIDATE_PY)
 from autobox.toolset import Toolset
 from autobox.type import ToolAttributes
+from autobox.util import defer_paths
 
 
 @mark.parametrize('name, label, alias, description, compare_name', [
@@ -411,10 +415,31 @@ def test_toolbox_get_toolbox_path(tmp_path):
         tbx._get_toolbox_path(tmp_path, overwrite=False)
     assert path.is_file()
     tbx._get_toolbox_path(tmp_path, overwrite=True)
-    assert not path.is_file()
+    assert path.is_file()
 # End test_toolbox_get_toolbox_path function
 
 
+def test_toolbox_save_failure_keeps_existing(tmp_path):
+    """
+    Test a failed save leaves the existing toolbox in place
+    """
+    tbx = Toolbox(name='bob')
+    tbx.add_script_tool(ScriptTool(name='Kept'))
+    path = tbx.save(tmp_path)
+    data = path.read_bytes()
+    script = tmp_path.joinpath('script.py')
+    script.write_text('pass')
+    tool = ScriptTool(name='Broken')
+    tool.execution_script = ExecutionScript.from_file(script, embed=True)
+    tbx.add_script_tool(tool)
+    script.unlink()
+    with raises(OSError):
+        tbx.save(tmp_path, overwrite=True)
+    assert path.read_bytes() == data
+    assert list(tmp_path.iterdir()) == [path]
+# End test_toolbox_save_failure_keeps_existing function
+
+
 @mark.parametrize('name', [
     'example', None
 ])
@@ -721,5 +746,214 @@ def test_toolbox_script_repetition(tmp_path):
 # End test_toolbox_script_repetition function
 
 
+def test_toolbox_add_bulk():
+    """
+    Test adding tools and toolsets in bulk to a toolbox and a toolset
+    """
+    tbx = Toolbox(name='bulk')
+    tbx.add_script_tools(ScriptTool(name=f'Tool{i}') for i in range(3))
+    assert [t.name for t in tbx.tools] == ['Tool0', 'Tool1', 'Tool2']
+    with raises(TypeError):
+        tbx.add_script_tools([ScriptTool(name='Tool3'), 1])
+    with raises(ValueError):
+        tbx.add_script_tools([ScriptTool(name='tool1')])
+    assert len(tbx.tools) == 3
+
+    toolset = Toolset(name='Outer')
+    inner = [Toolset(name='A'), Toolset(name='B')]
+    toolset.add_toolsets(inner)
+    assert all(t.parent is toolset for t in toolset.toolsets)
+    assert inner[1].qualified_name == 'Outer\\B'
+    toolset.add_script_tools([ScriptTool(name='Nested')])
+    with raises(ValueError):
+        toolset.add_toolsets([Toolset(name='a')])
+    with raises(ValueError):
+        toolset.add_script_tools([ScriptTool(name='NESTED')])
+    with raises(TypeError):
+        toolset.add_toolsets([ScriptTool(name='Other')])
+    tbx.add_toolsets([toolset])
+    with raises(ValueError):
+        tbx.add_toolsets([Toolset(name='outer')])
+    with raises(ValueError):
+        tbx.add_script_tools([ScriptTool(name='nested')])
+    with collect() as diagnostics:
+        tbx.add_script_tools([ScriptTool(name='nested')])
+    assert [d.rule for d in diagnostics] == ['tool-repeat']
+    assert len(tbx.tools) == 4 and len(toolset.toolsets) == 2
+
+    assert toolset.toolbox is tbx and inner[0].toolbox is tbx
+
+    tbx = Toolbox(name='across')
+    tbx.add_script_tool(ScriptTool(name='Root'))
+    first, second = Toolset(name='First'), Toolset(name='Second')
+    nested = Toolset(name='Nested')
+    first.add_toolset(nested)
+    assert nested.toolbox is None
+    nested.add_script_tools([ScriptTool(name='Deep')])
+    tbx.add_toolsets([first, second])
+    assert nested.toolbox is tbx and second.toolbox is tbx
+    with raises(ValueError, match='Root; root'):
+        second.add_script_tools([ScriptTool(name='root')])
+    with raises(ValueError, match='DEEP; Deep'):
+        second.add_script_tools([ScriptTool(name='DEEP')])
+    second.add_script_tools([ScriptTool(name='Other')])
+    with raises(ValueError, match='OTHER; Other'):
+        nested.add_script_tools([ScriptTool(name='OTHER')])
+    assert [t.name for t in second.tools] == ['Other']
+    assert [t.name for t in nested.tools] == ['Deep']
+# End test_toolbox_add_bulk function
+
+
+def test_toolbox_merge(tmp_path):
+    """
+    Test merging toolboxes combines root tools and toolsets by name
+    """
+    tbx = Toolbox(name='first')
+    tbx.add_script_tool(ScriptTool(name='ATool'))
+    toolset = Toolset(name='Shared')
+    toolset.add_script_tool(ScriptTool(name='BTool'))
+    tbx.add_toolset(toolset)
+
+    other = Toolbox(name='second')
+    other.add_script_tool(ScriptTool(name='CTool'))
+    shared = Toolset(name='shared')
+    shared.add_script_tool(ScriptTool(name='DTool'))
+    nested = Toolset(name='Nested')
+    nested.add_script_tool(ScriptTool(name='ETool'))
+    shared.add_toolset(nested)
+    other.add_toolset(shared)
+    separate = Toolset(name='Separate')
+    separate.add_script_tool(ScriptTool(name='FTool'))
+    other.add_toolset(separate)
+
+    tbx.merge(other)
+    assert [t.name for t in tbx.tools] == ['ATool', 'CTool']
+    assert [t.name for t in tbx.toolsets] == ['Shared', 'Separate']
+    assert [t.name for t in toolset.tools] == ['BTool', 'DTool']
+    assert [t.name for t in toolset.toolsets] == ['Nested']
+    copied = toolset.toolsets[0]
+    assert copied is not nested and copied.parent is toolset
+    assert copied.tools == nested.tools and copied.tools is not nested.tools
+    assert tbx.toolsets[1] is not separate
+    assert other.toolsets == [shared, separate]
+    assert [t.name for t in shared.tools] == ['DTool']
+    assert shared.toolsets == [nested] and nested.parent is shared
+    assert separate.parent is None
+    tbx.toolsets[1].add_script_tool(ScriptTool(name='GTool'))
+    assert [t.name for t in separate.tools] == ['FTool']
+    path = tbx.save(tmp_path)
+    content = read_from_zip(path, name=TOOLBOX_CONTENT, as_json=True)
+    assert len(content['toolsets']) == 4
+
+    fourth = Toolbox(name='fourth')
+    fourth.add_script_tool(ScriptTool(name='atool'))
+    with raises(ValueError, match='ATool'):
+        Toolbox(name='third').merge(tbx, fourth)
+    with raises(TypeError):
+        tbx.merge('toolbox')
+# End test_toolbox_merge function
+
+
+def test_toolbox_validate(tmp_path, data_path):
+    """
+    Test Toolbox validate collects problems without writing anything
+    """
+    tbx = Toolbox(name='checked')
+    good = ScriptTool(name='Good')
+    good.add_parameter(LongParameter(label='Count', default_value=1))
+    tbx.add_script_tool(good)
+    good._get_cached_bytes(tmp_path)
+    cache, revision = good._cache, good._revision
+    result = tbx.validate(tmp_path)
+    assert result.is_valid
+    assert list(result.sizes) == ['Good']
+    assert good.execution_script is None
+    assert good._cache is cache and good._revision == revision
+    tbx.save(tmp_path)
+    with ZipFile(tmp_path.joinpath(f'checked{ATBX}')) as zin:
+        size = sum(i.file_size for i in zin.infolist()
+                   if i.filename.startswith('Good.tool/'))
+    assert result.sizes['Good'] == size
+    assert list(tmp_path.iterdir()) == [tmp_path.joinpath(f'checked{ATBX}')]
+
+    repeated = ScriptTool(name='Repeated')
+    repeated.add_parameter(LongParameter(label='Count'))
+    repeated.add_parameter(LongParameter(label='count'))
+    tbx.add_script_tool(repeated)
+    script = tmp_path.joinpath('script.py')
+    script.write_text('pass')
+    missing = ScriptTool(name='Missing')
+    missing.execution_script = ExecutionScript.from_file(script, embed=True)
+    count = LongParameter(label='Count', default_value=5)
+    count.filter = LongRangeFilter(1, 3)
+    missing.add_parameter(count)
+    script.unlink()
+    tbx.add_script_tool(missing)
+    toolset = Toolset(name='Group')
+    toolset.add_script_tool(ScriptTool(name='good'))
+    tbx.add_toolset(toolset)
+    tbx.add_toolset(Toolset(name='GROUP'))
+    result = tbx.validate(tmp_path)
+    assert not result.is_valid
+    assert [(d.location, d.rule) for d in result.diagnostics] == [
+        ('', 'tool-repeat'), ('', 'toolset-repeat'),
+        ('Repeated', 'parameter-repeat'), ('Missing', 'path-missing'),
+        ('Missing.count', 'default-value'), ('Missing', 'tool-content')]
+    assert set(result.sizes) == {'Good', 'Repeated', 'good'}
+
+    tbx = Toolbox(name='deep')
+    styled = ScriptTool(name='Styled')
+    raster = RasterDatasetParameter(label='Raster', is_input=False)
+    raster.symbology = data_path / 'boxbox.lyrx'
+    styled.add_parameter(raster)
+    tbx.add_script_tool(styled)
+    assert tbx.validate(tmp_path).is_valid
+    result = tbx.validate(tmp_path, deep=True)
+    assert [(d.location, d.rule) for d in result.diagnostics] == [
+        ('Styled.raster', 'layer-mismatch')]
+# End test_toolbox_validate function
+
+
+
+def test_toolbox_save_deferred_paths(tmp_path, monkeypatch):
+    """
+    Test Toolbox save checks paths deferred at assignment once
+    """
+    calls = []
+    check = Path.is_file
+
+    def counted(self):
+        calls.append(self)
+        return check(self)
+    monkeypatch.setattr(Path, 'is_file', counted)
+    scripts = [tmp_path.joinpath(f'script{i}.py') for i in range(4)]
+    for script in scripts:
+        script.write_text('pass')
+    tbx = Toolbox(name='deferred')
+    with defer_paths():
+        for i, script in enumerate(scripts):
+            tool = ScriptTool(name=f'Tool{i}')
+            tool.execution_script = ExecutionScript.from_file(
+                script, embed=True)
+            tbx.add_script_tool(tool)
+        assert not calls
+        tbx.save(tmp_path.joinpath('out'))
+    assert sorted(p for p in calls if p in scripts) == scripts
+
+    with raises(FileNotFoundError), defer_paths():
+        ExecutionScript.from_file(tmp_path.joinpath('missing.py'), True)
+    with collect() as diagnostics, defer_paths():
+        tool = ScriptTool(name='Missing')
+        tool.execution_script = ExecutionScript.from_file(
+            tmp_path.joinpath('missing.py'), embed=True)
+        tbx = Toolbox(name='missing')
+        tbx.add_script_tool(tool)
+        result = tbx.validate(tmp_path)
+    assert [(d.location, d.rule) for d in result.diagnostics][0] == (
+        'script', 'path-missing')
+    assert not diagnostics
+# End test_toolbox_save_deferred_paths function
+
+
 if __name__ == '__main__':  # pragma: no cover
     pass
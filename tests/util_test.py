@@ -7,13 +7,16 @@ Utility Tests
 from pathlib import Path
 from sys import platform
 
-from pytest import mark, param
+from pytest import mark, param, raises
+from autobox.diagnostic import collect
 from autobox.util import (
     _remove_leading_non_alpha, _validate_alpha_start_sans_special,
-    make_parameter_name, quote, resolve_layer_path, unique,
-    validate_parameter_label, validate_parameter_name,
-    validate_script_folder_name, validate_toolbox_name, validate_toolset_name,
-    wrap_markup)
+    cache_paths, check_paths, get_cached_bytes, is_file, make_parameter_name,
+    read_text, make_parameter_names, quote, resolve_layer_path,
+    unique, validate_parameter_label, validate_parameter_name,
+    validate_parameter_names, validate_script_folder_name,
+    validate_script_names, validate_toolbox_name, validate_toolbox_names,
+    validate_path, validate_toolset_name, validate_toolset_names, wrap_markup)
 
 
 @mark.parametrize('value, expected', [
@@ -212,6 +215,62 @@ def test_resolve_layer_path(layer, toolbox, expected):
 # End test_resolve_layer_path function
 
 
+def test_cache_paths(tmp_path, monkeypatch):
+    """
+    Test paths are resolved and checked once while cached
+    """
+    calls = []
+    resolve = Path.resolve
+
+    def counted(self, *args, **kwargs):
+        calls.append(self)
+        return resolve(self, *args, **kwargs)
+    monkeypatch.setattr(Path, 'resolve', counted)
+    layer = tmp_path.joinpath('styles', 'layer.lyrx')
+    layer.parent.mkdir()
+    layer.touch()
+    folder = tmp_path.joinpath('toolbox')
+    expected = resolve_layer_path(layer, folder)
+    calls.clear()
+    with cache_paths() as cache:
+        for _ in range(3):
+            assert resolve_layer_path(layer, folder) == expected
+        assert is_file(layer) and is_file(layer)
+        with cache_paths() as nested:
+            assert nested is cache
+            resolve_layer_path(layer, toolbox_folder=folder)
+    assert calls == [layer, folder]
+    layer.unlink()
+    assert not is_file(layer)
+    resolve_layer_path(layer, folder)
+    assert len(calls) == 4
+# End test_cache_paths function
+
+
+def test_check_paths(tmp_path):
+    """
+    Test paths are checked concurrently and read ahead into the cache
+    """
+    paths = [tmp_path.joinpath(f'{i}.py') for i in range(20)]
+    for path in paths[::2]:
+        path.write_bytes(b'a = 1\r\nb = 2\r')
+    expected = {p: i % 2 == 0 for i, p in enumerate(paths)}
+    assert check_paths([*paths, *paths]) == expected
+    assert check_paths(map(str, paths), jobs=1) == expected
+    assert get_cached_bytes(paths[0]) is None
+    with cache_paths():
+        assert check_paths(paths, read=True) == expected
+        assert get_cached_bytes(paths[0]) == b'a = 1\r\nb = 2\r'
+        assert get_cached_bytes(paths[1]) is None
+        paths[0].unlink()
+        assert is_file(paths[0])
+        assert read_text(paths[0]) == 'a = 1\nb = 2\n'
+        assert check_paths(paths[:2]) == {paths[0]: True, paths[1]: False}
+    assert not is_file(paths[0])
+    assert read_text(paths[2]) == paths[2].read_text()
+# End test_check_paths function
+
+
 @mark.parametrize('value, expected', [
     ('asdf', 'asdf'),
     ('as df', "'as df'"),
@@ -241,5 +300,47 @@ def test_unique(values, expected):
 # End test_unique function
 
 
+def test_validate_names():
+    """
+    Test the bulk name validators agree with the single name validators
+    """
+    values = [' 1Field: Name ', 'field name', 'Ünïcode²  x', None, '123',
+              'in|valid?', 'FIELD: NAME', 'Ünïcode² x', '<<>>', 'a' * 3]
+    for bulk, single in ((validate_toolbox_names, validate_toolbox_name),
+                         (validate_script_names,
+                          _validate_alpha_start_sans_special),
+                         (validate_toolset_names, validate_toolset_name),
+                         (validate_parameter_names, validate_parameter_name)):
+        result = bulk(values)
+        assert result.names == [single(v) for v in values]
+    result = validate_parameter_names(values)
+    assert result.names[:3] == ['Field Name', 'field name', 'Ünïcode² x']
+    assert result.collisions == {'field name': [0, 1, 6], 'ünïcode² x': [2, 7]}
+    result = make_parameter_names(['Field Name', 'field-name', 'Other', '1'])
+    assert result.names == ['field_name', 'field_name', 'other', None]
+    assert result.collisions == {'field_name': [0, 1]}
+    assert validate_script_names(iter([])) == ([], {})
+# End test_validate_names function
+
+
+def test_validate_path(tmp_path):
+    """
+    Test validate path raises or collects invalid and missing paths
+    """
+    path = tmp_path / 'script.py'
+    path.write_text('pass')
+    assert validate_path(path, text='script') == path.resolve()
+    with raises(ValueError):
+        validate_path(None, text='script')
+    with raises(FileNotFoundError):
+        validate_path(tmp_path / 'missing.py', text='script')
+    with collect() as diagnostics:
+        assert validate_path(None, text='script') is None
+        assert validate_path(tmp_path / 'missing.py', text='icon') is None
+    assert [(d.location, d.rule) for d in diagnostics] == [
+        ('script', 'path-missing'), ('icon', 'path-missing')]
+# End test_validate_path function
+
+
 if __name__ == '__main__':  # pragma: no cover
     pass
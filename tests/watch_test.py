@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Watch Mode Tests
+"""
+
+
+from shutil import copyfile
+from zipfile import ZipFile
+
+from autobox import ExecutionScript, ScriptTool, Toolbox
+from autobox.constant import (
+    ATBX, TOOL_CONTENT, TOOL_ICON, TOOL_SCRIPT_EXECUTE_PY)
+from autobox.parameter import FeatureClassParameter
+from autobox.watch import Watcher, referenced_files
+from helpers import read_from_zip
+
+
+def _make_toolbox(folder, data_path):
+    """
+    Make a toolbox with an embedded script, an icon, and a layer file
+    """
+    script = folder.joinpath('script.py')
+    script.write_text('print("first")')
+    icon = folder.joinpath('icon.png')
+    copyfile(data_path.joinpath('images', 'python_icon.png'), icon)
+    tool = ScriptTool(name='Watched')
+    tool.execution_script = ExecutionScript.from_file(script, embed=True)
+    tool.icon = icon
+    out = FeatureClassParameter(label='Output', is_input=False)
+    out.symbology = data_path.joinpath('boxbox.lyrx')
+    tool.add_parameter(out)
+    other = ScriptTool(name='Other')
+    tbx = Toolbox(name='watched')
+    tbx.add_script_tool(tool)
+    tbx.add_script_tool(other)
+    return tbx, tool, script
+# End _make_toolbox function
+
+
+def test_referenced_files(tmp_path, data_path):
+    """
+    Test referenced files of a tool
+    """
+    _, tool, script = _make_toolbox(tmp_path, data_path)
+    assert referenced_files(tool) == {
+        script.resolve(), tmp_path.joinpath('icon.png').resolve(),
+        data_path.joinpath('boxbox.lyrx').resolve()}
+    assert referenced_files(ScriptTool(name='Empty')) == set()
+# End test_referenced_files function
+
+
+def test_watcher_patch(tmp_path, data_path):
+    """
+    Test watcher rebuilds only the affected tool after debouncing
+    """
+    tbx, tool, script = _make_toolbox(tmp_path, data_path)
+    out = tmp_path.joinpath('out')
+    out.mkdir()
+    watcher = Watcher(load=lambda: [tbx], folder=out, debounce=0.25)
+    path, = watcher.build()
+    assert path == out.joinpath(f'watched{ATBX}')
+    assert len(watcher.files) == 3
+    name = f'Watched.tool/{TOOL_SCRIPT_EXECUTE_PY}'
+    other = read_from_zip(path, f'Other.tool/{TOOL_CONTENT}', as_json=False)
+    assert read_from_zip(path, name, as_json=False) == 'print("first")'
+
+    assert watcher.step(now=0.) == []
+    script.write_text('print("second, a burst of edits")')
+    assert watcher.step(now=1.) == []
+    script.write_text('print("third, settled")')
+    assert watcher.step(now=1.1) == []
+    assert watcher.step(now=1.2) == []
+    assert watcher.step(now=1.5) == [path]
+    assert read_from_zip(path, name, as_json=False) == 'print("third, settled")'
+    assert read_from_zip(
+        path, f'Other.tool/{TOOL_CONTENT}', as_json=False) == other
+    with ZipFile(path) as zin:
+        assert f'Watched.tool/{TOOL_ICON}.png' in zin.namelist()
+    assert watcher.step(now=2.) == []
+# End test_watcher_patch function
+
+
+def test_watcher_source_rebuild(tmp_path, data_path):
+    """
+    Test watcher does a full rebuild when a source changes
+    """
+    tbx, _, _ = _make_toolbox(tmp_path, data_path)
+    source = tmp_path.joinpath('spec.py')
+    source.write_text('# spec')
+    calls = []
+
+    def load():
+        calls.append(1)
+        return [tbx]
+
+    watcher = Watcher(load=load, folder=tmp_path, sources=[source], debounce=0)
+    watcher.build()
+    source.write_text('# spec, changed')
+    assert watcher.step(now=0.) == []
+    assert watcher.step(now=1.) == [tmp_path.joinpath(f'watched{ATBX}')]
+    assert len(calls) == 2
+# End test_watcher_source_rebuild function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Writer Tests
+"""
+
+
+from json import dumps, loads
+from zipfile import ZipFile
+
+from pytest import mark, raises
+
+from autobox import ScriptTool, Toolbox, Toolset
+from autobox.constant import (
+    TOOL_CONTENT, TOOL_ICON, TOOL_SCRIPT_EXECUTE_PY, TOOLBOX_CONTENT,
+    TOOLBOX_CONTENT_RC)
+from autobox.enum import FieldType, LinearUnit
+from autobox.parameter import LongParameter
+from autobox.writer import (
+    DirectoryWriter, MemoryWriter, NullWriter, ZipWriter, encode_json,
+    join_name)
+
+
+def _make_toolbox(data_path) -> Toolbox:
+    """
+    Make Toolbox
+    """
+    tbx = Toolbox(name='written')
+    tool = ScriptTool(name='Alpha')
+    tool.icon = data_path.joinpath('images', 'python_icon.png')
+    tool.add_parameter(LongParameter(label='Count', default_value=1))
+    tbx.add_script_tool(tool)
+    toolset = Toolset(name='Group')
+    toolset.add_script_tool(ScriptTool(name='Beta'))
+    tbx.add_toolset(toolset)
+    return tbx
+# End _make_toolbox function
+
+
+def test_join_name():
+    """
+    Test join_name
+    """
+    assert join_name('Alpha.tool', TOOL_CONTENT) == 'Alpha.tool/tool.content'
+    assert join_name('', TOOL_CONTENT) == TOOL_CONTENT
+# End test_join_name function
+
+
+@mark.parametrize('obj', [
+    'control \x00\x01\x1f\x7f \b\f\n\r\t end',
+    'quote " backslash \\ slash / separators \u2028\u2029',
+    'non-ascii é ü ß 漢字 Ωμέγα',
+    'astral \U0001f600 \U00010348 lone surrogate \ud800',
+    [0.0, -0.0, 0.1 + 0.2, 1e16, 1e-07, 123456789.123, 5e-324,
+     1.7976931348623157e308, -1.5, 2.0 ** 70],
+    [0, -1, 2 ** 63, -2 ** 64, 10 ** 30, True, False, None],
+    {'é': 1, '\n': 2, '': 3, 'z': 4, 'a': 5, 0.5: 6, -3: 7, False: 8},
+    {'values': [[[]], [{}], {'a': [{'b': []}]}], 'tuple': (1, ('two',))},
+    {LinearUnit.FEET: [LinearUnit.INCHES, FieldType.DOUBLE]},
+])
+def test_encode_json_parity(obj):
+    """
+    Test encode_json matches the standard library on escaping, non-ascii
+    text, float representation, number and container edge cases
+    """
+    assert encode_json(obj) == dumps(obj, indent=2).encode()
+    assert loads(encode_json(obj)) == loads(dumps(obj, indent=2))
+# End test_encode_json_parity function
+
+
+def test_encode_json():
+    """
+    Test encode_json matches the standard library with an indent of 2
+    """
+    obj = {'a': [1, 2.5, float('nan'), True, None, {}, [], ()],
+           'nested': {1: 'one', 2.0: [('x', -float('inf'))], None: False,
+                      True: {'deep': [{'value': 'é', 'code': '$rc:a.b'}]}},
+           'text': 'ü\n"\t\\', 'empty': ''}
+    assert encode_json(obj) == dumps(obj, indent=2).encode()
+    assert encode_json([]) == b'[]'
+    with raises(TypeError):
+        encode_json({'a': {1, 2}})
+    with raises(TypeError):
+        encode_json({(1, 2): 'a'})
+# End test_encode_json function
+
+
+def test_writers_agree(tmp_path, data_path):
+    """
+    Test the writers produce the same members
+    """
+    tbx = _make_toolbox(data_path)
+    memory = MemoryWriter()
+    with memory:
+        tbx._serialize(memory, target=tmp_path)
+    names = {TOOLBOX_CONTENT, TOOLBOX_CONTENT_RC,
+             f'Alpha.tool/{TOOL_CONTENT}', f'Alpha.tool/{TOOL_ICON}.png',
+             f'Alpha.tool/{TOOL_SCRIPT_EXECUTE_PY}', f'Beta.tool/{TOOL_CONTENT}'}
+    assert names <= set(memory.files)
+
+    null = NullWriter()
+    with null:
+        tbx._serialize(null, target=tmp_path)
+    assert set(null.sizes) == set(memory.files)
+    icon = f'Alpha.tool/{TOOL_ICON}.png'
+    assert null.sizes[icon] == len(memory.files[icon])
+
+    path = tmp_path.joinpath('written.atbx')
+    with ZipWriter(path) as writer:
+        memory.write_to(writer)
+    with ZipFile(path) as zin:
+        assert {n: zin.read(n) for n in zin.namelist()} == memory.files
+
+    folder = tmp_path.joinpath('folder')
+    with DirectoryWriter(folder) as writer:
+        memory.write_to(writer)
+    assert sorted(writer.changed) == sorted(memory.files)
+    assert folder.joinpath(icon).read_bytes() == memory.files[icon]
+# End test_writers_agree function
+
+
+def test_save_prefetch(tmp_path, data_path):
+    """
+    Test saving with referenced files read ahead writes the same members
+    """
+    tbx = _make_toolbox(data_path)
+    folders = tmp_path.joinpath('a'), tmp_path.joinpath('b')
+    for folder in folders:
+        folder.mkdir()
+    first = tbx.save(folders[0])
+    second = tbx.save(folders[1], prefetch=True)
+    with ZipFile(first) as zin, ZipFile(second) as other:
+        assert zin.namelist() == other.namelist()
+        icon = f'Alpha.tool/{TOOL_ICON}.png'
+        assert zin.read(icon) == other.read(icon)
+# End test_save_prefetch function
+
+
+def test_zip_writer_abort(tmp_path):
+    """
+    Test the zip writer leaves no archive behind on failure
+    """
+    path = tmp_path.joinpath('failed.atbx')
+    with raises(ValueError):
+        with ZipWriter(path) as writer:
+            writer.write_text('a.txt', 'a')
+            raise ValueError('failed')
+    assert not path.exists()
+    assert not list(tmp_path.iterdir())
+# End test_zip_writer_abort function
+
+
+def test_directory_writer_prune(tmp_path):
+    """
+    Test the directory writer only writes changes and prunes stale files
+    """
+    with DirectoryWriter(tmp_path) as writer:
+        writer.write_text('a/one.txt', 'one')
+        writer.write_text('two.txt', 'two')
+    assert writer.changed == ['a/one.txt', 'two.txt']
+    with DirectoryWriter(tmp_path, prune=True) as writer:
+        writer.write_text('two.txt', 'two')
+    assert writer.changed == ['a/one.txt']
+    assert not tmp_path.joinpath('a').exists()
+    assert tmp_path.joinpath('two.txt').read_text() == 'two'
+# End test_directory_writer_prune function
+
+
+if __name__ == '__main__':  # pragma: no cover
+    pass